@@ -0,0 +1,92 @@
+def _repeat(fragment, count):
+    return "\n".join(fragment.format(i=i) for i in range(count))
+
+
+def _tabs(count):
+    return (
+        '{% load component_tags %}{% component "Tabs" %}'
+        + _repeat('{{% component "Tab" title="Tab {i}" %}}Content {i}{{% endcomponent %}}', count)
+        + "{% endcomponent %}"
+    )
+
+
+def _slides(count):
+    return (
+        '{% load component_tags %}{% component "Carousel" %}'
+        + _repeat(
+            '{{% component "CarouselItem" %}}<img src="/img/{i}.jpg" alt="Slide {i}">'
+            "{{% endcomponent %}}",
+            count,
+        )
+        + "{% endcomponent %}"
+    )
+
+
+CASES = {
+    "Card.grid_50": (
+        '{% load component_tags %}{% component "Row" cols=3 %}'
+        + _repeat(
+            '{{% component "Col" %}}{{% component "Card" %}}'
+            '{{% component "CardHeader" %}}Card {i}{{% endcomponent %}}'
+            '{{% component "CardBody" %}}{{% component "CardTitle" %}}Title {i}{{% endcomponent %}}'
+            '{{% component "CardText" %}}Text {i}{{% endcomponent %}}{{% endcomponent %}}'
+            "{{% endcomponent %}}{{% endcomponent %}}",
+            50,
+        )
+        + "{% endcomponent %}"
+    ),
+    "ListGroup.items_200": (
+        '{% load component_tags %}{% component "ListGroup" %}'
+        + _repeat('{{% component "ListGroupItem" %}}Item {i}{{% endcomponent %}}', 200)
+        + "{% endcomponent %}"
+    ),
+    "Accordion.items_50": (
+        '{% load component_tags %}{% component "Accordion" %}'
+        + _repeat(
+            '{{% component "AccordionItem" %}}'
+            '{{% component "AccordionHeader" %}}Question {i}{{% endcomponent %}}'
+            '{{% component "AccordionBody" %}}Answer {i}{{% endcomponent %}}'
+            "{{% endcomponent %}}",
+            50,
+        )
+        + "{% endcomponent %}"
+    ),
+    "FormGroup.controls_50": (
+        '{% load component_tags %}{% component "Form" %}'
+        + _repeat(
+            '{{% component "FormGroup" control_id="field-{i}" attrs:class="mb-3" %}}'
+            '{{% component "FormLabel" %}}Field {i}{{% endcomponent %}}'
+            '{{% component "FormControl" name="field-{i}" / %}}'
+            '{{% component "FormText" %}}Help {i}{{% endcomponent %}}'
+            "{{% endcomponent %}}",
+            50,
+        )
+        + "{% endcomponent %}"
+    ),
+    "CardHeader.headers_100": (
+        "{% load component_tags %}"
+        + _repeat('{{% component "CardHeader" %}}Header {i}{{% endcomponent %}}', 100)
+    ),
+    "NavLink.links_100": (
+        "{% load component_tags %}"
+        + _repeat('{{% component "NavLink" href="/page/{i}/" %}}Page {i}{{% endcomponent %}}', 100)
+    ),
+    "FormControl.controls_100": (
+        "{% load component_tags %}"
+        + _repeat('{{% component "FormControl" name="field-{i}" placeholder="Field {i}" / %}}', 100)
+    ),
+    # Rendering the nav and panes in a single pass (88d66c7) measured, with
+    # `python -m benchmarks.run -k "^Tabs.tabs_(5|50|500)$" -n 30` on that commit and its parent:
+    #   Tabs.tabs_5      45 -> 149 ops/s,  230KB ->  74KB allocated
+    #   Tabs.tabs_50    4.5 ->  17 ops/s,  1.9MB -> 0.7MB allocated
+    #   Tabs.tabs_500   0.5 -> 2.4 ops/s, 10.1MB -> 4.0MB allocated
+    "Tabs.tabs_5": _tabs(5),
+    "Tabs.tabs_50": _tabs(50),
+    "Tabs.tabs_500": _tabs(500),
+    "Tabs.tabs_1000": _tabs(1000),
+    # Building the indicators and controls as strings (11596e1) measured, with
+    # `python -m benchmarks.run -k "^Carousel.slides_200$" -n 30` on that commit and its parent:
+    #   Carousel.slides_200   3.5 -> 6.5 ops/s, 4.1MB -> 2.3MB allocated
+    "Carousel.slides_200": _slides(200),
+    "Carousel.slides_1000": _slides(1000),
+}
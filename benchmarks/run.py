@@ -0,0 +1,261 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+TESTS_DIR = ROOT_DIR / "tests"
+
+sys.path.insert(0, str(ROOT_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.template import Context, Template  # noqa: E402
+
+from benchmarks.cases import CASES  # noqa: E402
+
+DEFAULT_ITERATIONS = 1000
+DEFAULT_WARMUP = 50
+DEFAULT_THRESHOLD = 10.0
+
+
+def get_component_name_from_test_file(test_file):
+    name = test_file.stem.replace("test_", "")
+    return "".join(word.capitalize() for word in name.split("_"))
+
+
+def extract_cases_from_test_file(test_file):
+    content = test_file.read_text()
+    component_name = get_component_name_from_test_file(test_file)
+    cases = {}
+
+    test_methods = re.findall(
+        r"def (test_\w+)\(self\):(.*?)(?=\n    def |\nclass |\Z)", content, re.DOTALL
+    )
+
+    for test_name, test_body in test_methods:
+        templates = re.findall(
+            r'template = Template\((?:"""|\'\'\')(.*?)(?:"""|\'\'\')\)', test_body, re.DOTALL
+        )
+        if templates:
+            cases[f"{component_name}.{test_name}"] = {
+                "component": component_name,
+                "template": templates[0],
+            }
+
+    return cases
+
+
+def collect_cases(pattern=None):
+    cases = {}
+    for test_file in sorted(TESTS_DIR.glob("test_*.py")):
+        cases.update(extract_cases_from_test_file(test_file))
+
+    for name, template_code in CASES.items():
+        cases[name] = {
+            "component": name.split(".")[0],
+            "template": template_code,
+        }
+
+    if pattern:
+        regex = re.compile(pattern)
+        cases = {name: case for name, case in cases.items() if regex.search(name)}
+
+    return cases
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def measure_allocations(template, samples=5):
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(samples):
+            # Garbage left over from the previous render would otherwise count towards the peak
+            gc.collect()
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            template.render(Context({}))
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return int(statistics.median(peaks))
+
+
+def bench_case(template_code, iterations, warmup):
+    template = Template(template_code)
+
+    for _ in range(warmup):
+        template.render(Context({}))
+
+    timings = []
+    perf_counter_ns = time.perf_counter_ns
+    for _ in range(iterations):
+        start = perf_counter_ns()
+        template.render(Context({}))
+        timings.append(perf_counter_ns() - start)
+
+    timings.sort()
+    total_ns = sum(timings)
+
+    return {
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / (total_ns / 1e9), 2),
+        "mean_us": round(total_ns / iterations / 1e3, 2),
+        "p50_us": round(percentile(timings, 50) / 1e3, 2),
+        "p99_us": round(percentile(timings, 99) / 1e3, 2),
+        "alloc_bytes": measure_allocations(template),
+    }
+
+
+def get_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_package_version(name):
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def run_benchmarks(args):
+    cases = collect_cases(args.filter)
+    results = {}
+
+    for name, case in cases.items():
+        try:
+            result = bench_case(case["template"], args.iterations, args.warmup)
+        except Exception as e:
+            print(f"  {name:60} SKIPPED ({e.__class__.__name__}: {e})", file=sys.stderr)
+            continue
+
+        results[name] = {"component": case["component"], **result}
+        print(
+            f"  {name:60} {result['ops_per_sec']:>12,.0f} ops/s"
+            f"  p50 {result['p50_us']:>9,.1f}us  p99 {result['p99_us']:>9,.1f}us"
+            f"  {result['alloc_bytes']:>10,} B",
+            file=sys.stderr,
+        )
+
+    report = {
+        "meta": {
+            "revision": get_revision(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "django_components": get_package_version("django-components"),
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+        print(f"\nWrote {len(results)} results to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        return compare_reports(baseline, report, args.threshold)
+
+    return 0
+
+
+def compare_reports(baseline, current, threshold):
+    regressions = []
+
+    for name, result in sorted(current["results"].items()):
+        base = baseline["results"].get(name)
+        if not base or not base["ops_per_sec"]:
+            continue
+
+        change = (result["ops_per_sec"] - base["ops_per_sec"]) / base["ops_per_sec"] * 100
+        marker = ""
+        if change < -threshold:
+            regressions.append(name)
+            marker = "  REGRESSION"
+
+        print(
+            f"  {name:60} {base['ops_per_sec']:>12,.0f} -> {result['ops_per_sec']:>12,.0f} ops/s"
+            f"  {change:>+7.1f}%{marker}",
+            file=sys.stderr,
+        )
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} case(s) regressed by more than {threshold}%",
+            file=sys.stderr,
+        )
+        return 1
+
+    print(f"\nNo regressions above {threshold}%", file=sys.stderr)
+    return 0
+
+
+def compare_files(args):
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    return compare_reports(baseline, current, args.threshold)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render every bootstrap5 component example under load."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks (default).")
+    compare_parser = subparsers.add_parser("compare", help="Compare two benchmark reports.")
+
+    for sub in (parser, run_parser):
+        sub.add_argument("-n", "--iterations", type=int, default=DEFAULT_ITERATIONS)
+        sub.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+        sub.add_argument("-k", "--filter", help="Only run cases whose name matches this regex.")
+        sub.add_argument("-o", "--output", help="Write the JSON report to this file.")
+        sub.add_argument("--compare", help="Baseline JSON report to check for regressions.")
+        sub.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return compare_files(args)
+    return run_benchmarks(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
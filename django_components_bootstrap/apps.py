@@ -12,254 +12,28 @@ class DjangoComponentsBootstrapConfig(AppConfig):
     name = "django_components_bootstrap"
 
     def ready(self):
-        if not get_setting("AUTO_REGISTER", True):
-            return
+        if get_setting("AUTO_REGISTER", True):
+            self.register_components()
+
+        warmup = get_setting("WARMUP_ON_READY", False)
+        if warmup:
+            from django_components_bootstrap.warmup import warmup_components
+
+            warmup_components(freeze=warmup == "preload")
 
+    def register_components(self):
         from django_components import registry
 
-        from django_components_bootstrap.components.bootstrap5 import (
-            Accordion,
-            AccordionBody,
-            AccordionButton,
-            AccordionHeader,
-            AccordionItem,
-            Alert,
-            AlertHeading,
-            AlertLink,
-            Badge,
-            Breadcrumb,
-            BreadcrumbItem,
-            Button,
-            ButtonGroup,
-            ButtonToolbar,
-            Card,
-            CardBody,
-            CardFooter,
-            CardGroup,
-            CardHeader,
-            CardImg,
-            CardImgOverlay,
-            CardLink,
-            CardSubtitle,
-            CardText,
-            CardTitle,
-            Carousel,
-            CarouselCaption,
-            CarouselIndicator,
-            CarouselItem,
-            CarouselRenderer,
-            CloseButton,
-            Col,
-            Collapse,
-            CollapseToggle,
-            Container,
-            Dropdown,
-            DropdownButton,
-            DropdownDivider,
-            DropdownHeader,
-            DropdownItem,
-            DropdownItemText,
-            DropdownMenu,
-            DropdownToggle,
-            Figure,
-            FigureCaption,
-            FigureImage,
-            FloatingLabel,
-            Form,
-            FormCheck,
-            FormCheckInput,
-            FormCheckLabel,
-            FormControl,
-            FormFloating,
-            FormGroup,
-            FormLabel,
-            FormRange,
-            FormSelect,
-            FormText,
-            FormTextarea,
-            Image,
-            InputGroup,
-            InputGroupCheckbox,
-            InputGroupRadio,
-            InputGroupText,
-            ListGroup,
-            ListGroupItem,
-            Modal,
-            ModalBody,
-            ModalFooter,
-            ModalHeader,
-            ModalTitle,
-            ModalToggle,
-            Nav,
-            Navbar,
-            NavbarBrand,
-            NavbarCollapse,
-            NavbarNav,
-            NavbarText,
-            NavbarToggler,
-            NavDropdown,
-            NavItem,
-            NavLink,
-            Offcanvas,
-            OffcanvasBody,
-            OffcanvasHeader,
-            OffcanvasTitle,
-            OffcanvasToggle,
-            PageLink,
-            Pagination,
-            PaginationEllipsis,
-            PaginationFirst,
-            PaginationItem,
-            PaginationLast,
-            PaginationNext,
-            PaginationPrev,
-            Placeholder,
-            PlaceholderButton,
-            Popover,
-            Progress,
-            ProgressBar,
-            ProgressStacked,
-            Row,
-            Spinner,
-            SplitButton,
-            Stack,
-            Tab,
-            TabContainer,
-            TabContent,
-            Table,
-            TabPane,
-            Tabs,
-            TabsRenderer,
-            Toast,
-            ToastBody,
-            ToastContainer,
-            ToastHeader,
-            ToggleButton,
-            ToggleButtonGroup,
-            Tooltip,
-        )
+        from django_components_bootstrap.registry import get_component_names, register_lazy
+
+        names = get_component_names(get_setting("INCLUDE"), get_setting("EXCLUDE", ()))
+
+        if get_setting("LAZY_REGISTER", False):
+            for name in names:
+                register_lazy(registry, name)
+            return
 
-        components = [
-            Accordion,
-            AccordionItem,
-            AccordionButton,
-            AccordionHeader,
-            AccordionBody,
-            Alert,
-            AlertLink,
-            AlertHeading,
-            Badge,
-            Breadcrumb,
-            BreadcrumbItem,
-            Button,
-            ButtonGroup,
-            ButtonToolbar,
-            Card,
-            CardHeader,
-            CardBody,
-            CardFooter,
-            CardTitle,
-            CardSubtitle,
-            CardText,
-            CardLink,
-            CardImg,
-            CardImgOverlay,
-            CardGroup,
-            Carousel,
-            CarouselRenderer,
-            CarouselItem,
-            CarouselCaption,
-            CarouselIndicator,
-            CloseButton,
-            Collapse,
-            CollapseToggle,
-            Dropdown,
-            DropdownToggle,
-            DropdownMenu,
-            DropdownItem,
-            DropdownDivider,
-            DropdownHeader,
-            DropdownItemText,
-            DropdownButton,
-            SplitButton,
-            Figure,
-            FigureImage,
-            FigureCaption,
-            Form,
-            FormGroup,
-            FormLabel,
-            FormControl,
-            FormTextarea,
-            FormSelect,
-            FormCheckInput,
-            FormCheckLabel,
-            FormCheck,
-            FormText,
-            FormFloating,
-            FormRange,
-            Image,
-            InputGroup,
-            InputGroupText,
-            InputGroupRadio,
-            InputGroupCheckbox,
-            FloatingLabel,
-            Container,
-            Row,
-            Col,
-            ListGroup,
-            ListGroupItem,
-            Modal,
-            ModalHeader,
-            ModalBody,
-            ModalFooter,
-            ModalTitle,
-            ModalToggle,
-            Nav,
-            NavItem,
-            NavLink,
-            NavDropdown,
-            Navbar,
-            NavbarBrand,
-            NavbarToggler,
-            NavbarCollapse,
-            NavbarNav,
-            NavbarText,
-            Offcanvas,
-            OffcanvasHeader,
-            OffcanvasBody,
-            OffcanvasTitle,
-            OffcanvasToggle,
-            Pagination,
-            PaginationItem,
-            PageLink,
-            PaginationFirst,
-            PaginationPrev,
-            PaginationNext,
-            PaginationLast,
-            PaginationEllipsis,
-            Placeholder,
-            PlaceholderButton,
-            Popover,
-            Progress,
-            ProgressStacked,
-            ProgressBar,
-            Spinner,
-            Stack,
-            Table,
-            TabContainer,
-            TabContent,
-            TabPane,
-            TabsRenderer,
-            Tabs,
-            Tab,
-            ToastContainer,
-            Toast,
-            ToastHeader,
-            ToastBody,
-            ToggleButtonGroup,
-            ToggleButton,
-            Tooltip,
-        ]
+        from django_components_bootstrap.components import bootstrap5
 
-        for component in components:
-            registry.register(component.__name__, component)
+        for name in names:
+            registry.register(name, getattr(bootstrap5, name))
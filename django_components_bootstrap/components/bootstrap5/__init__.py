@@ -1,229 +1,252 @@
-from .accordion import (
-    Accordion,
-    AccordionBody,
-    AccordionButton,
-    AccordionHeader,
-    AccordionItem,
-)
-from .alert import Alert, AlertHeading, AlertLink
-from .badge import Badge
-from .breadcrumb import Breadcrumb, BreadcrumbItem
-from .button import Button
-from .button_group import ButtonGroup, ButtonToolbar
-from .card import (
-    Card,
-    CardBody,
-    CardFooter,
-    CardGroup,
-    CardHeader,
-    CardImg,
-    CardImgOverlay,
-    CardLink,
-    CardSubtitle,
-    CardText,
-    CardTitle,
-)
-from .carousel import (
-    Carousel,
-    CarouselCaption,
-    CarouselIndicator,
-    CarouselItem,
-    CarouselRenderer,
-)
-from .close_button import CloseButton
-from .collapse import Collapse, CollapseToggle
-from .dropdown import (
-    Dropdown,
-    DropdownDivider,
-    DropdownHeader,
-    DropdownItem,
-    DropdownItemText,
-    DropdownMenu,
-    DropdownToggle,
-)
-from .dropdown_button import DropdownButton, SplitButton
-from .figure import Figure, FigureCaption, FigureImage
-from .form import (
-    Form,
-    FormCheck,
-    FormCheckInput,
-    FormCheckLabel,
-    FormControl,
-    FormFloating,
-    FormGroup,
-    FormLabel,
-    FormSelect,
-    FormText,
-    FormTextarea,
-)
-from .form_range import FormRange
-from .image import Image
-from .input_group import (
-    FloatingLabel,
-    InputGroup,
-    InputGroupCheckbox,
-    InputGroupRadio,
-    InputGroupText,
-)
-from .layout import Col, Container, Row
-from .list_group import ListGroup, ListGroupItem
-from .modal import Modal, ModalBody, ModalFooter, ModalHeader, ModalTitle, ModalToggle
-from .nav import Nav, NavItem, NavLink
-from .nav_dropdown import NavDropdown
-from .navbar import (
-    Navbar,
-    NavbarBrand,
-    NavbarCollapse,
-    NavbarNav,
-    NavbarText,
-    NavbarToggler,
-)
-from .offcanvas import (
-    Offcanvas,
-    OffcanvasBody,
-    OffcanvasHeader,
-    OffcanvasTitle,
-    OffcanvasToggle,
-)
-from .pagination import (
-    PageLink,
-    Pagination,
-    PaginationEllipsis,
-    PaginationFirst,
-    PaginationItem,
-    PaginationLast,
-    PaginationNext,
-    PaginationPrev,
-)
-from .placeholder import Placeholder, PlaceholderButton
-from .popover import Popover
-from .progress import Progress, ProgressBar, ProgressStacked
-from .spinner import Spinner
-from .stack import Stack
-from .table import Table
-from .tabs import Tab, TabContainer, TabContent, TabPane, Tabs, TabsRenderer
-from .toast import Toast, ToastBody, ToastContainer, ToastHeader
-from .toggle_button import ToggleButton, ToggleButtonGroup
-from .tooltip import Tooltip
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "Accordion",
-    "AccordionBody",
-    "AccordionButton",
-    "AccordionHeader",
-    "AccordionItem",
-    "Alert",
-    "AlertHeading",
-    "AlertLink",
-    "Badge",
-    "Breadcrumb",
-    "BreadcrumbItem",
-    "Button",
-    "ButtonGroup",
-    "ButtonToolbar",
-    "Card",
-    "CardBody",
-    "CardFooter",
-    "CardGroup",
-    "CardHeader",
-    "CardImg",
-    "CardImgOverlay",
-    "CardLink",
-    "CardSubtitle",
-    "CardText",
-    "CardTitle",
-    "Carousel",
-    "CarouselCaption",
-    "CarouselIndicator",
-    "CarouselItem",
-    "CarouselRenderer",
-    "CloseButton",
-    "Col",
-    "Collapse",
-    "CollapseToggle",
-    "Container",
-    "Dropdown",
-    "DropdownButton",
-    "DropdownDivider",
-    "DropdownHeader",
-    "DropdownItem",
-    "DropdownItemText",
-    "DropdownMenu",
-    "DropdownToggle",
-    "Figure",
-    "FigureCaption",
-    "FigureImage",
-    "FloatingLabel",
-    "Form",
-    "FormCheck",
-    "FormCheckInput",
-    "FormCheckLabel",
-    "FormControl",
-    "FormFloating",
-    "FormGroup",
-    "FormLabel",
-    "FormRange",
-    "FormSelect",
-    "FormText",
-    "FormTextarea",
-    "Image",
-    "InputGroup",
-    "InputGroupCheckbox",
-    "InputGroupRadio",
-    "InputGroupText",
-    "ListGroup",
-    "ListGroupItem",
-    "Modal",
-    "ModalBody",
-    "ModalFooter",
-    "ModalHeader",
-    "ModalTitle",
-    "ModalToggle",
-    "Nav",
-    "NavDropdown",
-    "NavItem",
-    "NavLink",
-    "Navbar",
-    "NavbarBrand",
-    "NavbarCollapse",
-    "NavbarNav",
-    "NavbarText",
-    "NavbarToggler",
-    "Offcanvas",
-    "OffcanvasBody",
-    "OffcanvasHeader",
-    "OffcanvasTitle",
-    "OffcanvasToggle",
-    "PageLink",
-    "Pagination",
-    "PaginationEllipsis",
-    "PaginationFirst",
-    "PaginationItem",
-    "PaginationLast",
-    "PaginationNext",
-    "PaginationPrev",
-    "Placeholder",
-    "PlaceholderButton",
-    "Popover",
-    "Progress",
-    "ProgressBar",
-    "ProgressStacked",
-    "Row",
-    "Spinner",
-    "SplitButton",
-    "Stack",
-    "Tab",
-    "TabContainer",
-    "TabContent",
-    "TabPane",
-    "Table",
-    "Tabs",
-    "TabsRenderer",
-    "Toast",
-    "ToastBody",
-    "ToastContainer",
-    "ToastHeader",
-    "ToggleButton",
-    "ToggleButtonGroup",
-    "Tooltip",
-]
+if TYPE_CHECKING:
+    from .accordion import (
+        Accordion,
+        AccordionBody,
+        AccordionButton,
+        AccordionHeader,
+        AccordionItem,
+    )
+    from .alert import Alert, AlertHeading, AlertLink
+    from .badge import Badge
+    from .breadcrumb import Breadcrumb, BreadcrumbItem
+    from .button import Button
+    from .button_group import ButtonGroup, ButtonToolbar
+    from .cached_fragment import CachedFragment
+    from .card import (
+        Card,
+        CardBody,
+        CardFooter,
+        CardGroup,
+        CardHeader,
+        CardImg,
+        CardImgOverlay,
+        CardLink,
+        CardSubtitle,
+        CardText,
+        CardTitle,
+    )
+    from .carousel import (
+        Carousel,
+        CarouselCaption,
+        CarouselIndicator,
+        CarouselItem,
+    )
+    from .close_button import CloseButton
+    from .collapse import Collapse, CollapseToggle
+    from .dropdown import (
+        Dropdown,
+        DropdownDivider,
+        DropdownHeader,
+        DropdownItem,
+        DropdownItemText,
+        DropdownMenu,
+        DropdownToggle,
+    )
+    from .dropdown_button import DropdownButton, SplitButton
+    from .figure import Figure, FigureCaption, FigureImage
+    from .form import (
+        BootstrapField,
+        BootstrapForm,
+        Form,
+        FormCheck,
+        FormCheckInput,
+        FormCheckLabel,
+        FormControl,
+        FormFloating,
+        FormGroup,
+        FormLabel,
+        FormSelect,
+        FormText,
+        FormTextarea,
+    )
+    from .form_range import FormRange
+    from .image import Image
+    from .input_group import (
+        FloatingLabel,
+        InputGroup,
+        InputGroupCheckbox,
+        InputGroupRadio,
+        InputGroupText,
+    )
+    from .layout import Col, Container, Row
+    from .lazy_fragment import LazyFragment
+    from .list_group import ListGroup, ListGroupItem
+    from .modal import Modal, ModalBody, ModalFooter, ModalHeader, ModalTitle, ModalToggle
+    from .nav import Nav, NavItem, NavLink
+    from .nav_dropdown import NavDropdown
+    from .navbar import (
+        Navbar,
+        NavbarBrand,
+        NavbarCollapse,
+        NavbarNav,
+        NavbarText,
+        NavbarToggler,
+    )
+    from .offcanvas import (
+        Offcanvas,
+        OffcanvasBody,
+        OffcanvasHeader,
+        OffcanvasTitle,
+        OffcanvasToggle,
+    )
+    from .pagination import (
+        CursorPagination,
+        PageLink,
+        Pagination,
+        PaginationEllipsis,
+        PaginationFirst,
+        PaginationItem,
+        PaginationLast,
+        PaginationNext,
+        PaginationPrev,
+        Paginator,
+    )
+    from .parallel import ParallelGroup
+    from .placeholder import Placeholder, PlaceholderButton
+    from .popover import Popover
+    from .progress import Progress, ProgressBar, ProgressStacked
+    from .spinner import Spinner
+    from .stack import Stack
+    from .table import DataTable, Table
+    from .tabs import Tab, TabContainer, TabContent, TabPane, Tabs
+    from .toast import Toast, ToastBody, ToastContainer, ToastHeader
+    from .toggle_button import ToggleButton, ToggleButtonGroup
+    from .tooltip import Tooltip
+
+# Submodules are imported on first attribute access so that importing this package (or
+# registering components lazily) does not pay for every component up front.
+_MODULES = {
+    "accordion": (
+        "Accordion",
+        "AccordionBody",
+        "AccordionButton",
+        "AccordionHeader",
+        "AccordionItem",
+    ),
+    "alert": ("Alert", "AlertHeading", "AlertLink"),
+    "badge": ("Badge",),
+    "breadcrumb": ("Breadcrumb", "BreadcrumbItem"),
+    "button": ("Button",),
+    "button_group": ("ButtonGroup", "ButtonToolbar"),
+    "cached_fragment": ("CachedFragment",),
+    "card": (
+        "Card",
+        "CardBody",
+        "CardFooter",
+        "CardGroup",
+        "CardHeader",
+        "CardImg",
+        "CardImgOverlay",
+        "CardLink",
+        "CardSubtitle",
+        "CardText",
+        "CardTitle",
+    ),
+    "carousel": (
+        "Carousel",
+        "CarouselCaption",
+        "CarouselIndicator",
+        "CarouselItem",
+    ),
+    "close_button": ("CloseButton",),
+    "collapse": ("Collapse", "CollapseToggle"),
+    "dropdown": (
+        "Dropdown",
+        "DropdownDivider",
+        "DropdownHeader",
+        "DropdownItem",
+        "DropdownItemText",
+        "DropdownMenu",
+        "DropdownToggle",
+    ),
+    "dropdown_button": ("DropdownButton", "SplitButton"),
+    "figure": ("Figure", "FigureCaption", "FigureImage"),
+    "form": (
+        "BootstrapField",
+        "BootstrapForm",
+        "Form",
+        "FormCheck",
+        "FormCheckInput",
+        "FormCheckLabel",
+        "FormControl",
+        "FormFloating",
+        "FormGroup",
+        "FormLabel",
+        "FormSelect",
+        "FormText",
+        "FormTextarea",
+    ),
+    "form_range": ("FormRange",),
+    "image": ("Image",),
+    "input_group": (
+        "FloatingLabel",
+        "InputGroup",
+        "InputGroupCheckbox",
+        "InputGroupRadio",
+        "InputGroupText",
+    ),
+    "layout": ("Col", "Container", "Row"),
+    "lazy_fragment": ("LazyFragment",),
+    "list_group": ("ListGroup", "ListGroupItem"),
+    "modal": ("Modal", "ModalBody", "ModalFooter", "ModalHeader", "ModalTitle", "ModalToggle"),
+    "nav": ("Nav", "NavItem", "NavLink"),
+    "nav_dropdown": ("NavDropdown",),
+    "navbar": (
+        "Navbar",
+        "NavbarBrand",
+        "NavbarCollapse",
+        "NavbarNav",
+        "NavbarText",
+        "NavbarToggler",
+    ),
+    "offcanvas": (
+        "Offcanvas",
+        "OffcanvasBody",
+        "OffcanvasHeader",
+        "OffcanvasTitle",
+        "OffcanvasToggle",
+    ),
+    "pagination": (
+        "CursorPagination",
+        "PageLink",
+        "Pagination",
+        "PaginationEllipsis",
+        "PaginationFirst",
+        "PaginationItem",
+        "PaginationLast",
+        "PaginationNext",
+        "PaginationPrev",
+        "Paginator",
+    ),
+    "parallel": ("ParallelGroup",),
+    "placeholder": ("Placeholder", "PlaceholderButton"),
+    "popover": ("Popover",),
+    "progress": ("Progress", "ProgressBar", "ProgressStacked"),
+    "spinner": ("Spinner",),
+    "stack": ("Stack",),
+    "table": ("DataTable", "Table"),
+    "tabs": ("Tab", "TabContainer", "TabContent", "TabPane", "Tabs"),
+    "toast": ("Toast", "ToastBody", "ToastContainer", "ToastHeader"),
+    "toggle_button": ("ToggleButton", "ToggleButtonGroup"),
+    "tooltip": ("Tooltip",),
+}
+
+COMPONENT_MODULES = {name: module for module, names in _MODULES.items() for name in names}
+
+__all__ = sorted(COMPONENT_MODULES)
+
+
+def __getattr__(name: str):
+    module = COMPONENT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *COMPONENT_MODULES])
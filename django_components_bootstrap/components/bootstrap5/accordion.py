@@ -1,8 +1,44 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
-
-class Accordion(Component):
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    ParentContext,
+    html_id,
+    inject,
+    provide,
+)
+from django_components_bootstrap.components.bootstrap5.streaming import StreamingMixin
+
+
+class AccordionContext(ParentContext):
+    __slots__ = ("accordion_id", "always_open")
+    key = "accordion"
+
+    def __init__(self, accordion_id: str, always_open: bool):
+        self.accordion_id = accordion_id
+        self.always_open = always_open
+
+
+class AccordionItemContext(ParentContext):
+    __slots__ = ("heading_id", "collapse_id", "is_open", "data_bs_parent", "always_open")
+    key = "accordion_item"
+
+    def __init__(
+        self,
+        heading_id: str,
+        collapse_id: str,
+        is_open: bool,
+        data_bs_parent: str,
+        always_open: bool,
+    ):
+        self.heading_id = heading_id
+        self.collapse_id = collapse_id
+        self.is_open = is_open
+        self.data_bs_parent = data_bs_parent
+        self.always_open = always_open
+
+
+class Accordion(StreamingMixin, Component):
     class Kwargs:
         flush: bool = False
         always_open: bool = False
@@ -12,7 +48,7 @@ class Accordion(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        accordion_id = (kwargs.attrs or {}).get("id") or f"accordion-{self.id}"
+        accordion_id = html_id(self, "accordion", kwargs.attrs)
 
         css_classes = ["accordion"]
         if kwargs.flush:
@@ -21,18 +57,16 @@ class Accordion(Component):
         return {
             "accordion_id": accordion_id,
             "css_class": " ".join(css_classes),
-            "always_open": kwargs.always_open,
             "attrs": kwargs.attrs,
+            **provide(AccordionContext(accordion_id, kwargs.always_open)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "accordion" accordion_id=accordion_id always_open=always_open %}
-            <div {% html_attrs attrs class=css_class defaults:id=accordion_id %}>
-                {% slot "default" / %}
-            </div>
-        {% endprovide %}
+        <div {% html_attrs attrs class=css_class defaults:id=accordion_id %}>
+            {% slot "default" / %}
+        </div>
     """
 
 
@@ -45,30 +79,28 @@ class AccordionItem(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        accordion = self.inject("accordion")
+        accordion = inject(self, AccordionContext)
 
-        item_id = (kwargs.attrs or {}).get("id") or f"accordion-item-{self.id}"
-        heading_id = f"{item_id}-heading"
-        collapse_id = f"{item_id}-collapse"
-        data_bs_parent = f"#{accordion.accordion_id}"
+        item_id = html_id(self, "accordion-item", kwargs.attrs)
+        item = AccordionItemContext(
+            heading_id=f"{item_id}-heading",
+            collapse_id=f"{item_id}-collapse",
+            is_open=kwargs.default_open,
+            data_bs_parent=f"#{accordion.accordion_id}",
+            always_open=accordion.always_open,
+        )
 
         return {
-            "heading_id": heading_id,
-            "collapse_id": collapse_id,
-            "is_open": kwargs.default_open,
-            "data_bs_parent": data_bs_parent,
-            "always_open": accordion.always_open,
             "attrs": kwargs.attrs,
+            **provide(item),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "accordion_item" heading_id=heading_id collapse_id=collapse_id is_open=is_open data_bs_parent=data_bs_parent always_open=always_open %}
-            <div {% html_attrs attrs class="accordion-item" %}>
-                {% slot "default" / %}
-            </div>
-        {% endprovide %}
+        <div {% html_attrs attrs class="accordion-item" %}>
+            {% slot "default" / %}
+        </div>
     """
 
 
@@ -81,7 +113,7 @@ class AccordionButton(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        accordion_item = self.inject("accordion_item")
+        accordion_item = inject(self, AccordionItemContext)
 
         classes = ["accordion-button"]
         if not accordion_item.is_open:
@@ -113,7 +145,7 @@ class AccordionHeader(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        accordion_item = self.inject("accordion_item")
+        accordion_item = inject(self, AccordionItemContext)
 
         return {
             "heading_id": accordion_item.heading_id,
@@ -140,7 +172,7 @@ class AccordionBody(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        accordion_item = self.inject("accordion_item")
+        accordion_item = inject(self, AccordionItemContext)
 
         collapse_classes = ["accordion-collapse", "collapse"]
         if accordion_item.is_open:
@@ -0,0 +1,58 @@
+import asyncio
+from inspect import isawaitable
+
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeString, mark_safe
+from django_components import Component, registry
+
+
+async def _resolve(value):
+    if isawaitable(value):
+        value = await value
+    if isinstance(value, (list, tuple)) and any(isawaitable(item) for item in value):
+        value = await asyncio.gather(*(_resolve(item) for item in value))
+    return value
+
+
+async def _resolve_values(values: dict | None) -> dict | None:
+    if not values:
+        return values
+    resolved = await asyncio.gather(*(_resolve(value) for value in values.values()))
+    return dict(zip(values, resolved, strict=True))
+
+
+def _slot_content(fill):
+    if isinstance(fill, (list, tuple)):
+        return mark_safe("".join(conditional_escape(item) for item in fill))
+    return fill
+
+
+async def arender(
+    component: str | type[Component],
+    kwargs: dict | None = None,
+    slots: dict | None = None,
+    *,
+    context: dict | None = None,
+    **render_kwargs,
+) -> SafeString:
+    """
+    Render a component from async code, without a thread hop.
+
+    Awaitables in `kwargs`, `context` and `slots` are awaited concurrently before the
+    component is rendered, e.g. other `arender()` calls or data fetching coroutines. A
+    slot fill may also be a list of strings and awaitables, which are joined.
+
+    The component itself is rendered synchronously in the event loop, so its inputs must
+    not need the database any more, e.g. querysets must be evaluated with `[x async for x
+    in qs]` first.
+    """
+    if isinstance(component, str):
+        component = registry.get(component)
+
+    kwargs, slots, context = await asyncio.gather(
+        _resolve_values(kwargs), _resolve_values(slots), _resolve_values(context)
+    )
+    if slots:
+        slots = {name: _slot_content(fill) for name, fill in slots.items()}
+
+    return component.render(kwargs=kwargs, slots=slots, context=context, **render_kwargs)
@@ -1,8 +1,33 @@
 from django.template import Context
+from django.utils.html import conditional_escape
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.classes import class_resolver
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    FastRenderMixin,
+    html_attrs,
+    render_slot,
+)
 
-class Badge(Component):
+
+@class_resolver("Badge")
+def _badge_classes(bg, text, pill):
+    css_classes = ["badge"]
+
+    if bg and not text:
+        css_classes.append(f"text-bg-{bg}")
+    elif bg:
+        css_classes.append(f"bg-{bg}")
+
+    if pill:
+        css_classes.append("rounded-pill")
+    if text:
+        css_classes.append(f"text-{text}")
+
+    return " ".join(css_classes)
+
+
+class Badge(FastRenderMixin, Component):
     class Kwargs:
         bg: str = "primary"
         text: str | None = None
@@ -14,21 +39,9 @@ class Badge(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        css_classes = ["badge"]
-
-        if kwargs.bg and not kwargs.text:
-            css_classes.append(f"text-bg-{kwargs.bg}")
-        elif kwargs.bg:
-            css_classes.append(f"bg-{kwargs.bg}")
-
-        if kwargs.pill:
-            css_classes.append("rounded-pill")
-        if kwargs.text:
-            css_classes.append(f"text-{kwargs.text}")
-
         return {
             "tag": kwargs.as_,
-            "css_class": " ".join(css_classes),
+            "css_class": _badge_classes(kwargs.bg, kwargs.text, kwargs.pill),
             "attrs": kwargs.attrs,
         }
 
@@ -39,3 +52,8 @@ class Badge(Component):
             {% slot "default" / %}
         </{{ tag }}>
     """
+
+    def render_fast(self, context: Context) -> str:
+        tag = conditional_escape(context["tag"])
+        attrs = html_attrs(context["attrs"], {"class": context["css_class"]})
+        return f" <{tag} {attrs}> {render_slot(context)} </{tag}> "
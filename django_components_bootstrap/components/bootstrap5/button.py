@@ -1,6 +1,7 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.classes import class_resolver
 from django_components_bootstrap.components.bootstrap5.types import (
     ButtonType,
     Size,
@@ -8,6 +9,26 @@ from django_components_bootstrap.components.bootstrap5.types import (
 )
 
 
+@class_resolver("Button")
+def _button_classes(variant, outline, size, active, disabled_link):
+    if variant == "link":
+        variant_class = "btn-link"
+    elif outline:
+        variant_class = f"btn-outline-{variant}"
+    else:
+        variant_class = f"btn-{variant}"
+
+    classes = ["btn", variant_class]
+    if size:
+        classes.append(f"btn-{size}")
+    if active:
+        classes.append("active")
+    if disabled_link:
+        classes.append("disabled")
+
+    return " ".join(classes)
+
+
 class Button(Component):
     class Kwargs:
         as_: str | None = None
@@ -35,22 +56,13 @@ class Button(Component):
             tag = "button"
             is_link = False
 
-        if kwargs.variant == "link":
-            variant_class = "btn-link"
-        elif kwargs.outline:
-            variant_class = f"btn-outline-{kwargs.variant}"
-        else:
-            variant_class = f"btn-{kwargs.variant}"
-
-        size_class = f"btn-{kwargs.size}" if kwargs.size else None
-
-        classes = ["btn", variant_class]
-        if size_class:
-            classes.append(size_class)
-        if kwargs.active:
-            classes.append("active")
-        if kwargs.disabled and is_link:
-            classes.append("disabled")
+        classes = _button_classes(
+            kwargs.variant,
+            kwargs.outline,
+            kwargs.size,
+            kwargs.active,
+            kwargs.disabled and is_link,
+        )
 
         button_type = kwargs.type if tag == "button" else None
         button_disabled = kwargs.disabled if tag == "button" else None
@@ -63,7 +75,7 @@ class Button(Component):
 
         return {
             "tag": tag,
-            "classes": " ".join(classes),
+            "classes": classes,
             "button_type": button_type,
             "button_disabled": button_disabled,
             "aria_pressed": aria_pressed,
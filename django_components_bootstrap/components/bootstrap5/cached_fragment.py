@@ -0,0 +1,73 @@
+import re
+from hashlib import md5
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.utils import make_template_fragment_key
+from django.template import Context
+from django_components import Component, SlotInput, types
+
+from django_components_bootstrap.components.bootstrap5.rendering import IdScope, provide
+
+# The attributes that django-components adds to the root elements of each rendered component.
+# They hold the ids of the render that filled the cache, so they are not cached.
+_COMPONENT_ID_ATTR = re.compile(r'\s+data-djc-id-\w+=""')
+
+
+def fragment_cache_key(key: str, vary_on: list | None = None) -> str:
+    """The cache key of a `CachedFragment`, e.g. to delete it from the cache."""
+    return make_template_fragment_key(f"django_components_bootstrap.{key}", vary_on)
+
+
+class CachedFragment(Component):
+    """
+    Caches its content in Django's cache under `key` and the `vary_on` values, like
+    Django's `{% cache %}` tag. On a cache hit, the content is not rendered at all.
+
+    Components inside the fragment get ids derived from the cache key instead of their
+    render id, so that the cached HTML is the same whichever request rendered it. The
+    `data-djc-id-*` attributes of the components are left out of the cached HTML.
+    """
+
+    class Kwargs:
+        key: str
+        vary_on: list | None = None
+        timeout: int | None = DEFAULT_TIMEOUT
+        version: int | None = None
+        using: str = DEFAULT_CACHE_ALIAS
+
+    class Slots:
+        default: SlotInput
+
+    class Cache:
+        enabled = True
+
+        def get_cache_key(self, args, kwargs, slots) -> str:
+            return fragment_cache_key(kwargs["key"], kwargs.get("vary_on"))
+
+        def get_entry(self, cache_key: str):
+            kwargs = self.component.raw_kwargs
+            return caches[kwargs.get("using", DEFAULT_CACHE_ALIAS)].get(
+                cache_key, version=kwargs.get("version")
+            )
+
+        def set_entry(self, cache_key: str, value) -> None:
+            kwargs = self.component.raw_kwargs
+            caches[kwargs.get("using", DEFAULT_CACHE_ALIAS)].set(
+                cache_key,
+                _COMPONENT_ID_ATTR.sub("", value),
+                timeout=kwargs.get("timeout", DEFAULT_TIMEOUT),
+                version=kwargs.get("version"),
+            )
+
+    def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
+        cache_key = fragment_cache_key(kwargs.key, kwargs.vary_on)
+        return provide(
+            IdScope(f"f{md5(cache_key.encode(), usedforsecurity=False).hexdigest()[:6]}-")
+        )
+
+    template: types.django_html = """
+        {% load component_tags %}
+
+        {% slot "default" / %}
+    """
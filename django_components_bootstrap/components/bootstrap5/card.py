@@ -1,6 +1,13 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.classes import class_resolver
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    AttrsRenderer,
+    FastRenderMixin,
+    html_attrs,
+    render_slot,
+)
 from django_components_bootstrap.components.bootstrap5.types import (
     Alignment,
     CardImgVariant,
@@ -8,6 +15,24 @@ from django_components_bootstrap.components.bootstrap5.types import (
 )
 
 
+@class_resolver("Card")
+def _card_classes(bg, text, border, text_align):
+    classes = ["card"]
+    if bg and not text:
+        classes.append(f"text-bg-{bg}")
+    elif bg:
+        classes.append(f"bg-{bg}")
+
+    if text:
+        classes.append(f"text-{text}")
+    if border:
+        classes.append(f"border-{border}")
+    if text_align:
+        classes.append(f"text-{text_align}")
+
+    return " ".join(classes)
+
+
 class Card(Component):
     class Kwargs:
         as_: str = "div"
@@ -22,22 +47,9 @@ class Card(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = ["card"]
-        if kwargs.bg and not kwargs.text:
-            classes.append(f"text-bg-{kwargs.bg}")
-        elif kwargs.bg:
-            classes.append(f"bg-{kwargs.bg}")
-
-        if kwargs.text:
-            classes.append(f"text-{kwargs.text}")
-        if kwargs.border:
-            classes.append(f"border-{kwargs.border}")
-        if kwargs.text_align:
-            classes.append(f"text-{kwargs.text_align}")
-
         return {
             "tag": kwargs.as_,
-            "classes": " ".join(classes),
+            "classes": _card_classes(kwargs.bg, kwargs.text, kwargs.border, kwargs.text_align),
             "body": kwargs.body,
             "attrs": kwargs.attrs,
         }
@@ -57,6 +69,9 @@ class Card(Component):
     """
 
 
+_CARD_HEADER_ATTRS = AttrsRenderer({"class": "card-header"})
+
+
 class CardHeader(Component):
     class Kwargs:
         attrs: dict | None = None
@@ -66,13 +81,13 @@ class CardHeader(Component):
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
         return {
-            "attrs": kwargs.attrs,
+            "attrs_html": _CARD_HEADER_ATTRS(kwargs.attrs),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        <div {% html_attrs attrs class="card-header" %}>
+        <div {{ attrs_html }}>
             {% slot "default" / %}
         </div>
     """
@@ -166,7 +181,7 @@ class CardSubtitle(Component):
     """
 
 
-class CardText(Component):
+class CardText(FastRenderMixin, Component):
     class Kwargs:
         attrs: dict | None = None
 
@@ -186,6 +201,10 @@ class CardText(Component):
         </p>
     """
 
+    def render_fast(self, context: Context) -> str:
+        attrs = html_attrs(context["attrs"], {"class": "card-text"})
+        return f" <p {attrs}> {render_slot(context)} </p> "
+
 
 class CardLink(Component):
     class Kwargs:
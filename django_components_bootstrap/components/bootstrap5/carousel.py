@@ -1,7 +1,15 @@
 from django.template import Context
-from django.utils.safestring import mark_safe
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeString, mark_safe
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    ParentContext,
+    html_attrs,
+    html_id,
+    inject,
+    provide,
+)
 from django_components_bootstrap.components.bootstrap5.types import (
     CarouselPause,
     CarouselRide,
@@ -9,7 +17,34 @@ from django_components_bootstrap.components.bootstrap5.types import (
 )
 
 
+class CarouselSlide:
+    """
+    A slide of a `Carousel`, collected from its `CarouselItem` children or `items`. The
+    carousel renders an indicator for each one.
+    """
+
+    __slots__ = ("active",)
+
+    def __init__(self, active: bool = False):
+        self.active = active
+
+
+class CarouselContext(ParentContext):
+    __slots__ = ("carousel_id", "items")
+    key = "carousel"
+
+    def __init__(self, carousel_id: str, items: list[CarouselSlide]):
+        self.carousel_id = carousel_id
+        self.items = items
+
+
 class Carousel(Component):
+    """
+    Slides can also be given as `items`, dicts with `content` and optionally `caption`,
+    `active`, `interval` and `attrs`, which render the same markup as `CarouselItem`s
+    without a component per slide. They come before any `CarouselItem` children.
+    """
+
     class Kwargs:
         fade: bool = False
         controls: bool = True
@@ -20,14 +55,16 @@ class Carousel(Component):
         pause: CarouselPause = "hover"
         touch: bool = True
         theme: ThemeVariant | None = None
+        items: list[dict] | None = None
         attrs: dict | None = None
 
     class Slots:
-        default: SlotInput
+        default: SlotInput | None = None
 
     def get_template_data(self, args, kwargs: Kwargs, slots, context: Context):
-        carousel_id = (kwargs.attrs or {}).get("id") or f"carousel-{self.id}"
-        items = []
+        carousel_id = html_id(self, "carousel", kwargs.attrs)
+        slides: list[CarouselSlide] = []
+        items_html = _render_carousel_items(kwargs.items, slides) if kwargs.items else ""
 
         return {
             "carousel_id": carousel_id,
@@ -41,113 +78,116 @@ class Carousel(Component):
             "touch": kwargs.touch,
             "theme": kwargs.theme,
             "attrs": kwargs.attrs,
-            "items": items,
+            "slides": slides,
+            "items_html": items_html,
+            **provide(CarouselContext(carousel_id, slides)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "carousel" carousel_id=carousel_id items=items %}
-            {% slot "default" required / %}
-        {% endprovide %}
+        {% slot "default" / %}
     """
 
     def on_render_after(self, context, template, content):
-        items: list[dict] = context["items"]
-
-        return CarouselRenderer.render(
-            kwargs={
-                "carousel_id": context["carousel_id"],
-                "fade": context["fade"],
-                "controls": context["controls"],
-                "indicators": context["indicators"],
-                "ride": context["ride"],
-                "interval": context["interval"],
-                "keyboard": context["keyboard"],
-                "pause": context["pause"],
-                "touch": context["touch"],
-                "theme": context["theme"],
-                "attrs": context["attrs"],
-                "items": items,
-            },
-            slots={"default": mark_safe(content)},
-            render_dependencies=False,
+        if content is None:
+            # Rendering failed, keep the error
+            return None
+        return _render_carousel(
+            context["carousel_id"],
+            context["fade"],
+            context["controls"],
+            context["indicators"],
+            context["ride"],
+            context["interval"],
+            context["keyboard"],
+            context["pause"],
+            context["touch"],
+            context["theme"],
+            context["attrs"],
+            context["slides"],
+            context["items_html"] + content,
         )
 
 
-class CarouselRenderer(Component):
-    class Kwargs:
-        carousel_id: str
-        fade: bool
-        controls: bool
-        indicators: bool
-        ride: CarouselRide
-        interval: int | None
-        keyboard: bool
-        pause: CarouselPause
-        touch: bool
-        theme: ThemeVariant | None
-        items: list[dict]
-        attrs: dict | None = None
-
-    class Slots:
-        default: SlotInput
-
-    def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = ["carousel", "slide"]
-        if kwargs.fade:
-            classes.append("carousel-fade")
-
-        data_bs_ride = "carousel" if kwargs.ride is True else kwargs.ride if kwargs.ride else None
-        data_bs_interval = kwargs.interval
-        data_bs_keyboard = "false" if not kwargs.keyboard else None
-        data_bs_pause = kwargs.pause if kwargs.pause != "hover" else None
-        data_bs_touch = "false" if not kwargs.touch else None
-        data_bs_theme = kwargs.theme
-
-        return {
-            "carousel_id": kwargs.carousel_id,
-            "classes": " ".join(classes),
-            "controls": kwargs.controls,
-            "show_indicators": kwargs.indicators,
-            "data_bs_ride": data_bs_ride,
-            "data_bs_interval": data_bs_interval,
-            "data_bs_keyboard": data_bs_keyboard,
-            "data_bs_pause": data_bs_pause,
-            "data_bs_touch": data_bs_touch,
-            "data_bs_theme": data_bs_theme,
-            "attrs": kwargs.attrs,
-            "items": kwargs.items,
-        }
-
-    template: types.django_html = """
-        {% load component_tags %}
+def _render_carousel_items(items: list[dict], slides: list[CarouselSlide]) -> SafeString:
+    # Same markup as a CarouselItem, with a CarouselCaption after the content
+    parts = []
+    for item in items:
+        active = item.get("active", False)
+        slides.append(CarouselSlide(active))
+        item_attrs = html_attrs(
+            item.get("attrs"),
+            {
+                "class": "carousel-item active" if active else "carousel-item",
+                "data-bs-interval": item.get("interval"),
+            },
+        )
+        caption = item.get("caption")
+        if caption is not None:
+            caption = f'<div class="carousel-caption">{conditional_escape(caption)}</div>'
+        parts.append(
+            f"<div {item_attrs}>{conditional_escape(item['content'])}{caption or ''}</div>"
+        )
+    return mark_safe("".join(parts))
+
+
+def _render_carousel(
+    carousel_id,
+    fade,
+    controls,
+    indicators,
+    ride,
+    interval,
+    keyboard,
+    pause,
+    touch,
+    theme,
+    attrs,
+    items,
+    content,
+) -> SafeString:
+    # Same markup as a CarouselIndicator per slide, with the indicators built as plain strings
+    root_attrs = html_attrs(
+        attrs,
+        {
+            "class": "carousel slide carousel-fade" if fade else "carousel slide",
+            "data-bs-ride": "carousel" if ride is True else ride if ride else None,
+            "data-bs-interval": interval,
+            "data-bs-keyboard": "false" if not keyboard else None,
+            "data-bs-pause": pause if pause != "hover" else None,
+            "data-bs-touch": "false" if not touch else None,
+            "data-bs-theme": theme,
+        },
+        {"id": carousel_id},
+    )
+    target = f"#{conditional_escape(carousel_id)}"
+    parts = [f"<div {root_attrs}>"]
+
+    if indicators:
+        parts.append('<div class="carousel-indicators">')
+        for index, item in enumerate(items):
+            active = ' class="active" aria-current="true"' if item.active else ""
+            parts.append(
+                f'<button aria-label="Slide {index + 1}" type="button" data-bs-target="{target}" '
+                f'data-bs-slide-to="{index}"{active}></button>'
+            )
+        parts.append("</div>")
+
+    parts.append(f'<div class="carousel-inner">{content}</div>')
+
+    if controls:
+        parts.append(
+            f'<button class="carousel-control-prev" type="button" data-bs-target="{target}" '
+            'data-bs-slide="prev"><span aria-hidden="true" class="carousel-control-prev-icon">'
+            '</span><span class="visually-hidden">Previous</span></button>'
+            f'<button class="carousel-control-next" type="button" data-bs-target="{target}" '
+            'data-bs-slide="next"><span aria-hidden="true" class="carousel-control-next-icon">'
+            '</span><span class="visually-hidden">Next</span></button>'
+        )
 
-        {% provide "carousel" carousel_id=carousel_id %}
-            <div {% html_attrs attrs defaults:id=carousel_id class=classes data-bs-ride=data_bs_ride data-bs-interval=data_bs_interval data-bs-keyboard=data_bs_keyboard data-bs-pause=data_bs_pause data-bs-touch=data_bs_touch data-bs-theme=data_bs_theme %}>
-                {% if show_indicators %}
-                    <div class="carousel-indicators">
-                        {% for item in items %}
-                            {% component "CarouselIndicator" slide_to=forloop.counter0 active=item.active / %}
-                        {% endfor %}
-                    </div>
-                {% endif %}
-            <div class="carousel-inner">
-                {% slot "default" required / %}
-            </div>
-            {% if controls %}
-                <button class="carousel-control-prev" type="button" data-bs-target="#{{ carousel_id }}" data-bs-slide="prev">
-                    <span {% html_attrs class="carousel-control-prev-icon" defaults:aria-hidden="true" %}></span>
-                    <span class="visually-hidden">Previous</span>
-                </button>
-                <button class="carousel-control-next" type="button" data-bs-target="#{{ carousel_id }}" data-bs-slide="next">
-                    <span {% html_attrs class="carousel-control-next-icon" defaults:aria-hidden="true" %}></span>
-                    <span class="visually-hidden">Next</span>
-                </button>
-            {% endif %}
-            </div>
-        {% endprovide %}
-    """
+    parts.append("</div>")
+    return mark_safe("".join(parts))
 
 
 class CarouselItem(Component):
@@ -160,7 +200,7 @@ class CarouselItem(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        carousel = self.inject("carousel")
+        carousel = inject(self, CarouselContext)
 
         classes = ["carousel-item"]
         if kwargs.active:
@@ -183,12 +223,8 @@ class CarouselItem(Component):
     """
 
     def on_render_after(self, context, template, content):
-        parent_items: list[dict] = context["parent_items"]
-        parent_items.append(
-            {
-                "active": context["active"],
-            }
-        )
+        parent_items: list[CarouselSlide] = context["parent_items"]
+        parent_items.append(CarouselSlide(context["active"]))
         return None
 
 
@@ -223,7 +259,7 @@ class CarouselIndicator(Component):
         default: SlotInput | None = None
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        carousel_data = self.inject("carousel", None)
+        carousel_data = inject(self, CarouselContext, None)
         carousel_id = carousel_data.carousel_id if carousel_data else ""
 
         classes = []
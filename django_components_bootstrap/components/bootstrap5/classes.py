@@ -0,0 +1,58 @@
+from collections.abc import Callable
+from functools import lru_cache, update_wrapper
+
+from django_components_bootstrap.apps import get_setting
+
+DEFAULT_CLASS_CACHE_SIZE = 256
+
+_resolvers: dict[str, "ClassResolver"] = {}
+
+
+class ClassResolver:
+    """
+    Bounded LRU cache around a pure function that computes CSS classes from
+    hashable kwargs. Unhashable inputs skip the cache.
+    """
+
+    def __init__(self, name: str, func: Callable):
+        self.name = name
+        self.func = func
+        self._cached = None
+        update_wrapper(self, func)
+
+    def __call__(self, *args):
+        cached = self._cached
+        if cached is None:
+            maxsize = get_setting("CLASS_CACHE_SIZE", DEFAULT_CLASS_CACHE_SIZE)
+            cached = self._cached = lru_cache(maxsize=maxsize, typed=True)(self.func)
+
+        try:
+            return cached(*args)
+        except TypeError:
+            return self.func(*args)
+
+    def cache_info(self) -> dict:
+        if self._cached is None:
+            return {"hits": 0, "misses": 0, "maxsize": None, "currsize": 0}
+        return self._cached.cache_info()._asdict()
+
+    def cache_clear(self) -> None:
+        self._cached = None
+
+
+def class_resolver(name: str) -> Callable[[Callable], ClassResolver]:
+    def decorator(func: Callable) -> ClassResolver:
+        resolver = ClassResolver(name, func)
+        _resolvers[name] = resolver
+        return resolver
+
+    return decorator
+
+
+def class_cache_info() -> dict[str, dict]:
+    return {name: resolver.cache_info() for name, resolver in sorted(_resolvers.items())}
+
+
+def clear_class_caches() -> None:
+    for resolver in _resolvers.values():
+        resolver.cache_clear()
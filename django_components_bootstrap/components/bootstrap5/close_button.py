@@ -1,8 +1,10 @@
 from django.template import Context
 from django_components import Component, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import FastRenderMixin, html_attrs
 
-class CloseButton(Component):
+
+class CloseButton(FastRenderMixin, Component):
     class Kwargs:
         variant: str | None = None
         disabled: bool = False
@@ -29,3 +31,11 @@ class CloseButton(Component):
 
         <button {% html_attrs attrs type="button" class=classes defaults:aria-label="Close" disabled=disabled %}></button>
     """
+
+    def render_fast(self, context: Context) -> str:
+        attrs = html_attrs(
+            context["attrs"],
+            {"type": "button", "class": context["classes"], "disabled": context["disabled"]},
+            defaults={"aria-label": "Close"},
+        )
+        return f" <button {attrs}></button> "
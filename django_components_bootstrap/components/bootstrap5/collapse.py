@@ -1,9 +1,23 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    ParentContext,
+    html_id,
+    inject,
+    provide,
+)
 from django_components_bootstrap.components.bootstrap5.types import ButtonTag
 
 
+class CollapseContext(ParentContext):
+    __slots__ = ("collapse_id",)
+    key = "collapse"
+
+    def __init__(self, collapse_id: str):
+        self.collapse_id = collapse_id
+
+
 class Collapse(Component):
     class Kwargs:
         show: bool = False
@@ -15,7 +29,7 @@ class Collapse(Component):
         toggle: SlotInput = None
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        collapse_id = (kwargs.attrs or {}).get("id") or f"collapse-{self.id}"
+        collapse_id = html_id(self, "collapse", kwargs.attrs)
 
         classes = ["collapse"]
         if kwargs.horizontal:
@@ -27,17 +41,16 @@ class Collapse(Component):
             "collapse_id": collapse_id,
             "classes": " ".join(classes),
             "attrs": kwargs.attrs,
+            **provide(CollapseContext(collapse_id)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "collapse" collapse_id=collapse_id %}
-            {% slot "toggle" / %}
-            <div {% html_attrs attrs defaults:id=collapse_id class=classes %}>
-                {% slot "default" / %}
-            </div>
-        {% endprovide %}
+        {% slot "toggle" / %}
+        <div {% html_attrs attrs defaults:id=collapse_id class=classes %}>
+            {% slot "default" / %}
+        </div>
     """
 
 
@@ -52,7 +65,7 @@ class CollapseToggle(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        collapse = self.inject("collapse")
+        collapse = inject(self, CollapseContext)
         target_id = collapse.collapse_id
 
         button_type = "button" if kwargs.as_ == "button" else None
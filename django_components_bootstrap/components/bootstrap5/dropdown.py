@@ -1,6 +1,13 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    FastRenderMixin,
+    ParentContext,
+    html_attrs,
+    html_id,
+    provide,
+)
 from django_components_bootstrap.components.bootstrap5.types import (
     AlignmentStartEnd,
     AnchorOrButton,
@@ -13,6 +20,18 @@ from django_components_bootstrap.components.bootstrap5.types import (
 )
 
 
+class DropdownContext(ParentContext):
+    __slots__ = ("dropdown_id", "direction", "auto_close")
+    key = "dropdown"
+
+    def __init__(
+        self, dropdown_id: str, direction: DropdownDirection, auto_close: AutoClose | None
+    ):
+        self.dropdown_id = dropdown_id
+        self.direction = direction
+        self.auto_close = auto_close
+
+
 class Dropdown(Component):
     class Kwargs:
         direction: DropdownDirection = "down"
@@ -24,7 +43,7 @@ class Dropdown(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        dropdown_id = (kwargs.attrs or {}).get("id") or f"dropdown-{self.id}"
+        dropdown_id = html_id(self, "dropdown", kwargs.attrs)
 
         if kwargs.centered:
             if kwargs.direction == "up":
@@ -42,21 +61,18 @@ class Dropdown(Component):
                 wrapper_class = "dropdown"
 
         return {
-            "dropdown_id": dropdown_id,
             "wrapper_class": wrapper_class,
             "auto_close": kwargs.auto_close,
-            "direction": kwargs.direction,
             "attrs": kwargs.attrs,
+            **provide(DropdownContext(dropdown_id, kwargs.direction, kwargs.auto_close)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "dropdown" dropdown_id=dropdown_id direction=direction auto_close=auto_close %}
-            <div {% html_attrs attrs class=wrapper_class %} {% if auto_close %}data-bs-auto-close="{{ auto_close }}"{% endif %}>
-                {% slot "default" / %}
-            </div>
-        {% endprovide %}
+        <div {% html_attrs attrs class=wrapper_class %} {% if auto_close %}data-bs-auto-close="{{ auto_close }}"{% endif %}>
+            {% slot "default" / %}
+        </div>
     """
 
 
@@ -200,7 +216,7 @@ class DropdownItem(Component):
     """
 
 
-class DropdownDivider(Component):
+class DropdownDivider(FastRenderMixin, Component):
     class Kwargs:
         attrs: dict | None = None
 
@@ -215,6 +231,10 @@ class DropdownDivider(Component):
         <li><hr {% html_attrs attrs class="dropdown-divider" %}></li>
     """
 
+    def render_fast(self, context: Context) -> str:
+        attrs = html_attrs(context["attrs"], {"class": "dropdown-divider"})
+        return f" <li><hr {attrs}></li> "
+
 
 class DropdownHeader(Component):
     class Kwargs:
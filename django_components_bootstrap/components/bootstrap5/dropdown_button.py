@@ -1,6 +1,7 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import html_id
 from django_components_bootstrap.components.bootstrap5.types import AutoClose, Size, VariantWithLink
 
 
@@ -20,7 +21,7 @@ class DropdownButton(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        dropdown_id = (kwargs.attrs or {}).get("id") or f"dropdown-button-{self.id}"
+        dropdown_id = html_id(self, "dropdown-button", kwargs.attrs)
 
         return {
             "dropdown_id": dropdown_id,
@@ -68,7 +69,7 @@ class SplitButton(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        dropdown_id = (kwargs.attrs or {}).get("id") or f"split-button-{self.id}"
+        dropdown_id = html_id(self, "split-button", kwargs.attrs)
 
         return {
             "dropdown_id": dropdown_id,
@@ -1,8 +1,24 @@
-from typing import Literal
+from collections.abc import Callable
+from typing import Literal, NamedTuple
+from weakref import WeakKeyDictionary
 
+from django.forms import BaseForm, BoundField, Field
 from django.template import Context
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+from django.utils.translation import gettext as _
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    DYNAMIC,
+    AttrsRenderer,
+    ParentContext,
+    html_attrs,
+    html_id,
+    inject,
+    provide,
+)
 from django_components_bootstrap.components.bootstrap5.types import (
     NOT_PROVIDED,
     FormCheckType,
@@ -37,6 +53,14 @@ class Form(Component):
     """
 
 
+class FormGroupContext(ParentContext):
+    __slots__ = ("control_id",)
+    key = "formgroup"
+
+    def __init__(self, control_id: str | None):
+        self.control_id = control_id
+
+
 class FormGroup(Component):
     class Kwargs:
         control_id: str | None = None
@@ -49,18 +73,16 @@ class FormGroup(Component):
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
         return {
             "tag": kwargs.as_,
-            "control_id": kwargs.control_id,
             "attrs": kwargs.attrs or {},
+            **provide(FormGroupContext(kwargs.control_id)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "formgroup" control_id=control_id %}
-            <{{ tag }} {% html_attrs attrs %}>
-                {% slot "default" / %}
-            </{{ tag }}>
-        {% endprovide %}
+        <{{ tag }} {% html_attrs attrs %}>
+            {% slot "default" / %}
+        </{{ tag }}>
     """
 
 
@@ -73,7 +95,7 @@ class FormLabel(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        formgroup = self.inject("formgroup", NOT_PROVIDED)
+        formgroup = inject(self, FormGroupContext, NOT_PROVIDED)
         if formgroup is not NOT_PROVIDED:
             for_value = kwargs.for_ or formgroup.control_id
         else:
@@ -93,6 +115,19 @@ class FormLabel(Component):
     """
 
 
+_FORM_CONTROL_ATTRS = AttrsRenderer(
+    {"class": DYNAMIC},
+    defaults={
+        "type": DYNAMIC,
+        "id": DYNAMIC,
+        "name": DYNAMIC,
+        "value": DYNAMIC,
+        "placeholder": DYNAMIC,
+        "size": DYNAMIC,
+    },
+)
+
+
 class FormControl(Component):
     class Kwargs:
         type: Literal[
@@ -127,7 +162,7 @@ class FormControl(Component):
         pass
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        formgroup = self.inject("formgroup", NOT_PROVIDED)
+        formgroup = inject(self, FormGroupContext, NOT_PROVIDED)
         control_id = formgroup.control_id if formgroup is not NOT_PROVIDED else None
 
         if kwargs.plaintext:
@@ -153,20 +188,24 @@ class FormControl(Component):
         final_attrs = {**html_attrs, **(kwargs.attrs or {})}
 
         return {
-            "form_class": form_class,
-            "type": kwargs.type,
-            "html_size": kwargs.html_size,
-            "value": kwargs.value,
-            "placeholder": kwargs.placeholder,
-            "id": control_id,
-            "name": kwargs.name,
-            "attrs": final_attrs,
+            "attrs_html": _FORM_CONTROL_ATTRS(
+                final_attrs,
+                {
+                    "class": form_class,
+                    "type": kwargs.type,
+                    "id": control_id,
+                    "name": kwargs.name,
+                    "value": kwargs.value,
+                    "placeholder": kwargs.placeholder,
+                    "size": kwargs.html_size,
+                },
+            ),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        <input {% html_attrs attrs class=form_class defaults:type=type defaults:id=id defaults:name=name defaults:value=value defaults:placeholder=placeholder defaults:size=html_size %} />
+        <input {{ attrs_html }} />
     """
 
 
@@ -185,7 +224,7 @@ class FormTextarea(Component):
         default: SlotInput | None = None
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        formgroup = self.inject("formgroup", NOT_PROVIDED)
+        formgroup = inject(self, FormGroupContext, NOT_PROVIDED)
         control_id = formgroup.control_id if formgroup is not NOT_PROVIDED else None
 
         classes = ["form-control"]
@@ -232,7 +271,7 @@ class FormSelect(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        formgroup = self.inject("formgroup", NOT_PROVIDED)
+        formgroup = inject(self, FormGroupContext, NOT_PROVIDED)
         control_id = formgroup.control_id if formgroup is not NOT_PROVIDED else None
 
         classes = ["form-select"]
@@ -267,6 +306,27 @@ class FormSelect(Component):
     """
 
 
+class FormCheckContext(ParentContext):
+    __slots__ = ("control_id", "type", "is_valid", "is_invalid", "disabled", "checked")
+    key = "formcheck"
+
+    def __init__(
+        self,
+        control_id: str,
+        type: FormCheckType,
+        is_valid: bool,
+        is_invalid: bool,
+        disabled: bool,
+        checked: bool,
+    ):
+        self.control_id = control_id
+        self.type = type
+        self.is_valid = is_valid
+        self.is_invalid = is_invalid
+        self.disabled = disabled
+        self.checked = checked
+
+
 class FormCheckInput(Component):
     class Kwargs:
         type: FormCheckType | None = None
@@ -282,16 +342,14 @@ class FormCheckInput(Component):
         pass
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        formcheck = self.inject("formcheck", NOT_PROVIDED)
+        formcheck = inject(self, FormCheckContext, NOT_PROVIDED)
         if formcheck is not NOT_PROVIDED:
             control_id = formcheck.control_id
             check_type = formcheck.type
-            is_valid = formcheck.is_valid if hasattr(formcheck, "is_valid") else kwargs.is_valid
-            is_invalid = (
-                formcheck.is_invalid if hasattr(formcheck, "is_invalid") else kwargs.is_invalid
-            )
-            disabled = formcheck.disabled if hasattr(formcheck, "disabled") else kwargs.disabled
-            checked = formcheck.checked if hasattr(formcheck, "checked") else kwargs.checked
+            is_valid = formcheck.is_valid
+            is_invalid = formcheck.is_invalid
+            disabled = formcheck.disabled
+            checked = formcheck.checked
         else:
             control_id = None
             check_type = kwargs.type if kwargs.type else "checkbox"
@@ -344,7 +402,7 @@ class FormCheckLabel(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        formcheck = self.inject("formcheck", NOT_PROVIDED)
+        formcheck = inject(self, FormCheckContext, NOT_PROVIDED)
         if formcheck is not NOT_PROVIDED:
             control_id = formcheck.control_id
         else:
@@ -397,7 +455,7 @@ class FormCheck(Component):
 
         has_label = kwargs.label is not None
 
-        control_id = (kwargs.attrs or {}).get("id") or f"formcheck-{self.id}"
+        control_id = html_id(self, "formcheck", kwargs.attrs)
 
         return {
             "wrapper_classes": " ".join(wrapper_classes),
@@ -413,23 +471,31 @@ class FormCheck(Component):
             "title": kwargs.title,
             "has_label": has_label,
             "attrs": kwargs.attrs or {},
+            **provide(
+                FormCheckContext(
+                    control_id,
+                    kwargs.type,
+                    kwargs.is_valid,
+                    kwargs.is_invalid,
+                    kwargs.disabled,
+                    kwargs.checked,
+                )
+            ),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "formcheck" control_id=control_id type=type is_valid=is_valid is_invalid=is_invalid disabled=disabled checked=checked %}
-            <div {% html_attrs attrs class=wrapper_classes %}>
-                {% slot "default" default %}
-                    {% component "FormCheckInput" type=type disabled=disabled checked=checked is_valid=is_valid is_invalid=is_invalid name=name value=value %}{% endcomponent %}
-                    {% if has_label %}
-                        {% component "FormCheckLabel" for_=control_id title=title %}
-                            {{ label }}
-                        {% endcomponent %}
-                    {% endif %}
-                {% endslot %}
-            </div>
-        {% endprovide %}
+        <div {% html_attrs attrs class=wrapper_classes %}>
+            {% slot "default" default %}
+                {% component "FormCheckInput" type=type disabled=disabled checked=checked is_valid=is_valid is_invalid=is_invalid name=name value=value %}{% endcomponent %}
+                {% if has_label %}
+                    {% component "FormCheckLabel" for_=control_id title=title %}
+                        {{ label }}
+                    {% endcomponent %}
+                {% endif %}
+            {% endslot %}
+        </div>
     """
 
 
@@ -473,3 +539,326 @@ class FormFloating(Component):
             {% slot "default" / %}
         </div>
     """
+
+
+def _widget_context(bound_field: BoundField, attrs: dict) -> dict:
+    # Same attrs and value as `BoundField.as_widget()`, without rendering the widget template
+    widget = bound_field.field.widget
+    if bound_field.field.localize:
+        widget.is_localized = True
+    attrs = bound_field.build_widget_attrs(attrs, widget)
+    if bound_field.auto_id and "id" not in widget.attrs:
+        attrs.setdefault("id", bound_field.auto_id)
+    return widget.get_context(bound_field.html_name, bound_field.value(), attrs)["widget"]
+
+
+def _input(widget: dict, extra: dict) -> str:
+    defaults = {"type": widget["type"], "name": widget["name"]}
+    if widget["value"] is not None:
+        defaults["value"] = str(widget["value"])
+    return f"<input {html_attrs(widget['attrs'], extra, defaults)}>"
+
+
+def render_input(bound_field: BoundField, attrs: dict) -> str:
+    return _input(_widget_context(bound_field, attrs), {})
+
+
+def render_textarea(bound_field: BoundField, attrs: dict) -> str:
+    widget = _widget_context(bound_field, attrs)
+    value = conditional_escape(widget["value"]) if widget["value"] else ""
+    return (
+        f"<textarea {html_attrs(widget['attrs'], {}, {'name': widget['name']})}>\n"
+        f"{value}</textarea>"
+    )
+
+
+def render_select(bound_field: BoundField, attrs: dict) -> str:
+    widget = _widget_context(bound_field, attrs)
+    options = []
+    for group_name, group_choices, _index in widget["optgroups"]:
+        if group_name:
+            options.append(f'<optgroup label="{conditional_escape(group_name)}">')
+        for option in group_choices:
+            option_attrs = html_attrs(option["attrs"], {}, {"value": str(option["value"])})
+            options.append(f"<option {option_attrs}>{conditional_escape(option['label'])}</option>")
+        if group_name:
+            options.append("</optgroup>")
+    return (
+        f"<select {html_attrs(widget['attrs'], {}, {'name': widget['name']})}>"
+        f"{''.join(options)}</select>"
+    )
+
+
+def render_choices(bound_field: BoundField, attrs: dict) -> str:
+    widget = _widget_context(bound_field, attrs)
+    checks = []
+    for _group_name, group_choices, _index in widget["optgroups"]:
+        for option in group_choices:
+            option_id = option["attrs"].get("id")
+            label_for = f' for="{conditional_escape(option_id)}"' if option_id else ""
+            checks.append(
+                f'<div class="form-check">{_input(option, {"class": attrs["class"]})}'
+                f'<label class="form-check-label"{label_for}>'
+                f"{conditional_escape(option['label'])}</label></div>"
+            )
+    return "".join(checks)
+
+
+def render_widget(bound_field: BoundField, attrs: dict) -> str:
+    return bound_field.as_widget(attrs=attrs)
+
+
+class WidgetRenderer(NamedTuple):
+    render: Callable[[BoundField, dict], str]
+    control_class: str | None
+    layout: Literal["control", "check", "choices"] = "control"
+
+
+INPUT_RENDERER = WidgetRenderer(render_input, "form-control")
+
+# Renderers for Django's built-in widgets, by widget template
+WIDGET_RENDERERS: dict[str, WidgetRenderer] = {
+    **{
+        f"django/forms/widgets/{input_type}.html": INPUT_RENDERER
+        for input_type in (
+            "input",
+            "text",
+            "number",
+            "email",
+            "url",
+            "password",
+            "search",
+            "tel",
+            "date",
+            "datetime",
+            "time",
+            "file",
+        )
+    },
+    "django/forms/widgets/color.html": WidgetRenderer(
+        render_input, "form-control form-control-color"
+    ),
+    "django/forms/widgets/hidden.html": WidgetRenderer(render_input, None),
+    "django/forms/widgets/textarea.html": WidgetRenderer(render_textarea, "form-control"),
+    "django/forms/widgets/select.html": WidgetRenderer(render_select, "form-select"),
+    "django/forms/widgets/checkbox.html": WidgetRenderer(render_input, "form-check-input", "check"),
+    "django/forms/widgets/radio.html": WidgetRenderer(
+        render_choices, "form-check-input", "choices"
+    ),
+    "django/forms/widgets/checkbox_select.html": WidgetRenderer(
+        render_choices, "form-check-input", "choices"
+    ),
+}
+
+FALLBACK_RENDERER = WidgetRenderer(render_widget, "form-control")
+
+
+# Stands in for the field's id in the plans of `render_form()`, which are shared by the
+# instances of a form class whatever their prefix
+PLAN_ID = "\x00"
+
+
+class FieldPlan(NamedTuple):
+    """The parts of a field's markup that do not depend on its value or errors."""
+
+    source: tuple
+    renderer: WidgetRenderer
+    start: str
+    after_control: str
+    help_text: str
+    feedback_start: str
+    end: str
+
+    def with_id(self, auto_id: str) -> "FieldPlan":
+        """The plan with `PLAN_ID` replaced by the field's id."""
+        if not self.start:
+            return self
+        auto_id = conditional_escape(auto_id)
+        return self._replace(
+            start=self.start.replace(PLAN_ID, auto_id),
+            after_control=self.after_control.replace(PLAN_ID, auto_id),
+            help_text=self.help_text.replace(PLAN_ID, auto_id),
+            feedback_start=self.feedback_start.replace(PLAN_ID, auto_id),
+        )
+
+
+def _plan_source(field: Field) -> tuple:
+    # What a plan is built from besides the field name, as set on the field. Compared by
+    # identity first, so this is cheap for fields that were not changed on the form.
+    widget = field.widget
+    return (field.label, field.help_text, widget.__class__, widget.attrs.get("id"))
+
+
+def field_plan(
+    bound_field: BoundField,
+    show_label: bool = True,
+    attrs: dict | None = None,
+    auto_id: str | None = None,
+) -> FieldPlan:
+    """The plan of `bound_field`, with `auto_id` as the field's id if given."""
+    field = bound_field.field
+    widget = field.widget
+    source = _plan_source(field)
+    renderer = WIDGET_RENDERERS.get(widget.template_name, FALLBACK_RENDERER)
+    if widget.is_hidden:
+        return FieldPlan(source, renderer, "", "", "", "", "")
+
+    if auto_id is None:
+        auto_id = bound_field.auto_id
+    id_for_label = widget.id_for_label(widget.attrs.get("id") or auto_id)
+    label = bound_field.label
+    help_text = bound_field.help_text
+    use_fieldset = widget.use_fieldset
+
+    auto_id = conditional_escape(auto_id) if auto_id else ""
+    label = conditional_escape(label) if show_label and label else ""
+    label_for = f' for="{conditional_escape(id_for_label)}"' if id_for_label else ""
+
+    error_id = f' id="{auto_id}_error"' if auto_id else ""
+    feedback_class = (
+        "invalid-feedback d-block" if renderer.layout == "choices" else "invalid-feedback"
+    )
+    if help_text:
+        help_id = f' id="{auto_id}_helptext"' if auto_id else ""
+        help_text = f'<div class="form-text"{help_id}>{help_text}</div>'
+
+    tag = "div"
+    after_control = ""
+    if renderer.layout == "check":
+        if label:
+            after_control = f'<label class="form-check-label"{label_for}>{label}</label>'
+        start = '<div class="form-check">'
+        end = "</div>"
+    elif use_fieldset:
+        # Radio and checkbox groups and multi-widgets, like Django's own form templates
+        tag = "fieldset"
+        start = f'<legend class="form-label">{label}</legend>' if label else ""
+        end = ""
+    else:
+        start = f'<label class="form-label"{label_for}>{label}</label>' if label else ""
+        end = ""
+
+    return FieldPlan(
+        source,
+        renderer,
+        f"<{tag} {html_attrs(attrs, {}, {'class': 'mb-3'})}>{start}",
+        after_control,
+        help_text or "",
+        f'<div class="{feedback_class}"{error_id}>',
+        f"{end}</{tag}>",
+    )
+
+
+def _render_control(bound_field: BoundField, renderer: WidgetRenderer, attrs: dict) -> str:
+    control = renderer.render(bound_field, attrs)
+    if bound_field.field.show_hidden_initial:
+        # Like `BoundField.__str__()`
+        control += bound_field.as_hidden(only_initial=True)
+    return control
+
+
+def render_planned_field(bound_field: BoundField, plan: FieldPlan) -> str:
+    renderer = plan.renderer
+    if not plan.start:
+        return _render_control(bound_field, renderer, {})
+
+    errors = bound_field.errors
+    if not errors:
+        control = _render_control(bound_field, renderer, {"class": renderer.control_class})
+        return f"{plan.start}{control}{plan.after_control}{plan.help_text}{plan.end}"
+
+    control = _render_control(
+        bound_field, renderer, {"class": f"{renderer.control_class} is-invalid"}
+    )
+    messages = "<br>".join(conditional_escape(error) for error in errors)
+    return (
+        f"{plan.start}{control}{plan.after_control}{plan.feedback_start}{messages}</div>"
+        f"{plan.help_text}{plan.end}"
+    )
+
+
+def render_field(
+    bound_field: BoundField, show_label: bool = True, attrs: dict | None = None
+) -> str:
+    """Render a bound field with its label, errors and help text."""
+    return render_planned_field(bound_field, field_plan(bound_field, show_label, attrs))
+
+
+# Field plans of rendered forms, per form class. Dropped with the class, e.g. when a module
+# is reloaded.
+_form_plans: WeakKeyDictionary[type, dict[tuple, FieldPlan]] = WeakKeyDictionary()
+
+
+def clear_form_plans() -> None:
+    _form_plans.clear()
+
+
+def render_form(
+    form: BaseForm, fields: list[str] | None = None, exclude: list[str] | None = None
+) -> str:
+    """Render the form's errors, hidden fields and visible fields."""
+    plans = _form_plans.get(form.__class__)
+    if plans is None:
+        plans = _form_plans[form.__class__] = {}
+
+    errors = list(form.non_field_errors())
+    hidden = []
+    visible = []
+    for bound_field in form:
+        if (fields is not None and bound_field.name not in fields) or (
+            exclude and bound_field.name in exclude
+        ):
+            continue
+
+        # Labels and help texts are translated into the plan, and the field's id is filled
+        # in per form. Fields can be changed per form instance, so the plan is checked
+        # against the field.
+        auto_id = bound_field.auto_id
+        key = (get_language(), bound_field.name, bool(auto_id))
+        plan = plans.get(key)
+        if plan is None or plan.source != _plan_source(bound_field.field):
+            plan = plans[key] = field_plan(bound_field, auto_id=PLAN_ID if auto_id else "")
+        plan = plan.with_id(auto_id)
+
+        if bound_field.is_hidden:
+            hidden.append(render_planned_field(bound_field, plan))
+            errors.extend(
+                _("(Hidden field %(name)s) %(error)s") % {"name": bound_field.name, "error": error}
+                for error in bound_field.errors
+            )
+        else:
+            visible.append(render_planned_field(bound_field, plan))
+
+    alert = ""
+    if errors:
+        messages = "<br>".join(conditional_escape(error) for error in errors)
+        alert = f'<div class="alert alert-danger" role="alert">{messages}</div>'
+    return f"{alert}{''.join(hidden)}{''.join(visible)}"
+
+
+class BootstrapField(Component):
+    class Kwargs:
+        field: BoundField
+        show_label: bool = True
+        attrs: dict | None = None
+
+    def get_template_data(self, args, kwargs: Kwargs, slots, context: Context):
+        return {
+            "field_html": mark_safe(render_field(kwargs.field, kwargs.show_label, kwargs.attrs)),
+        }
+
+    template: types.django_html = """{{ field_html }}"""
+
+
+class BootstrapForm(Component):
+    class Kwargs:
+        form: BaseForm
+        fields: list[str] | None = None
+        exclude: list[str] | None = None
+
+    def get_template_data(self, args, kwargs: Kwargs, slots, context: Context):
+        return {
+            "form_html": mark_safe(render_form(kwargs.form, kwargs.fields, kwargs.exclude)),
+        }
+
+    template: types.django_html = """{{ form_html }}"""
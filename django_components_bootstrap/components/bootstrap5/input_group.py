@@ -1,6 +1,8 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.form import FormGroupContext
+from django_components_bootstrap.components.bootstrap5.rendering import provide
 from django_components_bootstrap.components.bootstrap5.types import Size
 
 
@@ -111,15 +113,14 @@ class FloatingLabel(Component):
             "control_id": kwargs.control_id,
             "label": kwargs.label,
             "attrs": kwargs.attrs,
+            **provide(FormGroupContext(kwargs.control_id)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "formgroup" control_id=control_id %}
-            <div {% html_attrs attrs class="form-floating" %}>
-                {% slot "default" / %}
-                <label{% if control_id %} for="{{ control_id }}"{% endif %}>{{ label }}</label>
-            </div>
-        {% endprovide %}
+        <div {% html_attrs attrs class="form-floating" %}>
+            {% slot "default" / %}
+            <label{% if control_id %} for="{{ control_id }}"{% endif %}>{{ label }}</label>
+        </div>
     """
@@ -1,6 +1,8 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.classes import class_resolver
+from django_components_bootstrap.components.bootstrap5.streaming import StreamingMixin
 from django_components_bootstrap.components.bootstrap5.types import (
     BreakpointOrAuto,
     ContainerFluid,
@@ -39,7 +41,34 @@ class Container(Component):
     """
 
 
-class Row(Component):
+@class_resolver("Row")
+def _row_classes(cols, cols_sm, cols_md, cols_lg, cols_xl, cols_xxl, gutter, gutter_x, gutter_y):
+    classes = ["row"]
+
+    if cols is not None:
+        classes.append(f"row-cols-{cols}")
+    if cols_sm is not None:
+        classes.append(f"row-cols-sm-{cols_sm}")
+    if cols_md is not None:
+        classes.append(f"row-cols-md-{cols_md}")
+    if cols_lg is not None:
+        classes.append(f"row-cols-lg-{cols_lg}")
+    if cols_xl is not None:
+        classes.append(f"row-cols-xl-{cols_xl}")
+    if cols_xxl is not None:
+        classes.append(f"row-cols-xxl-{cols_xxl}")
+
+    if gutter is not None:
+        classes.append(f"g-{gutter}")
+    if gutter_x is not None:
+        classes.append(f"gx-{gutter_x}")
+    if gutter_y is not None:
+        classes.append(f"gy-{gutter_y}")
+
+    return " ".join(classes)
+
+
+class Row(StreamingMixin, Component):
     class Kwargs:
         as_: str = "div"
         cols: int | None = None
@@ -57,31 +86,21 @@ class Row(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = ["row"]
-
-        if kwargs.cols is not None:
-            classes.append(f"row-cols-{kwargs.cols}")
-        if kwargs.cols_sm is not None:
-            classes.append(f"row-cols-sm-{kwargs.cols_sm}")
-        if kwargs.cols_md is not None:
-            classes.append(f"row-cols-md-{kwargs.cols_md}")
-        if kwargs.cols_lg is not None:
-            classes.append(f"row-cols-lg-{kwargs.cols_lg}")
-        if kwargs.cols_xl is not None:
-            classes.append(f"row-cols-xl-{kwargs.cols_xl}")
-        if kwargs.cols_xxl is not None:
-            classes.append(f"row-cols-xxl-{kwargs.cols_xxl}")
-
-        if kwargs.gutter is not None:
-            classes.append(f"g-{kwargs.gutter}")
-        if kwargs.gutter_x is not None:
-            classes.append(f"gx-{kwargs.gutter_x}")
-        if kwargs.gutter_y is not None:
-            classes.append(f"gy-{kwargs.gutter_y}")
+        classes = _row_classes(
+            kwargs.cols,
+            kwargs.cols_sm,
+            kwargs.cols_md,
+            kwargs.cols_lg,
+            kwargs.cols_xl,
+            kwargs.cols_xxl,
+            kwargs.gutter,
+            kwargs.gutter_x,
+            kwargs.gutter_y,
+        )
 
         return {
             "tag": kwargs.as_,
-            "classes": " ".join(classes),
+            "classes": classes,
             "attrs": kwargs.attrs,
         }
 
@@ -94,6 +113,57 @@ class Row(Component):
     """
 
 
+@class_resolver("Col")
+def _col_classes(col, xs, sm, md, lg, xl, xxl, auto):
+    classes = []
+
+    has_breakpoint = any([col, xs, sm, md, lg, xl, xxl])
+
+    if not has_breakpoint and not auto:
+        classes.append("col")
+    else:
+        if col is not None:
+            if col == "auto":
+                classes.append("col-auto")
+            else:
+                classes.append(f"col-{col}")
+
+        if xs is not None:
+            if xs == "auto":
+                classes.append("col-auto")
+            else:
+                classes.append(f"col-{xs}")
+        if sm is not None:
+            if sm == "auto":
+                classes.append("col-sm-auto")
+            else:
+                classes.append(f"col-sm-{sm}")
+        if md is not None:
+            if md == "auto":
+                classes.append("col-md-auto")
+            else:
+                classes.append(f"col-md-{md}")
+        if lg is not None:
+            if lg == "auto":
+                classes.append("col-lg-auto")
+            else:
+                classes.append(f"col-lg-{lg}")
+        if xl is not None:
+            if xl == "auto":
+                classes.append("col-xl-auto")
+            else:
+                classes.append(f"col-xl-{xl}")
+        if xxl is not None:
+            if xxl == "auto":
+                classes.append("col-xxl-auto")
+            else:
+                classes.append(f"col-xxl-{xxl}")
+        if auto:
+            classes.append("col-auto")
+
+    return " ".join(classes) if classes else "col"
+
+
 class Col(Component):
     class Kwargs:
         as_: str = "div"
@@ -111,57 +181,20 @@ class Col(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = []
-
-        has_breakpoint = any(
-            [kwargs.col, kwargs.xs, kwargs.sm, kwargs.md, kwargs.lg, kwargs.xl, kwargs.xxl]
+        classes = _col_classes(
+            kwargs.col,
+            kwargs.xs,
+            kwargs.sm,
+            kwargs.md,
+            kwargs.lg,
+            kwargs.xl,
+            kwargs.xxl,
+            kwargs.auto,
         )
 
-        if not has_breakpoint and not kwargs.auto:
-            classes.append("col")
-        else:
-            if kwargs.col is not None:
-                if kwargs.col == "auto":
-                    classes.append("col-auto")
-                else:
-                    classes.append(f"col-{kwargs.col}")
-
-            if kwargs.xs is not None:
-                if kwargs.xs == "auto":
-                    classes.append("col-auto")
-                else:
-                    classes.append(f"col-{kwargs.xs}")
-            if kwargs.sm is not None:
-                if kwargs.sm == "auto":
-                    classes.append("col-sm-auto")
-                else:
-                    classes.append(f"col-sm-{kwargs.sm}")
-            if kwargs.md is not None:
-                if kwargs.md == "auto":
-                    classes.append("col-md-auto")
-                else:
-                    classes.append(f"col-md-{kwargs.md}")
-            if kwargs.lg is not None:
-                if kwargs.lg == "auto":
-                    classes.append("col-lg-auto")
-                else:
-                    classes.append(f"col-lg-{kwargs.lg}")
-            if kwargs.xl is not None:
-                if kwargs.xl == "auto":
-                    classes.append("col-xl-auto")
-                else:
-                    classes.append(f"col-xl-{kwargs.xl}")
-            if kwargs.xxl is not None:
-                if kwargs.xxl == "auto":
-                    classes.append("col-xxl-auto")
-                else:
-                    classes.append(f"col-xxl-{kwargs.xxl}")
-            if kwargs.auto:
-                classes.append("col-auto")
-
         return {
             "tag": kwargs.as_,
-            "classes": " ".join(classes) if classes else "col",
+            "classes": classes,
             "attrs": kwargs.attrs,
         }
 
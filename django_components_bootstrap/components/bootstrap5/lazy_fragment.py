@@ -0,0 +1,98 @@
+from django.core import signing
+from django.template import Context
+from django.urls import reverse
+from django_components import Component, SlotInput, registry, types
+
+from django_components_bootstrap.apps import get_setting
+
+LAZY_FRAGMENT_SALT = "django_components_bootstrap.lazy_fragment"
+DEFAULT_LAZY_FRAGMENT_MAX_AGE = 24 * 60 * 60
+
+
+def encode_fragment(component: str, kwargs: dict | None = None) -> str:
+    """A signed token for rendering the registered `component` with `kwargs` later."""
+    return signing.dumps([component, kwargs or {}], salt=LAZY_FRAGMENT_SALT, compress=True)
+
+
+def decode_fragment(token: str) -> tuple[type[Component], dict]:
+    """
+    The component and kwargs of a token from `encode_fragment()`. Tokens expire after the
+    `LAZY_FRAGMENT_MAX_AGE` setting (in seconds, `None` for never).
+    """
+    max_age = get_setting("LAZY_FRAGMENT_MAX_AGE", DEFAULT_LAZY_FRAGMENT_MAX_AGE)
+    try:
+        name, kwargs = signing.loads(token, salt=LAZY_FRAGMENT_SALT, max_age=max_age)
+    except (signing.BadSignature, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid fragment: {token!r}") from e
+    if not registry.has(name):
+        raise ValueError(f"Invalid fragment: '{name}' is not registered")
+    return registry.get(name), kwargs
+
+
+class LazyFragment(Component):
+    """
+    Renders a skeleton (its content, or `Placeholder` lines by default) that is replaced
+    after page load by the registered `component`, rendered with `kwargs` by the
+    `lazy_fragment` view. `kwargs` must be JSON serializable.
+    """
+
+    class Kwargs:
+        component: str
+        kwargs: dict | None = None
+        lines: int = 3
+        attrs: dict | None = None
+
+    class Slots:
+        default: SlotInput | None = None
+
+    def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
+        token = encode_fragment(kwargs.component, kwargs.kwargs)
+
+        return {
+            "url": reverse("django_components_bootstrap:lazy_fragment", args=[token]),
+            "widths": [(7, 4, 6, 8, 5)[i % 5] for i in range(kwargs.lines)],
+            "attrs": kwargs.attrs,
+        }
+
+    template: types.django_html = """
+        {% load component_tags %}
+
+        <div {% html_attrs attrs data-bs-lazy-fragment=url aria-busy="true" %}>
+            {% slot "default" %}
+                <div class="placeholder-glow" aria-hidden="true">
+                    {% for width in widths %}
+                        {% component "Placeholder" xs=width / %}
+                    {% endfor %}
+                </div>
+            {% endslot %}
+        </div>
+    """
+
+    js: types.js = """
+        (() => {
+            const load = (root) => {
+                root.querySelectorAll("[data-bs-lazy-fragment]").forEach((el) => {
+                    const url = el.getAttribute("data-bs-lazy-fragment");
+                    el.removeAttribute("data-bs-lazy-fragment");
+                    fetch(url, { headers: { "X-Requested-With": "XMLHttpRequest" } })
+                        .then((response) => {
+                            if (!response.ok) throw new Error(response.statusText);
+                            return response.text();
+                        })
+                        .then((html) => {
+                            const parent = el.parentElement;
+                            // Unlike `outerHTML`, this runs the scripts that load the
+                            // fragment's JS and CSS
+                            el.replaceWith(document.createRange().createContextualFragment(html));
+                            if (parent) load(parent);
+                        })
+                        .catch(() => el.setAttribute("aria-busy", "false"));
+                });
+            };
+            if (document.readyState === "loading") {
+                document.addEventListener("DOMContentLoaded", () => load(document));
+            } else {
+                load(document);
+            }
+        })();
+    """
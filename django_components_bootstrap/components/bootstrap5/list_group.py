@@ -1,6 +1,8 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.classes import class_resolver
+from django_components_bootstrap.components.bootstrap5.streaming import StreamingMixin
 from django_components_bootstrap.components.bootstrap5.types import (
     ListGroupItemTag,
     ListGroupTag,
@@ -9,7 +11,41 @@ from django_components_bootstrap.components.bootstrap5.types import (
 )
 
 
-class ListGroup(Component):
+@class_resolver("ListGroup")
+def _list_group_classes(flush, numbered, horizontal):
+    classes = ["list-group"]
+    if flush:
+        classes.append("list-group-flush")
+    if numbered:
+        classes.append("list-group-numbered")
+    if horizontal is not None:
+        if horizontal is True:
+            classes.append("list-group-horizontal")
+        else:
+            classes.append(f"list-group-horizontal-{horizontal}")
+
+    return " ".join(classes)
+
+
+@class_resolver("ListGroupItem")
+def _list_group_item_classes(tag, action, variant, active, disabled):
+    classes = ["list-group-item"]
+
+    if action or tag in ("a", "button"):
+        classes.append("list-group-item-action")
+
+    if variant:
+        classes.append(f"list-group-item-{variant}")
+    if active:
+        classes.append("active")
+
+    if disabled and tag != "button":
+        classes.append("disabled")
+
+    return " ".join(classes)
+
+
+class ListGroup(StreamingMixin, Component):
     class Kwargs:
         as_: ListGroupTag = "ul"
         flush: bool = False
@@ -21,22 +57,11 @@ class ListGroup(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = ["list-group"]
-        if kwargs.flush:
-            classes.append("list-group-flush")
-        if kwargs.numbered:
-            classes.append("list-group-numbered")
-        if kwargs.horizontal is not None:
-            if kwargs.horizontal is True:
-                classes.append("list-group-horizontal")
-            else:
-                classes.append(f"list-group-horizontal-{kwargs.horizontal}")
-
         tag = "ol" if kwargs.numbered else kwargs.as_
 
         return {
             "tag": tag,
-            "classes": " ".join(classes),
+            "classes": _list_group_classes(kwargs.flush, kwargs.numbered, kwargs.horizontal),
             "attrs": kwargs.attrs,
         }
 
@@ -63,23 +88,14 @@ class ListGroupItem(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = ["list-group-item"]
-
         if kwargs.href:
             tag = "a"
         else:
             tag = kwargs.as_
 
-        if kwargs.action or tag in ("a", "button"):
-            classes.append("list-group-item-action")
-
-        if kwargs.variant:
-            classes.append(f"list-group-item-{kwargs.variant}")
-        if kwargs.active:
-            classes.append("active")
-
-        if kwargs.disabled and tag != "button":
-            classes.append("disabled")
+        classes = _list_group_item_classes(
+            tag, kwargs.action, kwargs.variant, kwargs.active, kwargs.disabled
+        )
 
         aria_current = "true" if kwargs.active else None
         button_disabled = True if tag == "button" and kwargs.disabled else None
@@ -88,7 +104,7 @@ class ListGroupItem(Component):
 
         return {
             "tag": tag,
-            "classes": " ".join(classes),
+            "classes": classes,
             "href": kwargs.href,
             "aria_current": aria_current,
             "button_disabled": button_disabled,
@@ -1,6 +1,13 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.classes import class_resolver
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    ParentContext,
+    html_id,
+    inject,
+    provide,
+)
 from django_components_bootstrap.components.bootstrap5.types import (
     BackdropBehavior,
     ButtonTag,
@@ -10,6 +17,42 @@ from django_components_bootstrap.components.bootstrap5.types import (
 )
 
 
+@class_resolver("Modal")
+def _modal_classes(fade, size, fullscreen, centered, scrollable, dialog_class, content_class):
+    modal_classes = ["modal"]
+    if fade:
+        modal_classes.append("fade")
+
+    dialog_classes = ["modal-dialog"]
+    if size:
+        dialog_classes.append(f"modal-{size}")
+    if fullscreen is not None:
+        if fullscreen is True:
+            dialog_classes.append("modal-fullscreen")
+        else:
+            dialog_classes.append(f"modal-fullscreen-{fullscreen}-down")
+    if centered:
+        dialog_classes.append("modal-dialog-centered")
+    if scrollable:
+        dialog_classes.append("modal-dialog-scrollable")
+    if dialog_class:
+        dialog_classes.append(dialog_class)
+
+    content_classes = ["modal-content"]
+    if content_class:
+        content_classes.append(content_class)
+
+    return " ".join(modal_classes), " ".join(dialog_classes), " ".join(content_classes)
+
+
+class ModalContext(ParentContext):
+    __slots__ = ("modal_id",)
+    key = "modal"
+
+    def __init__(self, modal_id: str):
+        self.modal_id = modal_id
+
+
 class Modal(Component):
     class Kwargs:
         size: SizeWithXl | None = None
@@ -27,53 +70,39 @@ class Modal(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        modal_id = (kwargs.attrs or {}).get("id") or f"modal-{self.id}"
-
-        modal_classes = ["modal"]
-        if kwargs.fade:
-            modal_classes.append("fade")
-
-        dialog_classes = ["modal-dialog"]
-        if kwargs.size:
-            dialog_classes.append(f"modal-{kwargs.size}")
-        if kwargs.fullscreen is not None:
-            if kwargs.fullscreen is True:
-                dialog_classes.append("modal-fullscreen")
-            else:
-                dialog_classes.append(f"modal-fullscreen-{kwargs.fullscreen}-down")
-        if kwargs.centered:
-            dialog_classes.append("modal-dialog-centered")
-        if kwargs.scrollable:
-            dialog_classes.append("modal-dialog-scrollable")
-        if kwargs.dialog_class:
-            dialog_classes.append(kwargs.dialog_class)
-
-        content_classes = ["modal-content"]
-        if kwargs.content_class:
-            content_classes.append(kwargs.content_class)
+        modal_id = html_id(self, "modal", kwargs.attrs)
+
+        modal_classes, dialog_classes, content_classes = _modal_classes(
+            kwargs.fade,
+            kwargs.size,
+            kwargs.fullscreen,
+            kwargs.centered,
+            kwargs.scrollable,
+            kwargs.dialog_class,
+            kwargs.content_class,
+        )
 
         return {
             "modal_id": modal_id,
-            "modal_classes": " ".join(modal_classes),
-            "dialog_classes": " ".join(dialog_classes),
-            "content_classes": " ".join(content_classes),
+            "modal_classes": modal_classes,
+            "dialog_classes": dialog_classes,
+            "content_classes": content_classes,
             "backdrop": kwargs.backdrop,
             "keyboard": kwargs.keyboard,
             "attrs": kwargs.attrs,
+            **provide(ModalContext(modal_id)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "modal" modal_id=modal_id %}
-            <div {% html_attrs attrs defaults:id=modal_id class=modal_classes tabindex="-1" defaults:aria-labelledby="{{ modal_id }}-label" defaults:aria-hidden="true" %} {% if backdrop %}data-bs-backdrop="{{ backdrop }}"{% endif %}{% if not keyboard %} data-bs-keyboard="false"{% endif %}>
-                <div class="{{ dialog_classes }}">
-                    <div class="{{ content_classes }}">
-                        {% slot "default" / %}
-                    </div>
+        <div {% html_attrs attrs defaults:id=modal_id class=modal_classes tabindex="-1" defaults:aria-labelledby="{{ modal_id }}-label" defaults:aria-hidden="true" %} {% if backdrop %}data-bs-backdrop="{{ backdrop }}"{% endif %}{% if not keyboard %} data-bs-keyboard="false"{% endif %}>
+            <div class="{{ dialog_classes }}">
+                <div class="{{ content_classes }}">
+                    {% slot "default" / %}
                 </div>
             </div>
-        {% endprovide %}
+        </div>
     """
 
 
@@ -158,7 +187,7 @@ class ModalTitle(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        modal = self.inject("modal")
+        modal = inject(self, ModalContext)
         modal_id = modal.modal_id
 
         return {
@@ -185,7 +214,7 @@ class ModalToggle(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        modal = self.inject("modal")
+        modal = inject(self, ModalContext)
         target_id = modal.modal_id
 
         return {
@@ -1,6 +1,8 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.classes import class_resolver
+from django_components_bootstrap.components.bootstrap5.rendering import DYNAMIC, AttrsRenderer
 from django_components_bootstrap.components.bootstrap5.types import (
     AnchorOrButton,
     NavItemTag,
@@ -9,6 +11,39 @@ from django_components_bootstrap.components.bootstrap5.types import (
 )
 
 
+@class_resolver("Nav")
+def _nav_classes(variant, fill, justified, vertical):
+    classes = ["nav"]
+
+    if variant == "tabs":
+        classes.append("nav-tabs")
+    elif variant == "pills":
+        classes.append("nav-pills")
+    elif variant == "underline":
+        classes.append("nav-underline")
+
+    if fill:
+        classes.append("nav-fill")
+    if justified:
+        classes.append("nav-justified")
+
+    if vertical:
+        classes.append("flex-column")
+
+    return " ".join(classes)
+
+
+@class_resolver("NavLink")
+def _nav_link_classes(active, disabled):
+    classes = ["nav-link"]
+    if active:
+        classes.append("active")
+    if disabled:
+        classes.append("disabled")
+
+    return " ".join(classes)
+
+
 class Nav(Component):
     class Kwargs:
         variant: NavVariant | None = None
@@ -23,26 +58,9 @@ class Nav(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = ["nav"]
-
-        if kwargs.variant == "tabs":
-            classes.append("nav-tabs")
-        elif kwargs.variant == "pills":
-            classes.append("nav-pills")
-        elif kwargs.variant == "underline":
-            classes.append("nav-underline")
-
-        if kwargs.fill:
-            classes.append("nav-fill")
-        if kwargs.justified:
-            classes.append("nav-justified")
-
-        if kwargs.vertical:
-            classes.append("flex-column")
-
         return {
             "tag": kwargs.as_,
-            "classes": " ".join(classes),
+            "classes": _nav_classes(kwargs.variant, kwargs.fill, kwargs.justified, kwargs.vertical),
             "role": kwargs.role,
             "attrs": kwargs.attrs,
         }
@@ -79,6 +97,16 @@ class NavItem(Component):
     """
 
 
+_NAV_LINK_ATTRS = AttrsRenderer(
+    {"href": DYNAMIC, "class": DYNAMIC},
+    defaults={"aria-disabled": DYNAMIC, "aria-current": DYNAMIC},
+)
+_NAV_BUTTON_ATTRS = AttrsRenderer(
+    {"class": DYNAMIC, "disabled": DYNAMIC},
+    defaults={"type": "button", "aria-current": DYNAMIC},
+)
+
+
 class NavLink(Component):
     class Kwargs:
         as_: AnchorOrButton = "a"
@@ -91,37 +119,41 @@ class NavLink(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = ["nav-link"]
-        if kwargs.active:
-            classes.append("active")
-        if kwargs.disabled:
-            classes.append("disabled")
-
-        button_disabled = True if kwargs.as_ == "button" and kwargs.disabled else None
-        aria_disabled = "true" if kwargs.as_ == "a" and kwargs.disabled else None
-        aria_current = "page" if kwargs.active and kwargs.as_ == "a" else None
-
-        link_href = None if kwargs.disabled else kwargs.href
+        classes = _nav_link_classes(kwargs.active, kwargs.disabled)
+        if kwargs.as_ == "a":
+            attrs_html = _NAV_LINK_ATTRS(
+                kwargs.attrs,
+                {
+                    "href": None if kwargs.disabled else kwargs.href,
+                    "class": classes,
+                    "aria-disabled": "true" if kwargs.disabled else None,
+                    "aria-current": "page" if kwargs.active else None,
+                },
+            )
+        else:
+            attrs_html = _NAV_BUTTON_ATTRS(
+                kwargs.attrs,
+                {
+                    "class": classes,
+                    "disabled": True if kwargs.disabled else None,
+                    "aria-current": None,
+                },
+            )
 
         return {
             "tag": kwargs.as_,
-            "classes": " ".join(classes),
-            "href": link_href,
-            "button_disabled": button_disabled,
-            "aria_disabled": aria_disabled,
-            "aria_current": aria_current,
-            "attrs": kwargs.attrs,
+            "attrs_html": attrs_html,
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
         {% if tag == "a" %}
-            <a {% html_attrs attrs href=href class=classes defaults:aria-disabled=aria_disabled defaults:aria-current=aria_current %}>
+            <a {{ attrs_html }}>
                 {% slot "default" / %}
             </a>
         {% else %}
-            <button {% html_attrs attrs defaults:type="button" class=classes disabled=button_disabled defaults:aria-current=aria_current %}>
+            <button {{ attrs_html }}>
                 {% slot "default" / %}
             </button>
         {% endif %}
@@ -1,6 +1,7 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import html_id
 from django_components_bootstrap.components.bootstrap5.types import AutoClose
 
 
@@ -18,7 +19,7 @@ class NavDropdown(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        dropdown_id = (kwargs.attrs or {}).get("id") or f"nav-dropdown-{self.id}"
+        dropdown_id = html_id(self, "nav-dropdown", kwargs.attrs)
 
         # Merge default attrs with user-provided attrs
         # User attrs override defaults
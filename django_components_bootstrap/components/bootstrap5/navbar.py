@@ -1,6 +1,13 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.classes import class_resolver
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    ParentContext,
+    html_id,
+    inject,
+    provide,
+)
 from django_components_bootstrap.components.bootstrap5.types import (
     AnchorOrSpan,
     Breakpoint,
@@ -10,6 +17,39 @@ from django_components_bootstrap.components.bootstrap5.types import (
 )
 
 
+@class_resolver("Navbar")
+def _navbar_classes(expand, bg, placement, container):
+    classes = ["navbar"]
+
+    if expand:
+        classes.append(f"navbar-expand-{expand}")
+
+    if bg:
+        classes.append(f"bg-{bg}")
+
+    if placement:
+        classes.append(placement)
+
+    container_class = None
+    if container is not None and container is not False:
+        if container is True:
+            container_class = "container"
+        elif container == "fluid":
+            container_class = "container-fluid"
+        else:
+            container_class = f"container-{container}"
+
+    return " ".join(classes), container_class
+
+
+class NavbarContext(ParentContext):
+    __slots__ = ("navbar_collapse_id",)
+    key = "navbar"
+
+    def __init__(self, navbar_collapse_id: str):
+        self.navbar_collapse_id = navbar_collapse_id
+
+
 class Navbar(Component):
     class Kwargs:
         expand: Breakpoint | None = None
@@ -23,50 +63,32 @@ class Navbar(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = ["navbar"]
-
-        if kwargs.expand:
-            classes.append(f"navbar-expand-{kwargs.expand}")
-
-        if kwargs.bg:
-            classes.append(f"bg-{kwargs.bg}")
-
-        if kwargs.placement:
-            classes.append(kwargs.placement)
-
-        container_class = None
-        if kwargs.container is not None and kwargs.container is not False:
-            if kwargs.container is True:
-                container_class = "container"
-            elif kwargs.container == "fluid":
-                container_class = "container-fluid"
-            else:
-                container_class = f"container-{kwargs.container}"
+        classes, container_class = _navbar_classes(
+            kwargs.expand, kwargs.bg, kwargs.placement, kwargs.container
+        )
 
-        navbar_collapse_id = (kwargs.attrs or {}).get("id") or f"navbar-collapse-{self.id}"
+        navbar_collapse_id = html_id(self, "navbar-collapse", kwargs.attrs)
 
         return {
-            "classes": " ".join(classes),
+            "classes": classes,
             "theme": kwargs.variant,
             "container_class": container_class,
-            "navbar_collapse_id": navbar_collapse_id,
             "attrs": kwargs.attrs,
+            **provide(NavbarContext(navbar_collapse_id)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "navbar" navbar_collapse_id=navbar_collapse_id %}
-            <nav {% html_attrs attrs class=classes %} {% if theme %}data-bs-theme="{{ theme }}"{% endif %}>
-                {% if container_class %}
-                    <div class="{{ container_class }}">
-                        {% slot "default" / %}
-                    </div>
-                {% else %}
+        <nav {% html_attrs attrs class=classes %} {% if theme %}data-bs-theme="{{ theme }}"{% endif %}>
+            {% if container_class %}
+                <div class="{{ container_class }}">
                     {% slot "default" / %}
-                {% endif %}
-            </nav>
-        {% endprovide %}
+                </div>
+            {% else %}
+                {% slot "default" / %}
+            {% endif %}
+        </nav>
     """
 
 
@@ -109,7 +131,7 @@ class NavbarToggler(Component):
         default: SlotInput | None = None
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        navbar = self.inject("navbar")
+        navbar = inject(self, NavbarContext)
         target_id = navbar.navbar_collapse_id
 
         return {
@@ -138,7 +160,7 @@ class NavbarCollapse(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        navbar = self.inject("navbar")
+        navbar = inject(self, NavbarContext)
         collapse_id = navbar.navbar_collapse_id
 
         return {
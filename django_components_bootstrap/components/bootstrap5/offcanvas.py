@@ -1,6 +1,12 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    ParentContext,
+    html_id,
+    inject,
+    provide,
+)
 from django_components_bootstrap.components.bootstrap5.types import (
     BackdropBehavior,
     Breakpoint,
@@ -10,6 +16,14 @@ from django_components_bootstrap.components.bootstrap5.types import (
 )
 
 
+class OffcanvasContext(ParentContext):
+    __slots__ = ("offcanvas_id",)
+    key = "offcanvas"
+
+    def __init__(self, offcanvas_id: str):
+        self.offcanvas_id = offcanvas_id
+
+
 class Offcanvas(Component):
     class Kwargs:
         placement: OffcanvasPlacement = "start"
@@ -24,7 +38,7 @@ class Offcanvas(Component):
         toggle: SlotInput = None
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        offcanvas_id = (kwargs.attrs or {}).get("id") or f"offcanvas-{self.id}"
+        offcanvas_id = html_id(self, "offcanvas", kwargs.attrs)
 
         if kwargs.responsive:
             classes = [f"offcanvas-{kwargs.responsive}", f"offcanvas-{kwargs.placement}"]
@@ -38,17 +52,16 @@ class Offcanvas(Component):
             "scroll": kwargs.scroll,
             "keyboard": kwargs.keyboard,
             "attrs": kwargs.attrs,
+            **provide(OffcanvasContext(offcanvas_id)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "offcanvas" offcanvas_id=offcanvas_id %}
-            {% slot "toggle" / %}
-            <div {% html_attrs attrs defaults:id=offcanvas_id class=classes tabindex="-1" defaults:aria-labelledby="{{ offcanvas_id }}-label" %} {% if backdrop %}data-bs-backdrop="{{ backdrop }}"{% endif %}{% if scroll %} data-bs-scroll="true"{% endif %}{% if not keyboard %} data-bs-keyboard="false"{% endif %}>
-                {% slot "default" / %}
-            </div>
-        {% endprovide %}
+        {% slot "toggle" / %}
+        <div {% html_attrs attrs defaults:id=offcanvas_id class=classes tabindex="-1" defaults:aria-labelledby="{{ offcanvas_id }}-label" %} {% if backdrop %}data-bs-backdrop="{{ backdrop }}"{% endif %}{% if scroll %} data-bs-scroll="true"{% endif %}{% if not keyboard %} data-bs-keyboard="false"{% endif %}>
+            {% slot "default" / %}
+        </div>
     """
 
 
@@ -112,7 +125,7 @@ class OffcanvasTitle(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        offcanvas = self.inject("offcanvas")
+        offcanvas = inject(self, OffcanvasContext)
         offcanvas_id = offcanvas.offcanvas_id
 
         return {
@@ -139,7 +152,7 @@ class OffcanvasToggle(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        offcanvas = self.inject("offcanvas")
+        offcanvas = inject(self, OffcanvasContext)
         target_id = offcanvas.offcanvas_id
 
         return {
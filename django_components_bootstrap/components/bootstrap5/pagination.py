@@ -1,4 +1,16 @@
+from collections.abc import Sequence
+from math import ceil
+from typing import NamedTuple
+
+from django.core import signing
+from django.core.paginator import Page
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+from django.http import QueryDict
 from django.template import Context
+from django.utils.html import escape
+from django.utils.http import urlencode
+from django.utils.safestring import SafeString, mark_safe
 from django_components import Component, SlotInput, types
 
 from django_components_bootstrap.components.bootstrap5.types import Size
@@ -263,3 +275,299 @@ class PaginationEllipsis(Component):
             </span>
         </li>
     """
+
+
+def page_window(current: int, num_pages: int, window: int = 2) -> list[int | None]:
+    """
+    Page numbers to link to: `window` pages on each side of `current`, plus the first and
+    last page. `None` marks a gap. A gap of a single page is filled with that page instead.
+    """
+    start = max(current - window, 1)
+    end = min(current + window, num_pages)
+
+    pages: list[int | None] = []
+    if start > 1:
+        pages.append(1)
+        if start > 2:
+            pages.append(2 if start == 3 else None)
+    pages.extend(range(start, end + 1))
+    if end < num_pages:
+        if end < num_pages - 1:
+            pages.append(num_pages - 1 if end == num_pages - 2 else None)
+        pages.append(num_pages)
+    return pages
+
+
+def page_href_prefix(query: QueryDict | None, param: str = "page") -> str:
+    """The query string `query` with `param` moved to the end, without its value."""
+    if query:
+        query = query.copy()
+        query.pop(param, None)
+    encoded = query.urlencode() if query else ""
+    param = urlencode({param: ""})
+    return f"?{encoded}&{param}" if encoded else f"?{param}"
+
+
+def _icon_item(href: str | None, icon: str, label: str) -> str:
+    if href is None:
+        return (
+            '<li class="page-item disabled"><a class="page-link" href="#" tabindex="-1" '
+            f'aria-disabled="true"><span aria-hidden="true">{icon}</span>'
+            f'<span class="visually-hidden">{label}</span></a></li>'
+        )
+    return (
+        f'<li class="page-item"><a class="page-link" href="{href}">'
+        f'<span aria-hidden="true">{icon}</span><span class="visually-hidden">{label}</span></a></li>'
+    )
+
+
+def _render_pages(
+    current: int, num_pages: int, window: int, href_prefix: str, first_last: bool, prev_next: bool
+) -> SafeString:
+    # Same markup as the Pagination* building blocks
+    href_prefix = escape(href_prefix)
+    has_prev = current > 1
+    has_next = current < num_pages
+
+    items = []
+    if first_last:
+        items.append(_icon_item(f"{href_prefix}1" if has_prev else None, "«", "First"))
+    if prev_next:
+        items.append(
+            _icon_item(f"{href_prefix}{current - 1}" if has_prev else None, "‹", "Previous")
+        )
+
+    for number in page_window(current, num_pages, window):
+        if number is None:
+            items.append(
+                '<li class="page-item"><span class="page-link"><span aria-hidden="true">…</span>'
+                '<span class="visually-hidden">More</span></span></li>'
+            )
+        elif number == current:
+            items.append(
+                f'<li class="page-item active"><a class="page-link" href="{href_prefix}{number}" '
+                f'aria-current="page">{number}</a></li>'
+            )
+        else:
+            items.append(
+                f'<li class="page-item"><a class="page-link" href="{href_prefix}{number}">'
+                f"{number}</a></li>"
+            )
+
+    if prev_next:
+        items.append(_icon_item(f"{href_prefix}{current + 1}" if has_next else None, "›", "Next"))
+    if first_last:
+        items.append(_icon_item(f"{href_prefix}{num_pages}" if has_next else None, "»", "Last"))
+    return mark_safe("".join(items))
+
+
+class Paginator(Component):
+    """
+    Page links for a Django `Page`, or for `total` items with `per_page` items per page.
+
+    Links keep the current request's query string and set `param` to the page number.
+    """
+
+    class Kwargs:
+        page: Page | None = None
+        total: int | None = None
+        current: int = 1
+        per_page: int | None = None
+        window: int = 2
+        param: str = "page"
+        query: QueryDict | None = None
+        first_last: bool = True
+        prev_next: bool = True
+        size: Size | None = None
+        attrs: dict | None = None
+        ul_attrs: dict | None = None
+
+    def get_template_data(self, args, kwargs: Kwargs, slots, context: Context):
+        if kwargs.page is not None:
+            current = kwargs.page.number
+            # Cached by Django's Paginator, so `count()` runs at most once
+            num_pages = kwargs.page.paginator.num_pages
+        elif kwargs.total is not None and kwargs.per_page:
+            num_pages = max(ceil(kwargs.total / kwargs.per_page), 1)
+            current = min(max(kwargs.current, 1), num_pages)
+        else:
+            raise ValueError(
+                f"'{self.registered_name}' requires either 'page', or 'total' and 'per_page'"
+            )
+
+        query = kwargs.query
+        if query is None and self.request is not None:
+            query = self.request.GET
+
+        classes = ["pagination"]
+        if kwargs.size:
+            classes.append(f"pagination-{kwargs.size}")
+
+        return {
+            "classes": " ".join(classes),
+            "items": _render_pages(
+                current,
+                num_pages,
+                kwargs.window,
+                page_href_prefix(query, kwargs.param),
+                kwargs.first_last,
+                kwargs.prev_next,
+            ),
+            "attrs": kwargs.attrs,
+            "ul_attrs": kwargs.ul_attrs,
+        }
+
+    template: types.django_html = """
+        {% load component_tags %}
+
+        <nav {% html_attrs attrs defaults:aria-label="Page navigation" %}>
+            <ul {% html_attrs ul_attrs class=classes %}>{{ items }}</ul>
+        </nav>
+    """
+
+
+CURSOR_SALT = "django_components_bootstrap.cursor"
+
+
+class _CursorSerializer:
+    def dumps(self, obj) -> bytes:
+        return DjangoJSONEncoder(separators=(",", ":")).encode(obj).encode("latin-1")
+
+    def loads(self, data: bytes):
+        return signing.JSONSerializer().loads(data)
+
+
+class Cursor(NamedTuple):
+    values: list
+    before: bool = False
+
+
+def encode_cursor(values: Sequence, before: bool = False) -> str:
+    """
+    Encode the ordering values of a row into an opaque, signed cursor. With `before`, the
+    cursor points to the rows preceding that row instead of the rows following it.
+    """
+    return signing.dumps(
+        [list(values), before], salt=CURSOR_SALT, serializer=_CursorSerializer, compress=True
+    )
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        values, before = signing.loads(cursor, salt=CURSOR_SALT, serializer=_CursorSerializer)
+    except (signing.BadSignature, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    return Cursor(values, before)
+
+
+def _ordering_values(row, fields: Sequence[str]) -> list:
+    if isinstance(row, dict):
+        return [row[field] for field in fields]
+    return [getattr(row, field) for field in fields]
+
+
+def _keyset_filter(ordering: Sequence[str], values: Sequence) -> Q:
+    # (a, b) > (x, y) as (a > x) | (a == x & b > y), per field direction
+    q = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        equal = {
+            prev.lstrip("-"): value for prev, value in zip(ordering[:i], values[:i], strict=True)
+        }
+        q |= Q(**equal, **{f"{name}__{lookup}": values[i]})
+    return q
+
+
+class KeysetPage(NamedTuple):
+    rows: list
+    prev_cursor: str | None
+    next_cursor: str | None
+
+
+def keyset_page(
+    queryset: QuerySet, ordering: Sequence[str], cursor: str | None = None, per_page: int = 25
+) -> KeysetPage:
+    """
+    Fetch the page of `queryset` at `cursor` by filtering on the ordering values instead of
+    using an offset. `ordering` must identify rows uniquely (e.g. end with "pk"), and
+    the ordering fields must not be null.
+    """
+    fields = [field.lstrip("-") for field in ordering]
+    position = decode_cursor(cursor) if cursor else None
+    if position and len(position.values) != len(ordering):
+        raise ValueError(f"Invalid cursor for ordering {list(ordering)}: {cursor!r}")
+
+    order = list(ordering)
+    if position and position.before:
+        order = [field[1:] if field.startswith("-") else f"-{field}" for field in order]
+    queryset = queryset.order_by(*order)
+    if position:
+        queryset = queryset.filter(_keyset_filter(order, position.values))
+
+    rows = list(queryset[: per_page + 1])
+    has_more = len(rows) > per_page
+    del rows[per_page:]
+
+    if position and position.before:
+        rows.reverse()
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = position is not None, has_more
+
+    if not rows:
+        return KeysetPage(rows, None, None)
+    return KeysetPage(
+        rows,
+        encode_cursor(_ordering_values(rows[0], fields), before=True) if has_prev else None,
+        encode_cursor(_ordering_values(rows[-1], fields)) if has_next else None,
+    )
+
+
+class CursorPagination(Component):
+    """
+    Previous/next links for cursor (keyset) pagination, from a `KeysetPage` or from
+    `prev_cursor` and `next_cursor`. A link without a cursor is disabled.
+    """
+
+    class Kwargs:
+        page: KeysetPage | None = None
+        prev_cursor: str | None = None
+        next_cursor: str | None = None
+        param: str = "cursor"
+        query: QueryDict | None = None
+        size: Size | None = None
+        attrs: dict | None = None
+        ul_attrs: dict | None = None
+
+    def get_template_data(self, args, kwargs: Kwargs, slots, context: Context):
+        prev_cursor, next_cursor = kwargs.prev_cursor, kwargs.next_cursor
+        if kwargs.page is not None:
+            prev_cursor, next_cursor = kwargs.page.prev_cursor, kwargs.page.next_cursor
+
+        query = kwargs.query
+        if query is None and self.request is not None:
+            query = self.request.GET
+        href_prefix = escape(page_href_prefix(query, kwargs.param))
+
+        classes = ["pagination"]
+        if kwargs.size:
+            classes.append(f"pagination-{kwargs.size}")
+
+        return {
+            "classes": " ".join(classes),
+            "items": mark_safe(
+                _icon_item(f"{href_prefix}{prev_cursor}" if prev_cursor else None, "‹", "Previous")
+                + _icon_item(f"{href_prefix}{next_cursor}" if next_cursor else None, "›", "Next")
+            ),
+            "attrs": kwargs.attrs,
+            "ul_attrs": kwargs.ul_attrs,
+        }
+
+    template: types.django_html = """
+        {% load component_tags %}
+
+        <nav {% html_attrs attrs defaults:aria-label="Page navigation" %}>
+            <ul {% html_attrs ul_attrs class=classes %}>{{ items }}</ul>
+        </nav>
+    """
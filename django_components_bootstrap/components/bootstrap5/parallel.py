@@ -0,0 +1,211 @@
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from threading import Event, Lock
+from time import monotonic
+from weakref import WeakSet
+
+from django.db import connections
+from django.template import Context
+from django.utils import timezone, translation
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeString, mark_safe
+from django_components import Component, registry, types
+
+from django_components_bootstrap.apps import get_setting
+from django_components_bootstrap.components.bootstrap5.placeholder import Placeholder
+from django_components_bootstrap.registry import loaded_components
+
+DEFAULT_PARALLEL_MAX_WORKERS = 4
+# Fragments that timed out but are still running in their thread
+DEFAULT_PARALLEL_MAX_TIMED_OUT = 32
+
+_compile_lock = Lock()
+_compiled: WeakSet[type[Component]] = WeakSet()
+
+_timed_out_lock = Lock()
+_timed_out_running = 0
+
+
+def timed_out_fragments() -> int:
+    """The number of fragments that timed out and are still running in their thread."""
+    return _timed_out_running
+
+
+def _compile_registered_templates() -> None:
+    # django-components compiles a component's template on its first render, which is not
+    # thread-safe, so compile the registered components before rendering in worker threads.
+    # Lazily registered components that were not loaded yet are left alone.
+    with _compile_lock:
+        for component in loaded_components(registry):
+            if component not in _compiled:
+                component._template  # noqa: B018
+                _compiled.add(component)
+
+
+class _Task:
+    __slots__ = (
+        "fragment",
+        "context",
+        "language",
+        "timezone",
+        "started",
+        "start",
+        "running",
+        "timed_out",
+    )
+
+    def __init__(self, fragment: Callable):
+        self.fragment = fragment
+        # The fragment runs in a copy of the caller's context (e.g. an active profile). The
+        # active language and time zone are thread-local in the worker, so they are copied
+        # explicitly.
+        self.context = copy_context()
+        self.language = translation.get_language()
+        self.timezone = timezone.get_current_timezone()
+        self.started = Event()
+        self.start = 0.0
+        self.running = False
+        self.timed_out = False
+
+    def __call__(self):
+        return self.context.run(self._run)
+
+    def _run(self):
+        self._set_running(True)
+        self.start = monotonic()
+        self.started.set()
+        try:
+            with translation.override(self.language), timezone.override(self.timezone):
+                return self.fragment()
+        finally:
+            # Worker threads are not reused across requests, so close their connections
+            connections.close_all()
+            self._set_running(False)
+
+    def _set_running(self, running: bool) -> None:
+        global _timed_out_running
+        with _timed_out_lock:
+            self.running = running
+            if self.timed_out:
+                _timed_out_running += 1 if running else -1
+
+    def time_out(self) -> None:
+        global _timed_out_running
+        with _timed_out_lock:
+            self.timed_out = True
+            if self.running:
+                _timed_out_running += 1
+
+    def result(self, future: Future, timeout: float | None):
+        if timeout is None:
+            return future.result()
+        if not self.started.wait(timeout):
+            future.cancel()
+            raise FutureTimeoutError
+        return future.result(timeout=max(self.start + timeout - monotonic(), 0))
+
+
+def default_fallback() -> SafeString:
+    return Placeholder.render(
+        kwargs={"as_": "div", "xs": 12, "animation": "glow", "attrs": {"aria-hidden": "true"}},
+        deps_strategy="ignore",
+    )
+
+
+def render_fragments(
+    fragments: list,
+    max_workers: int | None = None,
+    timeout: float | None = None,
+    fallback: Callable | str | None = None,
+) -> list[SafeString]:
+    """
+    Call the callables in `fragments` concurrently in a thread pool and return their
+    results in order. Strings are returned as they are.
+
+    A fragment that has not finished `timeout` seconds after it started (or that could not
+    start within `timeout` seconds) is replaced by `fallback`, a `Placeholder` by default.
+    It keeps running in its thread until it returns. While `PARALLEL_MAX_TIMED_OUT` of
+    those are running, fragments with a `timeout` are replaced by `fallback` right away.
+    """
+
+    def fallback_html():
+        return conditional_escape(
+            (fallback() if callable(fallback) else fallback) or default_fallback()
+        )
+
+    tasks = [_Task(fragment) if callable(fragment) else fragment for fragment in fragments]
+    callables = [task for task in tasks if isinstance(task, _Task)]
+    if not callables:
+        return [conditional_escape(fragment) for fragment in fragments]
+    if timeout is not None and _timed_out_running >= get_setting(
+        "PARALLEL_MAX_TIMED_OUT", DEFAULT_PARALLEL_MAX_TIMED_OUT
+    ):
+        return [
+            fallback_html() if isinstance(task, _Task) else conditional_escape(task)
+            for task in tasks
+        ]
+
+    _compile_registered_templates()
+    max_workers = max_workers or get_setting("PARALLEL_MAX_WORKERS", DEFAULT_PARALLEL_MAX_WORKERS)
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(callables)), thread_name_prefix="bootstrap-parallel"
+    )
+    try:
+        futures = [executor.submit(task) if isinstance(task, _Task) else None for task in tasks]
+        results = []
+        for task, future in zip(tasks, futures, strict=True):
+            if future is None:
+                results.append(conditional_escape(task))
+                continue
+            try:
+                results.append(conditional_escape(task.result(future, timeout)))
+            except FutureTimeoutError:
+                task.time_out()
+                results.append(fallback_html())
+        return results
+    finally:
+        # Don't wait for fragments that timed out
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ParallelGroup(Component):
+    """
+    Renders independent fragments (callables returning HTML, e.g. `Card.render` calls with
+    slow data sources) concurrently, and joins them in order inside a container component.
+    """
+
+    class Kwargs:
+        fragments: list
+        as_: str | type[Component] = "Row"
+        max_workers: int | None = None
+        timeout: float | None = None
+        fallback: Callable | str | None = None
+        container_kwargs: dict | None = None
+        attrs: dict | None = None
+
+    class Slots:
+        pass
+
+    def get_template_data(self, args, kwargs: Kwargs, slots, context: Context):
+        results = render_fragments(
+            kwargs.fragments, kwargs.max_workers, kwargs.timeout, kwargs.fallback
+        )
+
+        container = kwargs.as_
+        if isinstance(container, str):
+            container = registry.get(container)
+
+        return {
+            "html": container.render(
+                kwargs={**(kwargs.container_kwargs or {}), "attrs": kwargs.attrs},
+                slots={"default": mark_safe("".join(results))},
+                context=context,
+                deps_strategy="ignore",
+            ),
+        }
+
+    template: types.django_html = """
+        {{ html }}
+    """
@@ -1,10 +1,12 @@
 from django.template import Context
+from django.utils.html import conditional_escape
 from django_components import Component, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import FastRenderMixin, html_attrs
 from django_components_bootstrap.components.bootstrap5.types import BgColor, Size, Variant
 
 
-class Placeholder(Component):
+class Placeholder(FastRenderMixin, Component):
     class Kwargs:
         as_: str = "span"
         size: Size | None = None
@@ -43,8 +45,13 @@ class Placeholder(Component):
         <{{ tag }} {% html_attrs attrs class=classes %}></{{ tag }}>
     """
 
+    def render_fast(self, context: Context) -> str:
+        tag = conditional_escape(context["tag"])
+        attrs = html_attrs(context["attrs"], {"class": context["classes"]})
+        return f" <{tag} {attrs}></{tag}> "
 
-class PlaceholderButton(Component):
+
+class PlaceholderButton(FastRenderMixin, Component):
     class Kwargs:
         variant: Variant = "primary"
         xs: int | None = None
@@ -69,3 +76,11 @@ class PlaceholderButton(Component):
 
         <button {% html_attrs attrs class=classes disabled=True defaults:aria-hidden="true" %}></button>
     """
+
+    def render_fast(self, context: Context) -> str:
+        attrs = html_attrs(
+            context["attrs"],
+            {"class": context["classes"], "disabled": True},
+            defaults={"aria-hidden": "true"},
+        )
+        return f" <button {attrs}></button> "
@@ -0,0 +1,232 @@
+from functools import cache
+from hashlib import md5
+from itertools import count
+from typing import ClassVar, TypeVar
+
+from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template
+from django.utils.html import conditional_escape, format_html
+from django.utils.safestring import SafeString, mark_safe
+from django_components import format_attributes, merge_attributes
+from django_components.attributes import normalize_class, normalize_style
+from django_components.context import _INJECT_CONTEXT_KEY_PREFIX
+
+from django_components_bootstrap.apps import get_setting
+from django_components_bootstrap.components.bootstrap5.types import NOT_PROVIDED
+from django_components_bootstrap.encoding import stable_json
+
+ID_SCOPE = "_bootstrap_id_scope"
+ID_STRATEGIES = ("render", "counter", "hash")
+
+# django-components copies context variables with this prefix (the one used by `{% provide %}`)
+# into slot fills and isolated component contexts, so children see them wherever they render
+PARENT_CONTEXT_PREFIX = f"{_INJECT_CONTEXT_KEY_PREFIX}bootstrap_"
+
+_REQUIRED = object()
+
+# Value of the attributes of an `AttrsRenderer` that are given on each call
+DYNAMIC = object()
+
+# `merge_attributes()` puts the merged class and style after the other attributes
+_MERGED_LAST = {"class": 1, "style": 2}
+
+T = TypeVar("T", bound="ParentContext")
+
+
+def fast_render_enabled() -> bool:
+    return get_setting("FAST_RENDER", False)
+
+
+def html_attrs(attrs: dict | None, extra: dict, defaults: dict | None = None) -> SafeString:
+    # Same merge order as `{% html_attrs attrs defaults:... key=value %}`
+    final_attrs = {**defaults, **attrs} if defaults and attrs else attrs or defaults or {}
+    return format_attributes(merge_attributes(final_attrs, extra))
+
+
+def _format_attribute(key: str, value) -> str:
+    # One attribute as rendered by `format_attributes(merge_attributes(...))`
+    if key == "class":
+        value = normalize_class([value])
+    elif key == "style":
+        value = normalize_style([value])
+    if value is None or value is False:
+        return ""
+    if value is True:
+        return conditional_escape(key)
+    return format_html('{}="{}"', key, value)
+
+
+class AttrsRenderer:
+    """
+    A precomputed `{% html_attrs attrs defaults:... key=value %}`, created once per component.
+    The constant attributes in `extra` and `defaults` are escaped once, the ones set to
+    `DYNAMIC` are passed in `values` on each call. The user `attrs` are only merged when they
+    are not empty. The output is byte-identical to `html_attrs()`.
+    """
+
+    __slots__ = ("extra", "defaults", "_static", "_parts")
+
+    def __init__(self, extra: dict | None = None, defaults: dict | None = None):
+        self.extra = extra or {}
+        self.defaults = defaults or {}
+        if overlap := self.extra.keys() & self.defaults.keys():
+            raise ValueError(f"Attributes given as both extra and default: {sorted(overlap)}")
+
+        attributes = sorted(
+            {**self.defaults, **self.extra}.items(), key=lambda item: _MERGED_LAST.get(item[0], 0)
+        )
+        # Constant attributes as strings, dynamic ones as `(key, escaped key)`
+        self._parts = []
+        for key, value in attributes:
+            if value is DYNAMIC:
+                self._parts.append((key, conditional_escape(key)))
+            elif html := _format_attribute(key, value):
+                if self._parts and isinstance(self._parts[-1], str):
+                    self._parts[-1] += " " + html
+                else:
+                    self._parts.append(html)
+        dynamic = any(isinstance(part, tuple) for part in self._parts)
+        self._static = None if dynamic else mark_safe(" ".join(self._parts))
+
+    def __call__(self, attrs: dict | None = None, values: dict | None = None) -> SafeString:
+        if attrs:
+            return html_attrs(
+                attrs, self._resolve(self.extra, values), self._resolve(self.defaults, values)
+            )
+        if self._static is not None:
+            return self._static
+
+        rendered = []
+        for part in self._parts:
+            if isinstance(part, str):
+                rendered.append(part)
+                continue
+            key, escaped_key = part
+            value = values[key]
+            if key in _MERGED_LAST:
+                rendered.append(_format_attribute(key, value))
+            elif value is True:
+                rendered.append(escaped_key)
+            elif value is not None and value is not False:
+                rendered.append(f'{escaped_key}="{conditional_escape(value)}"')
+        return mark_safe(" ".join(filter(None, rendered)))
+
+    @staticmethod
+    def _resolve(attributes: dict, values: dict | None) -> dict:
+        return {
+            key: values[key] if value is DYNAMIC else value for key, value in attributes.items()
+        }
+
+
+class ParentContext:
+    """
+    Data that a component passes to the components inside it. Cheaper than `{% provide %}`,
+    which creates a named tuple class per render. Subclasses set `key` and `__slots__`.
+    """
+
+    __slots__ = ()
+    key: ClassVar[str]
+
+
+def provide(data: ParentContext) -> dict:
+    """Template data that makes `data` available to `inject()` in the component's children."""
+    return {PARENT_CONTEXT_PREFIX + data.key: data}
+
+
+def inject(component, cls: type[T], default=_REQUIRED) -> T:
+    """
+    The `cls` data provided by the closest parent, like `Component.inject()`. Without a
+    default, raises the same `KeyError` when there is no such parent.
+    """
+    data = component.context.get(PARENT_CONTEXT_PREFIX + cls.key, NOT_PROVIDED)
+    if data is not NOT_PROVIDED:
+        return data
+    if default is not _REQUIRED:
+        return default
+    raise KeyError(
+        f"Component '{component.name}' tried to inject a variable '{cls.key}' before it was"
+        f" provided. To fix this, make sure that at least one ancestor of component"
+        f" '{component.name}' has the variable '{cls.key}' in their 'provide' attribute."
+    )
+
+
+class IdScope(ParentContext):
+    """Generates the ids of the components inside it, e.g. of a `CachedFragment`."""
+
+    __slots__ = ("prefix", "_counter")
+    key = "id_scope"
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._counter = count(1)
+
+    def next_id(self) -> str:
+        return f"{self.prefix}{next(self._counter)}"
+
+
+def _encode_kwargs(name: str, kwargs: dict) -> str | None:
+    # None for kwargs without a stable encoding, e.g. objects that only have a default repr.
+    # Querysets aren't encoded either, as that would run their query.
+    try:
+        return stable_json([name, kwargs])
+    except (TypeError, ValueError):
+        return None
+
+
+def html_id(component, name: str, attrs: dict | None) -> str:
+    """
+    The `id` from `attrs`, or a generated `{name}-{suffix}` id. The suffix comes from the
+    enclosing id scope (e.g. of a `CachedFragment`), or from the `ID_STRATEGY` setting. The
+    "hash" strategy falls back to the counter for kwargs that can't be encoded as JSON.
+    """
+    if attrs and attrs.get("id"):
+        return attrs["id"]
+    scope = inject(component, IdScope, None)
+    if scope is not None:
+        return f"{name}-{scope.next_id()}"
+
+    strategy = get_setting("ID_STRATEGY", "render")
+    if strategy == "render":
+        return f"{name}-{component.id}"
+    if strategy not in ID_STRATEGIES:
+        raise ImproperlyConfigured(
+            f"ID_STRATEGY must be one of {', '.join(ID_STRATEGIES)}, not {strategy!r}"
+        )
+
+    # The root dict of the render context is shared by all components of one template
+    # render, including isolated ones.
+    state = component.context.render_context.dicts[0]
+    encoded = _encode_kwargs(name, component.raw_kwargs) if strategy == "hash" else None
+    if encoded is None:
+        scope = state.get(ID_SCOPE)
+        if scope is None:
+            scope = state[ID_SCOPE] = IdScope("")
+        return f"{name}-{scope.next_id()}"
+
+    digest = md5(encoded.encode(), usedforsecurity=False).hexdigest()[:7]
+    seen = state.setdefault(f"{ID_SCOPE}_hashes", {})
+    seen[digest] = occurrence = seen.get(digest, 0) + 1
+    return f"{name}-{digest}" if occurrence == 1 else f"{name}-{digest}-{occurrence}"
+
+
+@cache
+def _slot_template(name: str) -> Template:
+    return Template(f'{{% load component_tags %}}{{% slot "{name}" / %}}')
+
+
+def render_slot(context: Context, name: str = "default") -> SafeString:
+    return _slot_template(name).render(context)
+
+
+class FastRenderMixin:
+    """
+    Renders the component with `render_fast(context)` instead of its template when the
+    `FAST_RENDER` setting is enabled. Components using the mixin define `render_fast()`,
+    whose output must be byte-identical to the template minified by `minify_template()`,
+    so that it doesn't depend on the template's indentation.
+    """
+
+    def on_render(self, context: Context, template: Template | None):
+        if fast_render_enabled():
+            return self.render_fast(context)
+        return super().on_render(context, template)
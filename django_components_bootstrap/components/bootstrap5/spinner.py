@@ -1,10 +1,12 @@
 from django.template import Context
+from django.utils.html import conditional_escape
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import FastRenderMixin, html_attrs
 from django_components_bootstrap.components.bootstrap5.types import Size, SpinnerVariant, Variant
 
 
-class Spinner(Component):
+class Spinner(FastRenderMixin, Component):
     class Kwargs:
         animation: SpinnerVariant = "border"
         size: Size | None = None
@@ -38,3 +40,8 @@ class Spinner(Component):
             <span class="visually-hidden">{{ label }}</span>
         </div>
     """
+
+    def render_fast(self, context: Context) -> str:
+        attrs = html_attrs(context["attrs"], {"class": context["classes"], "role": "status"})
+        label = conditional_escape(context["label"])
+        return f' <div {attrs}><span class="visually-hidden">{label}</span></div> '
@@ -0,0 +1,96 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from uuid import uuid4
+
+from django.template import Context, Template
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+
+from django_components_bootstrap.components.bootstrap5.rendering import PARENT_CONTEXT_PREFIX
+
+DEFAULT_STREAM_CHUNK_SIZE = 50
+# Rows fetched per database query when reading a queryset with `iterator()`
+DEFAULT_QUERYSET_CHUNK_SIZE = 2000
+
+
+class StreamingMixin:
+    """
+    Adds `stream()` to container components: the component is rendered around a marker,
+    then its opening markup, the children and its closing markup are yielded as separate
+    chunks, e.g. for a `StreamingHttpResponse`.
+
+    Data that the component provides to its children (see `rendering.provide()`) is
+    provided to the children rendered from `item_template` as well.
+    """
+
+    # The slot that the streamed items are rendered into
+    stream_slot = "default"
+
+    @classmethod
+    def stream(
+        cls,
+        items: Iterable,
+        item_template: str | Template | None = None,
+        *,
+        kwargs: dict | None = None,
+        context: dict | None = None,
+        request=None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """
+        Yield the rendered component in chunks.
+
+        Without `item_template`, `items` are HTML strings, escaped unless marked safe.
+        Otherwise each item is rendered with `item_template`, which has access to `context`
+        and `item`. A template string is compiled with the `component_tags` library loaded.
+        """
+        marker = f"<!--djc-stream-{uuid4().hex}-->"
+        provided = {}
+
+        def fill(ctx):
+            provided.update(
+                (key, value)
+                for key, value in ctx.context.flatten().items()
+                if key.startswith(PARENT_CONTEXT_PREFIX)
+            )
+            return mark_safe(marker)
+
+        html = cls.render(
+            kwargs=kwargs,
+            slots={cls.stream_slot: fill},
+            context=context,
+            request=request,
+            deps_strategy="document",
+        )
+        head, tail = html.split(marker)
+        yield head
+
+        if item_template is not None:
+            items = _render_items(provided, item_template, items, context)
+        else:
+            items = cls.stream_items(items, kwargs or {})
+
+        yield from iter_chunks(items, chunk_size)
+        yield tail
+
+    @classmethod
+    def stream_items(cls, items: Iterable, kwargs: dict) -> Iterable[str]:
+        """Turn `items` into HTML strings when `stream()` is called without `item_template`."""
+        return map(conditional_escape, items)
+
+
+def iter_chunks(strings: Iterable[str], chunk_size: int) -> Iterator[str]:
+    strings = iter(strings)
+    while batch := list(islice(strings, chunk_size)):
+        yield "".join(batch)
+
+
+def _render_items(provided, item_template, items, context) -> Iterator[str]:
+    if isinstance(item_template, Template):
+        template = item_template
+    else:
+        template = Template(f"{{% load component_tags %}}{item_template}")
+    item_context = Context({**(context or {}), **provided})
+    for item in items:
+        with item_context.push(item=item):
+            yield template.render(item_context)
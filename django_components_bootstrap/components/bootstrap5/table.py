@@ -1,13 +1,57 @@
+from collections.abc import Callable, Iterable, Iterator
+from operator import attrgetter, itemgetter
+
+from django.db.models import QuerySet
 from django.template import Context
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.classes import class_resolver
+from django_components_bootstrap.components.bootstrap5.streaming import (
+    DEFAULT_QUERYSET_CHUNK_SIZE,
+    StreamingMixin,
+)
 from django_components_bootstrap.components.bootstrap5.types import (
     ResponsiveBreakpoint,
     Variant,
 )
 
 
-class Table(Component):
+@class_resolver("Table")
+def _table_classes(
+    striped, striped_columns, bordered, borderless, hover, small, variant, caption_top, responsive
+):
+    classes = ["table"]
+
+    if striped:
+        classes.append("table-striped")
+    if striped_columns:
+        classes.append("table-striped-columns")
+    if bordered:
+        classes.append("table-bordered")
+    if borderless:
+        classes.append("table-borderless")
+    if hover:
+        classes.append("table-hover")
+    if small:
+        classes.append("table-sm")
+    if variant:
+        classes.append(f"table-{variant}")
+    if caption_top:
+        classes.append("caption-top")
+
+    responsive_class = None
+    if responsive is not None:
+        if responsive is True:
+            responsive_class = "table-responsive"
+        else:
+            responsive_class = f"table-responsive-{responsive}"
+
+    return " ".join(classes), responsive_class
+
+
+class Table(StreamingMixin, Component):
     class Kwargs:
         striped: bool = False
         striped_columns: bool = False
@@ -24,38 +68,139 @@ class Table(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        classes = ["table"]
-
-        if kwargs.striped:
-            classes.append("table-striped")
-        if kwargs.striped_columns:
-            classes.append("table-striped-columns")
-        if kwargs.bordered:
-            classes.append("table-bordered")
-        if kwargs.borderless:
-            classes.append("table-borderless")
-        if kwargs.hover:
-            classes.append("table-hover")
-        if kwargs.small:
-            classes.append("table-sm")
-        if kwargs.variant:
-            classes.append(f"table-{kwargs.variant}")
-        if kwargs.caption_top:
-            classes.append("caption-top")
-
-        responsive_class = None
-        if kwargs.responsive is not None:
-            if kwargs.responsive is True:
-                responsive_class = "table-responsive"
-            else:
-                responsive_class = f"table-responsive-{kwargs.responsive}"
+        classes, responsive_class = _table_classes(
+            kwargs.striped,
+            kwargs.striped_columns,
+            kwargs.bordered,
+            kwargs.borderless,
+            kwargs.hover,
+            kwargs.small,
+            kwargs.variant,
+            kwargs.caption_top,
+            kwargs.responsive,
+        )
+
+        return {
+            "classes": classes,
+            "responsive_class": responsive_class,
+            "attrs": kwargs.attrs,
+        }
+
+    template: types.django_html = """
+        {% load component_tags %}
+
+        {% if responsive_class %}
+            <div class="{{ responsive_class }}">
+                <table {% html_attrs attrs class=classes %}>
+                    {% slot "default" / %}
+                </table>
+            </div>
+        {% else %}
+            <table {% html_attrs attrs class=classes %}>
+                {% slot "default" / %}
+            </table>
+        {% endif %}
+    """
+
+
+def _column(column) -> tuple[str, str]:
+    if isinstance(column, str):
+        return column, column
+    key, header = column
+    return key, header
+
+
+def _row_getter(row, keys: list[str]) -> Callable:
+    if isinstance(row, dict):
+        getter = itemgetter(*keys)
+    elif isinstance(row, (tuple, list)):
+        getter = itemgetter(*range(len(keys)))
+    else:
+        getter = attrgetter(*keys)
+
+    if len(keys) == 1:
+        return lambda row: (getter(row),)
+    return getter
+
+
+def _cell(value) -> str:
+    return "" if value is None else conditional_escape(value)
+
+
+def iter_table_rows(
+    keys: list[str], rows: Iterable, chunk_size: int | None = DEFAULT_QUERYSET_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Yield one `<tr>` string per row. Rows may be dicts, tuples/lists (in column order) or
+    objects; the cell getter is built once from the first row. Querysets are read with
+    `iterator(chunk_size=...)` so model instances are not cached. This runs a new query even
+    if the queryset was already evaluated; pass `chunk_size=0` to iterate it as is.
+    """
+    if isinstance(rows, QuerySet) and chunk_size:
+        rows = rows.iterator(chunk_size=chunk_size)
+
+    getter = None
+    for row in rows:
+        if getter is None:
+            getter = _row_getter(row, keys)
+        yield f"<tr><td>{'</td><td>'.join(map(_cell, getter(row)))}</td></tr>"
+
+
+class DataTable(StreamingMixin, Component):
+    """
+    Renders `rows` as a table with a column per entry of `columns`. `render()` builds the
+    whole table body at once; use `stream()` to send the rows in chunks.
+    """
+
+    stream_slot = "body"
+
+    class Kwargs:
+        columns: list
+        rows: Iterable = ()
+        chunk_size: int | None = DEFAULT_QUERYSET_CHUNK_SIZE
+        striped: bool = False
+        striped_columns: bool = False
+        bordered: bool = False
+        borderless: bool = False
+        hover: bool = False
+        small: bool = False
+        variant: Variant | None = None
+        responsive: ResponsiveBreakpoint | None = None
+        caption_top: bool = False
+        attrs: dict | None = None
+
+    class Slots:
+        default: SlotInput | None = None
+        body: SlotInput | None = None
+
+    def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
+        classes, responsive_class = _table_classes(
+            kwargs.striped,
+            kwargs.striped_columns,
+            kwargs.bordered,
+            kwargs.borderless,
+            kwargs.hover,
+            kwargs.small,
+            kwargs.variant,
+            kwargs.caption_top,
+            kwargs.responsive,
+        )
+        columns = [_column(column) for column in kwargs.columns]
+        keys = [key for key, _ in columns]
 
         return {
-            "classes": " ".join(classes),
+            "classes": classes,
             "responsive_class": responsive_class,
+            "headers": [header for _, header in columns],
+            "body": mark_safe("".join(iter_table_rows(keys, kwargs.rows, kwargs.chunk_size))),
             "attrs": kwargs.attrs,
         }
 
+    @classmethod
+    def stream_items(cls, items: Iterable, kwargs: dict) -> Iterator[str]:
+        keys = [_column(column)[0] for column in kwargs["columns"]]
+        return iter_table_rows(keys, items, kwargs.get("chunk_size", DEFAULT_QUERYSET_CHUNK_SIZE))
+
     template: types.django_html = """
         {% load component_tags %}
 
@@ -63,11 +208,15 @@ class Table(Component):
             <div class="{{ responsive_class }}">
                 <table {% html_attrs attrs class=classes %}>
                     {% slot "default" / %}
+                    <thead><tr>{% for header in headers %}<th scope="col">{{ header }}</th>{% endfor %}</tr></thead>
+                    <tbody>{% slot "body" %}{{ body }}{% endslot %}</tbody>
                 </table>
             </div>
         {% else %}
             <table {% html_attrs attrs class=classes %}>
                 {% slot "default" / %}
+                <thead><tr>{% for header in headers %}<th scope="col">{{ header }}</th>{% endfor %}</tr></thead>
+                <tbody>{% slot "body" %}{{ body }}{% endslot %}</tbody>
             </table>
         {% endif %}
     """
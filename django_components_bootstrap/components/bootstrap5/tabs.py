@@ -1,17 +1,97 @@
-from typing import NamedTuple
-
 from django.template import Context
-from django.utils.safestring import mark_safe
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeString, mark_safe
 from django.utils.text import slugify
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.nav import _nav_classes, _nav_link_classes
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    DYNAMIC,
+    AttrsRenderer,
+    ParentContext,
+    html_attrs,
+    html_id,
+    inject,
+    provide,
+)
 from django_components_bootstrap.components.bootstrap5.types import NOT_PROVIDED, NavVariant
 
 
-class TabContext(NamedTuple):
-    id: str
-    tab_data: list[dict]
-    enabled: bool
+class TabData:
+    """
+    A tab rendered by `Tabs`, collected from its `Tab` children or `items`. Use
+    `TabData.create()` to build the same tabs from Python.
+    """
+
+    __slots__ = ("nav_tab_id", "pane_id", "tab_id", "title", "content", "is_active", "disabled")
+
+    def __init__(
+        self,
+        nav_tab_id: str,
+        pane_id: str,
+        tab_id: str,
+        title: str,
+        content: str = "",
+        is_active: bool = False,
+        disabled: bool = False,
+    ):
+        self.nav_tab_id = nav_tab_id
+        self.pane_id = pane_id
+        self.tab_id = tab_id
+        self.title = title
+        self.content = content
+        self.is_active = is_active
+        self.disabled = disabled
+
+    @classmethod
+    def create(
+        cls,
+        tabs_id: str,
+        title: str,
+        content: str = "",
+        tab_id: str | None = None,
+        index: int = 0,
+        active: bool = False,
+        disabled: bool = False,
+    ) -> "TabData":
+        """The tab that `{% component "Tab" %}` renders as the `index`th tab of `tabs_id`."""
+        tab_id = tab_id or slugify(title) or f"tab-{index}"
+        tabs_slug = slugify(tabs_id)
+        return cls(
+            f"{tabs_slug}-tab-{tab_id}",
+            f"{tabs_slug}-pane-{tab_id}",
+            tab_id,
+            title,
+            content,
+            active,
+            disabled,
+        )
+
+    @property
+    def aria_selected(self) -> str:
+        return "true" if self.is_active else "false"
+
+
+class TabContext(ParentContext):
+    __slots__ = ("id", "tab_data", "enabled")
+    key = "_tabs"
+
+    def __init__(self, id: str, tab_data: list[TabData], enabled: bool):
+        self.id = id
+        self.tab_data = tab_data
+        self.enabled = enabled
+
+
+# Provided by each `Tab`, so that nested `Tab`s raise. Never collects tabs.
+_NESTED_TABS = TabContext("", [], False)
+
+
+class TabContainerContext(ParentContext):
+    __slots__ = ("id",)
+    key = "tab_container"
+
+    def __init__(self, id: str):
+        self.id = id
 
 
 class TabContainer(Component):
@@ -22,21 +102,19 @@ class TabContainer(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        container_id = (kwargs.attrs or {}).get("id") or f"tab-container-{self.id}"
+        container_id = html_id(self, "tab-container", kwargs.attrs)
 
         return {
-            "container_id": container_id,
             "attrs": kwargs.attrs or {},
+            **provide(TabContainerContext(container_id)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "tab_container" id=container_id %}
-            <div {% html_attrs attrs %}>
-                {% slot "default" / %}
-            </div>
-        {% endprovide %}
+        <div {% html_attrs attrs %}>
+            {% slot "default" / %}
+        </div>
     """
 
 
@@ -95,62 +173,30 @@ class TabPane(Component):
     """
 
 
-class TabsRenderer(Component):
-    class Kwargs:
-        tabs_id: str
-        variant: NavVariant
-        fill: bool
-        justified: bool
-        tab_data: list[dict]
-        attrs: dict | None
-
-    def get_template_data(self, args, kwargs: Kwargs, slots, context: Context):
-        return {
-            "tabs_id": kwargs.tabs_id,
-            "variant": kwargs.variant,
-            "fill": kwargs.fill,
-            "justified": kwargs.justified,
-            "tab_data": kwargs.tab_data,
-            "attrs": kwargs.attrs or {},
-        }
-
-    template: types.django_html = """
-        {% load component_tags %}
-
-        <div {% html_attrs attrs %}>
-            {% component "Nav" variant=variant fill=fill justified=justified as_="ul" attrs:id=tabs_id attrs:role="tablist" %}
-                {% for tab in tab_data %}
-                    {% component "NavItem" as_="li" attrs:role="presentation" %}
-                        {% component "NavLink" as_="button" active=tab.is_active disabled=tab.disabled attrs:id=tab.nav_tab_id attrs:data-bs-toggle="tab" attrs:data-bs-target="#{{ tab.pane_id }}" attrs:role="tab" attrs:aria-controls=tab.pane_id attrs:aria-selected=tab.aria_selected %}
-                            {{ tab.title }}
-                        {% endcomponent %}
-                    {% endcomponent %}
-                {% endfor %}
-            {% endcomponent %}
-            {% component "TabContent" %}
-                {% for tab in tab_data %}
-                    {% component "TabPane" active=tab.is_active attrs:id=tab.pane_id attrs:aria-labelledby=tab.nav_tab_id %}
-                        {{ tab.content }}
-                    {% endcomponent %}
-                {% endfor %}
-            {% endcomponent %}
-        </div>
+class Tabs(Component):
+    """
+    Collects its `Tab` children into a tab list and panes. Tabs can also be given as
+    `items`, dicts with a `Tab`'s kwargs plus `content`, which render the same markup
+    without a component per tab. They come before any `Tab` children.
     """
 
-
-class Tabs(Component):
     class Kwargs:
         variant: NavVariant = "tabs"
         fill: bool = False
         justified: bool = False
+        items: list[dict] | None = None
         attrs: dict | None = None
 
     class Slots:
-        default: SlotInput
+        default: SlotInput | None = None
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        tabs_id = (kwargs.attrs or {}).get("id") or f"tabs-{self.id}"
-        tab_data: list[dict] = []
+        tabs_id = html_id(self, "tabs", kwargs.attrs)
+        tab_data: list[TabData] = []
+        for index, item in enumerate(kwargs.items or ()):
+            tab = TabData.create(tabs_id, index=index, **item)
+            tab.content = conditional_escape(tab.content)
+            tab_data.append(tab)
 
         return {
             "tabs_id": tabs_id,
@@ -159,34 +205,93 @@ class Tabs(Component):
             "justified": kwargs.justified,
             "tab_data": tab_data,
             "attrs": kwargs.attrs or {},
+            **provide(TabContext(tabs_id, tab_data, True)),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "_tabs" id=tabs_id tab_data=tab_data enabled=True %}
-            {% slot "default" / %}
-        {% endprovide %}
+        {% slot "default" / %}
     """
 
     def on_render_after(self, context, template, content):
-        tab_data: list[dict] = context["tab_data"]
-
-        if tab_data and not any(tab["is_active"] for tab in tab_data):
-            tab_data[0]["is_active"] = True
-            tab_data[0]["aria_selected"] = "true"
-
-        return TabsRenderer.render(
-            kwargs={
-                "tabs_id": context["tabs_id"],
-                "variant": context["variant"],
-                "fill": context["fill"],
-                "justified": context["justified"],
-                "tab_data": tab_data,
-                "attrs": context["attrs"],
+        if content is None:
+            # Rendering failed, keep the error
+            return None
+        tab_data: list[TabData] = context["tab_data"]
+
+        if tab_data and not any(tab.is_active for tab in tab_data):
+            tab_data[0].is_active = True
+
+        return _render_tabs(
+            context["tabs_id"],
+            context["variant"],
+            context["fill"],
+            context["justified"],
+            tab_data,
+            context["attrs"],
+        )
+
+
+_TAB_LINK_ATTRS = AttrsRenderer(
+    {"class": DYNAMIC, "disabled": DYNAMIC},
+    defaults={
+        "type": "button",
+        "id": DYNAMIC,
+        "data-bs-toggle": "tab",
+        "data-bs-target": DYNAMIC,
+        "role": "tab",
+        "aria-controls": DYNAMIC,
+        "aria-selected": DYNAMIC,
+    },
+)
+_TAB_PANE_ATTRS = AttrsRenderer(
+    {"class": DYNAMIC},
+    defaults={"role": "tabpanel", "tabindex": "0", "id": DYNAMIC, "aria-labelledby": DYNAMIC},
+)
+_TAB_NAV_ATTRS = AttrsRenderer({"class": DYNAMIC}, defaults={"role": "tablist", "id": DYNAMIC})
+
+
+def _render_tabs(tabs_id, variant, fill, justified, tab_data, attrs) -> SafeString:
+    # Same markup as a Nav of NavLinks followed by a TabContent of TabPanes, built in a single
+    # pass over the collected tabs
+    nav_items = []
+    panes = []
+    for tab in tab_data:
+        is_active = tab.is_active
+        link_attrs = _TAB_LINK_ATTRS(
+            None,
+            {
+                "class": _nav_link_classes(is_active, tab.disabled),
+                "disabled": True if tab.disabled else None,
+                "id": tab.nav_tab_id,
+                "data-bs-target": f"#{tab.pane_id}",
+                "aria-controls": tab.pane_id,
+                "aria-selected": tab.aria_selected,
+            },
+        )
+        nav_items.append(
+            f'<li role="presentation" class="nav-item"><button {link_attrs}>'
+            f"{conditional_escape(tab.title)}</button></li>"
+        )
+
+        pane_attrs = _TAB_PANE_ATTRS(
+            None,
+            {
+                "class": "tab-pane fade show active" if is_active else "tab-pane fade",
+                "id": tab.pane_id,
+                "aria-labelledby": tab.nav_tab_id,
             },
-            render_dependencies=False,
         )
+        panes.append(f"<div {pane_attrs}>{tab.content}</div>")
+
+    nav_attrs = _TAB_NAV_ATTRS(
+        None, {"class": _nav_classes(variant, fill, justified, False), "id": tabs_id}
+    )
+    return mark_safe(
+        f"<div {html_attrs(attrs, {})}><ul {nav_attrs}>{''.join(nav_items)}</ul>"
+        f'<div class="tab-content">{"".join(panes)}</div></div>'
+    )
 
 
 class Tab(Component):
@@ -200,7 +305,7 @@ class Tab(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        tabs_ctx: TabContext = self.inject("_tabs", NOT_PROVIDED)
+        tabs_ctx = inject(self, TabContext, NOT_PROVIDED)
         if tabs_ctx is NOT_PROVIDED:
             raise RuntimeError(
                 f"'{self.registered_name}' must be used as a child of 'Tabs' component"
@@ -211,45 +316,32 @@ class Tab(Component):
                 f"'{self.registered_name}' must be a direct child of 'Tabs' component"
             )
 
-        tab_index = len(tabs_ctx.tab_data)
-        tab_id = kwargs.tab_id or slugify(kwargs.title) or f"tab-{tab_index}"
-        slugs = (slugify(tabs_ctx.id), tab_id)
-        nav_tab_id = f"{slugs[0]}-tab-{slugs[1]}"
-        pane_id = f"{slugs[0]}-pane-{slugs[1]}"
+        tab = TabData.create(
+            tabs_ctx.id,
+            kwargs.title,
+            tab_id=kwargs.tab_id,
+            index=len(tabs_ctx.tab_data),
+            active=kwargs.active,
+            disabled=kwargs.disabled,
+        )
 
         return {
             "parent_tabs": tabs_ctx.tab_data,
-            "nav_tab_id": nav_tab_id,
-            "pane_id": pane_id,
-            "tab_id": tab_id,
-            "title": kwargs.title,
-            "active": kwargs.active,
-            "disabled": kwargs.disabled,
-            "empty_tab_data": [],
+            "tab": tab,
+            **provide(_NESTED_TABS),
         }
 
     template: types.django_html = """
         {% load component_tags %}
 
-        {% provide "_tabs" id="" tab_data=empty_tab_data enabled=False %}
-            {% slot "default" / %}
-        {% endprovide %}
+        {% slot "default" / %}
     """
 
     def on_render_after(self, context, template, content):
-        parent_tabs: list[dict] = context["parent_tabs"]
-        is_active = context["active"]
-
-        parent_tabs.append(
-            {
-                "nav_tab_id": context["nav_tab_id"],
-                "pane_id": context["pane_id"],
-                "tab_id": context["tab_id"],
-                "title": context["title"],
-                "disabled": context["disabled"],
-                "is_active": is_active,
-                "aria_selected": "true" if is_active else "false",
-                "content": mark_safe(content.strip()),
-            }
-        )
+        if content is None:
+            # Rendering failed, keep the error
+            return None
+        tab: TabData = context["tab"]
+        tab.content = mark_safe(content.strip())
+        context["parent_tabs"].append(tab)
         return None
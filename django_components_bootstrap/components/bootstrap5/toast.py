@@ -1,6 +1,7 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import html_id
 from django_components_bootstrap.components.bootstrap5.types import BgColor, Placement
 
 
@@ -73,7 +74,7 @@ class Toast(Component):
         autohide_attr = "false" if not kwargs.autohide else None
         delay_attr = str(kwargs.delay) if kwargs.autohide and kwargs.delay != 5000 else None
 
-        toast_id = (kwargs.attrs or {}).get("id") or f"toast-{self.id}"
+        toast_id = html_id(self, "toast", kwargs.attrs)
 
         return {
             "toast_id": toast_id,
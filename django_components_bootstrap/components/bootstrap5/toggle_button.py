@@ -1,6 +1,7 @@
 from django.template import Context
 from django_components import Component, SlotInput, types
 
+from django_components_bootstrap.components.bootstrap5.rendering import html_id
 from django_components_bootstrap.components.bootstrap5.types import Size, ToggleButtonType, Variant
 
 
@@ -52,7 +53,7 @@ class ToggleButton(Component):
         default: SlotInput
 
     def get_template_data(self, args, kwargs: Kwargs, slots: Slots, context: Context):
-        toggle_id = (kwargs.attrs or {}).get("id") or f"toggle-button-{self.id}"
+        toggle_id = html_id(self, "toggle-button", kwargs.attrs)
 
         input_attrs = {
             "type": kwargs.type,
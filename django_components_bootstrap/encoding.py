@@ -0,0 +1,24 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model
+
+
+class StableJSONEncoder(DjangoJSONEncoder):
+    """
+    Encodes values the same way in every process: model instances as their label and field
+    values, and sets in sorted order. Other values that `DjangoJSONEncoder` can't encode,
+    e.g. querysets, raise `TypeError`.
+    """
+
+    def default(self, o):
+        if isinstance(o, Model):
+            return [o._meta.label, [getattr(o, f.attname) for f in o._meta.concrete_fields]]
+        if isinstance(o, (set, frozenset)):
+            return sorted(o, key=repr)
+        return super().default(o)
+
+
+def stable_json(data, encoder: type[json.JSONEncoder] = StableJSONEncoder) -> str:
+    """`data` as compact JSON with sorted keys, e.g. to hash it."""
+    return json.dumps(data, cls=encoder, sort_keys=True, separators=(",", ":"))
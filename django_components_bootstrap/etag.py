@@ -0,0 +1,104 @@
+from collections.abc import Callable
+from functools import cache
+from hashlib import md5
+from typing import Any, NamedTuple
+
+from django.db.models import QuerySet
+from django.shortcuts import render
+from django.template.loader import get_template
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.http import etag
+from django_components import Component, registry
+
+from django_components_bootstrap.apps import get_setting
+from django_components_bootstrap.encoding import StableJSONEncoder, stable_json
+
+
+class ComponentNode(NamedTuple):
+    """A component with its inputs, as passed to `fingerprint()`. Slots may contain nodes."""
+
+    component: str | type[Component]
+    kwargs: dict | None = None
+    slots: dict | None = None
+
+
+class _FingerprintEncoder(StableJSONEncoder):
+    def default(self, o):
+        if isinstance(o, QuerySet):
+            return list(o)
+        return super().default(o)
+
+
+@cache
+def _component_source(component: type[Component]) -> str:
+    return (
+        f"{component.__module__}.{component.__qualname__}:"
+        f"{component.template or component.template_file or ''}"
+    )
+
+
+def _encode(part) -> Any:
+    if isinstance(part, ComponentNode):
+        component = part.component
+        if isinstance(component, str):
+            component = registry.get(component)
+        slots = part.slots or {}
+        return [
+            _component_source(component),
+            part.kwargs or {},
+            {name: _encode(slot) for name, slot in slots.items()},
+        ]
+    if isinstance(part, str):
+        return part
+    if isinstance(part, (list, tuple)):
+        return [_encode(item) for item in part]
+    if callable(part):
+        raise TypeError("Slot functions can't be fingerprinted, pass their inputs instead")
+    return part
+
+
+def fingerprint(*parts) -> str:
+    """
+    A hash of the inputs of a component tree, computed without rendering it.
+
+    `parts` are `ComponentNode`s, strings (e.g. slot content or a version) and lists of
+    them. Kwargs may contain JSON serializable values, model instances and querysets.
+    """
+    data = [get_setting("ETAG_VERSION", ""), _encode(parts)]
+    return md5(stable_json(data, _FingerprintEncoder).encode(), usedforsecurity=False).hexdigest()
+
+
+def component_etag(tree_func: Callable) -> Callable:
+    """
+    View decorator that answers `If-None-Match` with a 304 without calling the view, using
+    the `fingerprint()` of the parts returned by `tree_func(request, *args, **kwargs)`.
+    """
+
+    def etag_func(request, *args, **kwargs):
+        return fingerprint(tree_func(request, *args, **kwargs))
+
+    return etag(etag_func)
+
+
+def template_fingerprint(template_name: str, context: dict | None = None) -> str:
+    """A hash of a template's source and the context it is rendered with."""
+    source = get_template(template_name).template.source
+    return fingerprint(source, context or {})
+
+
+def render_if_modified(request, template_name: str, context: dict | None = None, **kwargs):
+    """
+    Like `django.shortcuts.render()`, but answers `If-None-Match` with a 304 without
+    rendering when the `template_fingerprint()` matches.
+
+    Templates that the template extends or includes are not part of the fingerprint. Change
+    the `ETAG_VERSION` setting when they change.
+    """
+    etag_value = quote_etag(template_fingerprint(template_name, context))
+    response = get_conditional_response(request, etag=etag_value)
+    if response is None:
+        response = render(request, template_name, context, **kwargs)
+    if request.method in ("GET", "HEAD"):
+        response.headers.setdefault("ETag", etag_value)
+    return response
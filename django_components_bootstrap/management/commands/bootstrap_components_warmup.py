@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_components_bootstrap.registry import get_component_names
+from django_components_bootstrap.warmup import warmup_components
+
+
+class Command(BaseCommand):
+    help = "Compile the templates of all registered bootstrap components and report timings."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help="Only warm up these components.")
+        parser.add_argument(
+            "--sort",
+            choices=["time", "name"],
+            default="time",
+            help="Order the report by total time (default) or by component name.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            names = get_component_names(include=options["names"]) if options["names"] else None
+        except ValueError as e:
+            raise CommandError(e) from e
+
+        timings = warmup_components(names)
+        if options["sort"] == "time":
+            timings.sort(key=lambda t: t.load_ms + t.compile_ms, reverse=True)
+        else:
+            timings.sort(key=lambda t: t.name)
+
+        width = max((len(t.name) for t in timings), default=0)
+        self.stdout.write(f"{'Component':<{width}}  {'load ms':>9}  {'compile ms':>10}")
+        for timing in timings:
+            self.stdout.write(
+                f"{timing.name:<{width}}  {timing.load_ms:>9.2f}  {timing.compile_ms:>10.2f}"
+            )
+
+        total = sum(t.load_ms + t.compile_ms for t in timings)
+        self.stdout.write(
+            self.style.SUCCESS(f"Warmed up {len(timings)} components in {total:.2f}ms.")
+        )
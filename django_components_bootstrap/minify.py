@@ -0,0 +1,45 @@
+import re
+
+from django_components import ComponentExtension
+from django_components.extension import OnTemplateLoadedContext
+
+from django_components_bootstrap.registry import COMPONENTS_PACKAGE
+
+# Line breaks with their indentation, or elements whose content is rendered as written
+_MINIFIABLE = re.compile(
+    r"\s*\n\s*|<(pre|textarea|script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+_LOAD_TAG = re.compile(r"\{%\s*load\b[^%]*%\}")
+
+
+def minify_template(source: str) -> str:
+    """
+    Remove the indentation and line breaks of a template: between two HTML tags and after
+    `{% load %}` they are dropped, elsewhere they become a single space. The content of
+    `<pre>`, `<textarea>`, `<script>` and `<style>` elements is kept as it is.
+    """
+
+    def replace(match: re.Match) -> str:
+        if match.group(1):
+            return match.group()
+        start, end = match.span()
+        if source.startswith("<", end) and source.endswith(">", 0, start):
+            return ""
+        if source.endswith("%}", 0, start):
+            tag_start = source.rfind("{%", 0, start)
+            if _LOAD_TAG.fullmatch(source, tag_start, start):
+                return ""
+        return " "
+
+    return _MINIFIABLE.sub(replace, source)
+
+
+class MinifyExtension(ComponentExtension):
+    """Minifies the templates of the bootstrap components once, when they are loaded."""
+
+    name = "bootstrap_minify"
+
+    def on_template_loaded(self, ctx: OnTemplateLoadedContext) -> str | None:
+        if ctx.component_cls.__module__.startswith(COMPONENTS_PACKAGE):
+            return minify_template(ctx.content)
+        return None
@@ -0,0 +1,35 @@
+from debug_toolbar.panels import Panel
+
+from django_components_bootstrap.profiling import profile_components
+
+
+class ComponentProfilingPanel(Panel):
+    """
+    Debug toolbar panel listing render statistics per bootstrap component class.
+
+    Requires `ProfilingExtension` in `COMPONENTS["extensions"]`.
+    """
+
+    title = "Bootstrap components"
+    template = "django_components_bootstrap/debug_toolbar/profiling.html"
+
+    @property
+    def nav_subtitle(self):
+        stats = self.get_stats()
+        if not stats:
+            return ""
+        return f"{stats['calls']} renders in {stats['total_ms']:.2f}ms"
+
+    def process_request(self, request):
+        with profile_components() as self._profile:
+            return super().process_request(request)
+
+    def generate_stats(self, request, response):
+        rows = self._profile.rows()
+        self.record_stats(
+            {
+                "rows": rows,
+                "calls": sum(row["calls"] for row in rows),
+                "total_ms": sum(row["self_ms"] for row in rows),
+            }
+        )
@@ -0,0 +1,156 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+
+from django_components import ComponentExtension
+from django_components.extension import (
+    OnComponentDataContext,
+    OnComponentInputContext,
+    OnComponentRenderedContext,
+)
+
+from django_components_bootstrap.registry import COMPONENTS_PACKAGE
+
+_active_profile: ContextVar["ComponentProfile | None"] = ContextVar(
+    "bootstrap_component_profile", default=None
+)
+
+
+class ComponentStats:
+    __slots__ = ("name", "calls", "data_ms", "render_ms", "self_ms", "output_size")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.data_ms = 0.0
+        self.render_ms = 0.0
+        self.self_ms = 0.0
+        self.output_size = 0
+
+    @property
+    def total_ms(self) -> float:
+        return self.data_ms + self.render_ms
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "data_ms": self.data_ms,
+            "render_ms": self.render_ms,
+            "total_ms": self.total_ms,
+            "self_ms": self.self_ms,
+            "output_size": self.output_size,
+        }
+
+
+class ComponentProfile:
+    """
+    Per component class statistics collected while `profile_components()` is active.
+
+    `data_ms` is the time spent preparing the template data (`get_template_data()`), and
+    `render_ms` the time from then until the component's output was ready, including
+    the time spent rendering nested components. `self_ms` excludes the time of nested
+    bootstrap components. Components rendered in other threads, e.g. by `ParallelGroup`, are
+    recorded as well, but their time overlaps with the components of the calling thread.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.stats: dict[str, ComponentStats] = {}
+        self._pending: dict[str, list[float]] = {}
+        # Components that started but did not finish yet, most recent last. Elapsed time is
+        # attributed to the most recent one, as siblings may be rendered interleaved.
+        self._active: list[str] = []
+        self._self_time: dict[str, float] = {}
+        self._last_event = 0.0
+
+    def rows(self) -> list[dict]:
+        stats = sorted(self.stats.values(), key=lambda s: s.self_ms, reverse=True)
+        return [s.as_dict() for s in stats]
+
+    def _tick(self) -> float:
+        now = perf_counter()
+        if self._active:
+            self._self_time[self._active[-1]] += now - self._last_event
+        self._last_event = now
+        return now
+
+    def _start(self, component_id: str) -> None:
+        with self._lock:
+            self._pending[component_id] = [self._tick(), 0.0]
+            self._active.append(component_id)
+            self._self_time[component_id] = 0.0
+
+    def _data_ready(self, component_id: str) -> None:
+        pending = self._pending.get(component_id)
+        if pending is not None:
+            pending[1] = perf_counter()
+
+    def _finish(self, name: str, component_id: str, result: str | None) -> None:
+        with self._lock:
+            self._record(name, component_id, result)
+
+    def _record(self, name: str, component_id: str, result: str | None) -> None:
+        pending = self._pending.pop(component_id, None)
+        if pending is None:
+            return
+
+        start, data_ready = pending
+        end = self._tick()
+        self._active.remove(component_id)
+
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = ComponentStats(name)
+
+        stats.calls += 1
+        if data_ready:
+            stats.data_ms += (data_ready - start) * 1000
+            stats.render_ms += (end - data_ready) * 1000
+        else:
+            stats.render_ms += (end - start) * 1000
+        stats.self_ms += self._self_time.pop(component_id) * 1000
+        stats.output_size += len(result or "")
+
+
+@contextmanager
+def profile_components():
+    """
+    Collect render statistics for bootstrap components rendered inside the block.
+
+    Requires `ProfilingExtension` in `COMPONENTS["extensions"]`.
+    """
+    profile = ComponentProfile()
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+
+
+def _profiled_name(component_cls) -> str | None:
+    if component_cls.__module__.startswith(COMPONENTS_PACKAGE):
+        return component_cls.__name__
+    return None
+
+
+class ProfilingExtension(ComponentExtension):
+    name = "bootstrap_profiling"
+
+    def on_component_input(self, ctx: OnComponentInputContext) -> None:
+        profile = _active_profile.get()
+        if profile is not None and _profiled_name(ctx.component_cls):
+            profile._start(ctx.component_id)
+
+    def on_component_data(self, ctx: OnComponentDataContext) -> None:
+        profile = _active_profile.get()
+        if profile is not None:
+            profile._data_ready(ctx.component_id)
+
+    def on_component_rendered(self, ctx: OnComponentRenderedContext) -> None:
+        profile = _active_profile.get()
+        if profile is not None:
+            name = _profiled_name(ctx.component_cls)
+            if name:
+                profile._finish(name, ctx.component_id, ctx.result)
@@ -0,0 +1,106 @@
+import threading
+from importlib import import_module
+
+from django_components import Component, ComponentRegistry
+
+COMPONENTS_PACKAGE = "django_components_bootstrap.components.bootstrap5"
+
+# Components that are rendered by name from inside another component's template or Python
+# code. They are always registered together with the component that uses them.
+DEPENDENCIES = {
+    "AccordionHeader": ("AccordionButton",),
+    "Alert": ("CloseButton",),
+    "Card": ("CardBody",),
+    "DropdownButton": ("Dropdown", "DropdownMenu", "DropdownToggle"),
+    "FormCheck": ("FormCheckInput", "FormCheckLabel"),
+    "LazyFragment": ("Placeholder",),
+    "ModalHeader": ("CloseButton",),
+    "NavDropdown": ("DropdownMenu", "NavLink"),
+    "OffcanvasHeader": ("CloseButton",),
+    "ParallelGroup": ("Row",),
+    "SplitButton": ("Button", "ButtonGroup", "Dropdown", "DropdownMenu", "DropdownToggle"),
+    "ToastHeader": ("CloseButton",),
+}
+
+
+def get_component_names(include=None, exclude=()) -> list[str]:
+    from django_components_bootstrap.components.bootstrap5 import COMPONENT_MODULES
+
+    unknown = sorted({*(include or ()), *exclude} - COMPONENT_MODULES.keys())
+    if unknown:
+        raise ValueError(f"Unknown bootstrap components: {', '.join(unknown)}")
+
+    names = {name for name in include or COMPONENT_MODULES if name not in exclude}
+    pending = list(names)
+    while pending:
+        for dependency in DEPENDENCIES.get(pending.pop(), ()):
+            if dependency not in names:
+                names.add(dependency)
+                pending.append(dependency)
+
+    return [name for name in COMPONENT_MODULES if name in names]
+
+
+class LazyComponentEntry:
+    """
+    Registry entry that imports the component class on first access and then
+    replaces itself with a regular registration.
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, registry: ComponentRegistry, name: str, module: str, tag: str):
+        self.registry = registry
+        self.name = name
+        self.module = module
+        self.tag = tag
+        self._cls = None
+
+    @property
+    def cls(self):
+        with self._lock:
+            if self._cls is None:
+                module = import_module(f"{COMPONENTS_PACKAGE}.{self.module}")
+                self._cls = getattr(module, self.name)
+                if self.registry._registry.get(self.name) is self:
+                    self.registry.register(self.name, self._cls)
+        return self._cls
+
+
+def supports_lazy_registration(registry: ComponentRegistry) -> bool:
+    """
+    Whether `registry` has the private attributes `register_lazy()` writes to. They are
+    not part of the public django-components API, so they may change between versions.
+    """
+    return (
+        callable(getattr(registry, "_register_to_library", None))
+        and isinstance(getattr(registry, "_registry", None), dict)
+        and isinstance(getattr(registry, "_tags", None), dict)
+    )
+
+
+def register_lazy(registry: ComponentRegistry, name: str) -> None:
+    from django_components_bootstrap.components.bootstrap5 import COMPONENT_MODULES
+
+    if not supports_lazy_registration(registry):
+        module = import_module(f"{COMPONENTS_PACKAGE}.{COMPONENT_MODULES[name]}")
+        registry.register(name, getattr(module, name))
+        return
+
+    tag = registry._register_to_library(name, None).tag
+    registry._tags.setdefault(tag, set()).add(name)
+    registry._registry[name] = LazyComponentEntry(registry, name, COMPONENT_MODULES[name], tag)
+
+
+def is_loaded(registry: ComponentRegistry, name: str) -> bool:
+    entry = registry._registry.get(name)
+    return entry is not None and not isinstance(entry, LazyComponentEntry)
+
+
+def loaded_components(registry: ComponentRegistry) -> list[type[Component]]:
+    """The registered component classes, without importing lazily registered ones."""
+    return [
+        entry.cls
+        for entry in registry._registry.values()
+        if not isinstance(entry, LazyComponentEntry)
+    ]
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from django_components_bootstrap import views
+
+app_name = "django_components_bootstrap"
+
+urlpatterns = [
+    path("fragments/<str:token>/", views.lazy_fragment, name="lazy_fragment"),
+]
@@ -0,0 +1,15 @@
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_GET
+
+from django_components_bootstrap.components.bootstrap5.lazy_fragment import decode_fragment
+
+
+@require_GET
+def lazy_fragment(request, token: str):
+    """Renders the component of a `LazyFragment`, with the scripts that load its JS and CSS."""
+    try:
+        component, kwargs = decode_fragment(token)
+    except ValueError as e:
+        raise Http404(str(e)) from e
+
+    return HttpResponse(component.render(kwargs=kwargs, request=request, deps_strategy="fragment"))
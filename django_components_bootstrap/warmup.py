@@ -0,0 +1,48 @@
+import gc
+from time import perf_counter
+from typing import NamedTuple
+
+from django_components import registry as default_registry
+
+from django_components_bootstrap.registry import COMPONENTS_PACKAGE, get_component_names
+
+
+class ComponentTiming(NamedTuple):
+    name: str
+    load_ms: float
+    compile_ms: float
+
+
+def warmup_components(names=None, registry=None, freeze: bool = False) -> list[ComponentTiming]:
+    """
+    Import and compile the templates of registered bootstrap components, returning
+    how long each one took. Already compiled components report ~0ms.
+
+    With `freeze=True`, `gc.freeze()` is called afterwards so that processes forked
+    from this one (e.g. gunicorn workers with `preload_app = True`) share the compiled
+    templates copy-on-write instead of touching them on the first garbage collection.
+    """
+    registry = registry or default_registry
+    timings = []
+
+    for name in names or get_component_names():
+        if not registry.has(name):
+            continue
+
+        start = perf_counter()
+        component = registry.get(name)
+        loaded = perf_counter()
+        if not component.__module__.startswith(COMPONENTS_PACKAGE):
+            continue
+
+        # Accessing `_template` resolves the component's media and compiles its template
+        component._template  # noqa: B018
+        compiled = perf_counter()
+
+        timings.append(ComponentTiming(name, (loaded - start) * 1000, (compiled - loaded) * 1000))
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    return timings
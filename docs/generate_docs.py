@@ -157,7 +157,11 @@ def main():
     tests_dir = Path("..") / "tests"
     test_files = sorted(tests_dir.glob("test_*.py"))
 
-    test_files = [f for f in test_files if f.name not in ["test_components.py", "__init__.py"]]
+    test_files = [
+        f
+        for f in test_files
+        if f.name not in ["test_components.py", "test_classes.py", "__init__.py"]
+    ]
 
     component_docs = {}
 
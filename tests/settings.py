@@ -37,10 +37,11 @@ TEMPLATES = [
 
 USE_TZ = True
 
-ROOT_URLCONF = "django_components_bootstrap.tests.urls"
+ROOT_URLCONF = "tests.urls"
 
 # Django Components settings
 COMPONENTS = {
     "autodiscover": False,
     "dirs": [],
+    "extensions": ["django_components_bootstrap.profiling.ProfilingExtension"],
 }
@@ -0,0 +1,103 @@
+import asyncio
+
+from django.template import Context, Template
+from django.test import SimpleTestCase
+from django.utils.safestring import mark_safe
+
+from django_components_bootstrap.components.bootstrap5 import Card, CardBody
+from django_components_bootstrap.components.bootstrap5.async_rendering import arender
+
+from .utils import normalize_html
+
+
+def render(template_code, context=None):
+    template = Template("{% load component_tags %}" + template_code)
+    return normalize_html(template.render(Context(context or {})))
+
+
+class ARenderTests(SimpleTestCase):
+    async def test_same_output_as_render(self):
+        html = await arender("Card", {"bg": "light"}, {"default": "<b>Hello</b>"})
+
+        self.assertHTMLEqual(
+            normalize_html(html),
+            render('{% component "Card" bg="light" %}&lt;b&gt;Hello&lt;/b&gt;{% endcomponent %}'),
+        )
+
+    async def test_component_class(self):
+        html = await arender(CardBody, slots={"default": mark_safe("<b>Hello</b>")})
+
+        self.assertHTMLEqual(normalize_html(html), '<div class="card-body"><b>Hello</b></div>')
+
+    async def test_awaitable_slots_and_kwargs(self):
+        async def title():
+            return "Orders"
+
+        async def body():
+            return mark_safe("<p>3 open</p>")
+
+        html = await arender(
+            Card,
+            {"border": asyncio.sleep(0, result="primary")},
+            {
+                "default": [
+                    arender("CardHeader", slots={"default": title()}),
+                    arender(CardBody, slots={"default": body()}),
+                    "&",
+                ]
+            },
+        )
+
+        self.assertHTMLEqual(
+            normalize_html(html),
+            '<div class="card border-primary"><div class="card-header">Orders</div>'
+            '<div class="card-body"><p>3 open</p></div>&amp;</div>',
+        )
+
+    async def test_awaitables_overlap(self):
+        running = []
+        overlapping = []
+
+        async def fetch(i):
+            running.append(i)
+            await asyncio.sleep(0.01)
+            overlapping.append(len(running))
+            running.remove(i)
+            return str(i)
+
+        html = await arender(
+            "Row",
+            slots={"default": [arender("Col", slots={"default": fetch(i)}) for i in range(3)]},
+        )
+
+        self.assertEqual(overlapping[0], 3)
+        self.assertEqual(normalize_html(html).count('<div class="col">'), 3)
+
+    async def test_tabs_with_awaited_context(self):
+        async def orders():
+            return ["A-1", "A-2"]
+
+        tabs = Template(
+            '{% load component_tags %}{% for order in orders %}{% component "Tab" title=order %}'
+            "Order {{ order }}{% endcomponent %}{% endfor %}"
+        )
+
+        html = await arender(
+            "Tabs",
+            {"attrs": {"id": "orders"}},
+            {"default": lambda ctx: tabs.render(ctx.context)},
+            context={"orders": orders()},
+        )
+
+        expected = render(
+            '{% component "Tabs" attrs:id="orders" %}'
+            '{% component "Tab" title="A-1" %}Order A-1{% endcomponent %}'
+            '{% component "Tab" title="A-2" %}Order A-2{% endcomponent %}'
+            "{% endcomponent %}"
+        )
+        self.assertHTMLEqual(normalize_html(html), expected)
+
+    def test_sync_render_unchanged(self):
+        self.assertHTMLEqual(
+            normalize_html(Card.render(slots={"default": "x"})), '<div class="card">x</div>'
+        )
@@ -0,0 +1,130 @@
+from django.core.cache import cache, caches
+from django.template import Context, Template
+from django.test import SimpleTestCase
+
+from django_components_bootstrap.components.bootstrap5.cached_fragment import fragment_cache_key
+
+from .utils import normalize_html
+
+NAVBAR = Template("""
+    {% load component_tags %}
+    {% component "CachedFragment" key="navbar" vary_on=vary_on version=version %}
+        {% component "Navbar" %}
+            {% component "NavbarToggler" / %}
+            {% component "NavbarCollapse" %}{{ user }}{% endcomponent %}
+        {% endcomponent %}
+    {% endcomponent %}
+""")
+
+
+def render(**context):
+    context = {"vary_on": None, "version": None, **context}
+    return normalize_html(NAVBAR.render(Context(context)))
+
+
+class CachedFragmentTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_basic(self):
+        template = Template("""
+            {% load component_tags %}
+            {% component "CachedFragment" key="sidebar" timeout=600 %}
+                {% component "ListGroup" %}
+                    {% component "ListGroupItem" %}Dashboard{% endcomponent %}
+                    {% component "ListGroupItem" %}Settings{% endcomponent %}
+                {% endcomponent %}
+            {% endcomponent %}
+        """)
+        rendered = normalize_html(template.render(Context({})))
+
+        expected = """
+            <ul class="list-group">
+                <li class="list-group-item">Dashboard</li>
+                <li class="list-group-item">Settings</li>
+            </ul>
+        """
+
+        self.assertHTMLEqual(rendered, normalize_html(expected))
+        self.assertIn("Settings", cache.get(fragment_cache_key("sidebar")))
+
+    def test_cached(self):
+        first = render(user="alice")
+        second = render(user="bob")
+
+        self.assertIn("alice", first)
+        self.assertEqual(first, second)
+
+    def test_vary_on(self):
+        alice = render(user="alice", vary_on=["alice"])
+        bob = render(user="bob", vary_on=["bob"])
+
+        self.assertIn("alice", alice)
+        self.assertIn("bob", bob)
+        self.assertEqual(render(user="carol", vary_on=["alice"]), alice)
+
+    def test_version(self):
+        render(user="alice", version=1)
+
+        self.assertIn("bob", render(user="bob", version=2))
+        self.assertIn("alice", render(user="bob", version=1))
+
+    def test_delete(self):
+        render(user="alice", vary_on=["x"])
+
+        cache.delete(fragment_cache_key("navbar", ["x"]))
+
+        self.assertIn("bob", render(user="bob", vary_on=["x"]))
+
+    def test_ids_are_deterministic(self):
+        first = render(user="alice")
+        cache.clear()
+        second = render(user="alice")
+        other_key = render(user="alice", vary_on=["other"])
+
+        collapse_id = fragment_cache_key("navbar")
+        self.assertRegex(first, r'<div id="navbar-collapse-f[0-9a-f]{6}-1"')
+        self.assertIn('data-bs-target="#navbar-collapse-f', first)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other_key)
+        self.assertTrue(
+            collapse_id.startswith("template.cache.django_components_bootstrap.navbar.")
+        )
+
+    def test_component_ids_are_not_cached(self):
+        first = NAVBAR.render(Context({"user": "alice", "vary_on": None, "version": None}))
+        second = NAVBAR.render(Context({"user": "bob", "vary_on": None, "version": None}))
+
+        self.assertIn("data-djc-id-", first)
+        self.assertNotIn("data-djc-id-", second)
+        self.assertNotIn("data-djc-id-", cache.get(fragment_cache_key("navbar")))
+        self.assertEqual(normalize_html(first), normalize_html(second))
+
+    def test_cache_options_are_read_per_render(self):
+        template = Template(
+            '{% load component_tags %}{% component "CachedFragment" key="options" using=using '
+            "version=version %}{{ value }}{% endcomponent %}"
+        )
+
+        with self.settings(
+            CACHES={
+                "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+                "other": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "other",
+                },
+            }
+        ):
+            template.render(Context({"using": "other", "version": 2, "value": "a"}))
+            template.render(Context({"using": "default", "version": None, "value": "b"}))
+            key = fragment_cache_key("options")
+
+            self.assertIn("a", caches["other"].get(key, version=2))
+            self.assertIn("b", caches["default"].get(key))
+
+    def test_ids_outside_fragment(self):
+        rendered = Template(
+            '{% load component_tags %}{% component "Collapse" %}x{% endcomponent %}'
+        ).render(Context({}))
+
+        self.assertRegex(rendered, r'id="collapse-c\w{6}"')
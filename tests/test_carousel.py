@@ -1,7 +1,10 @@
 from django.template import Context, Template
 from django.test import SimpleTestCase
+from django.utils.safestring import mark_safe
 from django_components.testing import djc_test
 
+from django_components_bootstrap.components.bootstrap5 import Carousel
+
 from .utils import mock_component_id, normalize_html
 
 
@@ -510,3 +513,84 @@ class TestCarousel(SimpleTestCase):
         """
 
         self.assertHTMLEqual(normalize_html(rendered), normalize_html(expected))
+
+    @djc_test
+    def test_carousel_id_is_escaped(self):
+        with mock_component_id():
+            rendered = Template(
+                '{% load component_tags %}{% component "Carousel" attrs:id=carousel_id %}'
+                '{% component "CarouselItem" active=True %}A{% endcomponent %}{% endcomponent %}'
+            ).render(Context({"carousel_id": 'a"&b'}))
+
+        expected = """
+            <div id="a&quot;&amp;b" class="carousel slide">
+              <div class="carousel-indicators">
+                <button type="button" data-bs-target="#a&quot;&amp;b" data-bs-slide-to="0" class="active" aria-current="true" aria-label="Slide 1"></button>
+              </div>
+              <div class="carousel-inner">
+                <div class="carousel-item active">A</div>
+              </div>
+              <button class="carousel-control-prev" type="button" data-bs-target="#a&quot;&amp;b" data-bs-slide="prev">
+                <span class="carousel-control-prev-icon" aria-hidden="true"></span>
+                <span class="visually-hidden">Previous</span>
+              </button>
+              <button class="carousel-control-next" type="button" data-bs-target="#a&quot;&amp;b" data-bs-slide="next">
+                <span class="carousel-control-next-icon" aria-hidden="true"></span>
+                <span class="visually-hidden">Next</span>
+              </button>
+            </div>
+        """
+
+        self.assertHTMLEqual(normalize_html(rendered), normalize_html(expected))
+
+    @djc_test
+    def test_items_match_carousel_items(self):
+        template = Template(
+            '{% load component_tags %}{% component "Carousel" fade=True %}'
+            '{% component "CarouselItem" active=True interval=5000 %}<img src="/a.jpg" alt="A">'
+            '{% component "CarouselCaption" %}<h5>First</h5>{% endcomponent %}{% endcomponent %}'
+            '{% component "CarouselItem" attrs:class="text-center" %}B &amp; C{% endcomponent %}'
+            "{% endcomponent %}"
+        )
+        items = [
+            {
+                "content": mark_safe('<img src="/a.jpg" alt="A">'),
+                "caption": mark_safe("<h5>First</h5>"),
+                "active": True,
+                "interval": 5000,
+            },
+            {"content": "B & C", "attrs": {"class": "text-center"}},
+        ]
+
+        with mock_component_id():
+            rendered = template.render(Context())
+        with mock_component_id():
+            generated = Carousel.render(kwargs={"fade": True, "items": items})
+
+        self.assertHTMLEqual(normalize_html(generated), normalize_html(rendered))
+
+    @djc_test
+    def test_items_before_carousel_items(self):
+        with mock_component_id():
+            rendered = Template(
+                '{% load component_tags %}{% component "Carousel" items=items indicators=True %}'
+                '{% component "CarouselItem" active=True %}2{% endcomponent %}{% endcomponent %}'
+            ).render(Context({"items": [{"content": "1"}]}))
+
+        self.assertInHTML('<div class="carousel-item">1</div>', rendered)
+        self.assertInHTML(
+            '<button type="button" data-bs-target="#carousel-ctest01" data-bs-slide-to="1" '
+            'class="active" aria-current="true" aria-label="Slide 2"></button>',
+            rendered,
+        )
+
+    @djc_test
+    def test_child_errors_are_raised(self):
+        template = Template(
+            '{% load component_tags %}{% component "Carousel" %}{% component "CarouselItem" %}'
+            '{% component "Badge" unknown=True %}x{% endcomponent %}'
+            "{% endcomponent %}{% endcomponent %}"
+        )
+
+        with self.assertRaisesMessage(TypeError, "unexpected keyword argument 'unknown'"):
+            template.render(Context())
@@ -0,0 +1,88 @@
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from django_components_bootstrap.components.bootstrap5.classes import (
+    _resolvers,
+    class_cache_info,
+    class_resolver,
+    clear_class_caches,
+)
+
+from .utils import normalize_html
+
+
+class ClassResolverTests(SimpleTestCase):
+    maxDiff = None
+
+    def setUp(self):
+        clear_class_caches()
+
+    def tearDown(self):
+        clear_class_caches()
+
+    def test_second_render_hits_cache(self):
+        template = Template("""
+            {% load component_tags %}
+            {% component "Button" variant="primary" size="sm" %}Small{% endcomponent %}
+        """)
+        first = normalize_html(template.render(Context({})))
+        second = normalize_html(template.render(Context({})))
+
+        self.assertEqual(first, second)
+        self.assertHTMLEqual(
+            first, '<button class="btn btn-primary btn-sm" type="button">Small</button>'
+        )
+        self.assertEqual(class_cache_info()["Button"]["misses"], 1)
+        self.assertEqual(class_cache_info()["Button"]["hits"], 1)
+
+    def test_different_kwargs_are_cached_separately(self):
+        template = Template("""
+            {% load component_tags %}
+            {% component "Row" cols=1 %}{% component "Col" md=1 %}A{% endcomponent %}{% endcomponent %}
+            {% component "Row" cols=2 %}{% component "Col" md=1 %}B{% endcomponent %}{% endcomponent %}
+        """)
+        rendered = normalize_html(template.render(Context({})))
+
+        expected = """
+            <div class="row row-cols-1"><div class="col-md-1">A</div></div>
+            <div class="row row-cols-2"><div class="col-md-1">B</div></div>
+        """
+        self.assertHTMLEqual(normalize_html(expected), rendered)
+        self.assertEqual(class_cache_info()["Row"]["misses"], 2)
+        self.assertEqual(class_cache_info()["Col"]["misses"], 1)
+        self.assertEqual(class_cache_info()["Col"]["hits"], 1)
+
+    def test_typed_keys(self):
+        self.addCleanup(_resolvers.pop, "TypedTest", None)
+
+        @class_resolver("TypedTest")
+        def resolve(value):
+            return f"x-{value}"
+
+        self.assertEqual(resolve(1), "x-1")
+        self.assertEqual(resolve(True), "x-True")
+
+    def test_unhashable_input_bypasses_cache(self):
+        self.addCleanup(_resolvers.pop, "UnhashableTest", None)
+
+        @class_resolver("UnhashableTest")
+        def resolve(values):
+            return " ".join(values)
+
+        self.assertEqual(resolve(["a", "b"]), "a b")
+        self.assertEqual(resolve(("a", "b")), "a b")
+        self.assertEqual(class_cache_info()["UnhashableTest"]["misses"], 1)
+
+    @override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"CLASS_CACHE_SIZE": 0})
+    def test_cache_size_setting(self):
+        template = Template("""
+            {% load component_tags %}
+            {% component "Table" striped=True %}<tr><td>1</td></tr>{% endcomponent %}
+        """)
+        template.render(Context({}))
+        template.render(Context({}))
+
+        info = class_cache_info()["Table"]
+        self.assertEqual(info["maxsize"], 0)
+        self.assertEqual(info["hits"], 0)
+        self.assertEqual(info["misses"], 2)
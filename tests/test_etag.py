@@ -0,0 +1,142 @@
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from django_components_bootstrap.components.bootstrap5 import Card, CardBody
+from django_components_bootstrap.etag import (
+    ComponentNode,
+    component_etag,
+    fingerprint,
+    render_if_modified,
+    template_fingerprint,
+)
+
+CARD = ComponentNode(
+    "Card",
+    {"border": "primary"},
+    {"default": [ComponentNode("CardBody", slots={"default": "Hello"}), "<hr>"]},
+)
+
+LOCMEM_TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "OPTIONS": {
+            "loaders": [
+                (
+                    "django.template.loaders.locmem.Loader",
+                    {
+                        "cards.html": (
+                            '{% load component_tags %}{% component "Card" %}'
+                            "{{ title }}{% endcomponent %}"
+                        ),
+                    },
+                )
+            ],
+        },
+    }
+]
+
+
+class FingerprintTests(SimpleTestCase):
+    def test_same_inputs_same_fingerprint(self):
+        same = ComponentNode(
+            Card,
+            {"border": "primary"},
+            {"default": [ComponentNode(CardBody, slots={"default": "Hello"}), "<hr>"]},
+        )
+
+        self.assertRegex(fingerprint(CARD), r"^[0-9a-f]{32}$")
+        self.assertEqual(fingerprint(CARD), fingerprint(same))
+
+    def test_inputs_change_fingerprint(self):
+        changed = [
+            CARD._replace(component="ListGroup"),
+            CARD._replace(kwargs={"border": "danger"}),
+            CARD._replace(slots={"default": [ComponentNode("CardBody", slots={"default": "Hi"})]}),
+            CARD._replace(slots={"header": "Hello"}),
+        ]
+
+        fingerprints = {fingerprint(CARD), *(fingerprint(node) for node in changed)}
+        self.assertEqual(len(fingerprints), len(changed) + 1)
+
+    def test_version(self):
+        with override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"ETAG_VERSION": "2"}):
+            versioned = fingerprint(CARD)
+
+        self.assertNotEqual(versioned, fingerprint(CARD))
+
+    def test_slot_functions_are_rejected(self):
+        with self.assertRaisesMessage(TypeError, "Slot functions can't be fingerprinted"):
+            fingerprint(ComponentNode("Card", slots={"default": lambda ctx: "x"}))
+
+
+class ModelFingerprintTests(TestCase):
+    def test_model_instances_and_querysets(self):
+        user = User.objects.create(username="ada", first_name="Ada")
+        before = fingerprint(ComponentNode("Card", {"user": user, "users": User.objects.all()}))
+
+        user.first_name = "Grace"
+        user.save()
+
+        self.assertNotEqual(
+            fingerprint(ComponentNode("Card", {"user": user, "users": User.objects.all()})),
+            before,
+        )
+
+
+class ComponentEtagTests(SimpleTestCase):
+    def setUp(self):
+        self.calls = []
+
+        @component_etag(lambda request, pk: ComponentNode("Card", {"pk": pk}))
+        def view(request, pk):
+            self.calls.append(pk)
+            return HttpResponse(Card.render(slots={"default": f"Card {pk}"}))
+
+        self.view = view
+        self.factory = RequestFactory()
+
+    def test_not_modified_without_rendering(self):
+        response = self.view(self.factory.get("/"), pk=1)
+        etag_value = response.headers["ETag"]
+
+        cached = self.view(self.factory.get("/", headers={"if-none-match": etag_value}), pk=1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(self.calls, [1])
+
+    def test_changed_inputs_render(self):
+        etag_value = self.view(self.factory.get("/"), pk=1).headers["ETag"]
+
+        response = self.view(self.factory.get("/", headers={"if-none-match": etag_value}), pk=2)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.calls, [1, 2])
+
+
+@override_settings(TEMPLATES=LOCMEM_TEMPLATES)
+class RenderIfModifiedTests(SimpleTestCase):
+    def test_not_modified(self):
+        factory = RequestFactory()
+        response = render_if_modified(factory.get("/"), "cards.html", {"title": "Orders"})
+        etag_value = response.headers["ETag"]
+
+        cached = render_if_modified(
+            factory.get("/", headers={"if-none-match": etag_value}),
+            "cards.html",
+            {"title": "Orders"},
+        )
+        changed = render_if_modified(
+            factory.get("/", headers={"if-none-match": etag_value}),
+            "cards.html",
+            {"title": "Invoices"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Orders", response.content.decode())
+        self.assertEqual(etag_value, f'"{template_fingerprint("cards.html", {"title": "Orders"})}"')
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+        self.assertEqual(changed.status_code, 200)
+        self.assertIn("Invoices", changed.content.decode())
@@ -1,7 +1,19 @@
+from django import forms
 from django.template import Context, Template
 from django.test import SimpleTestCase
+from django.test.html import parse_html
+from django.utils import translation
+from django.utils.translation import gettext_lazy
 from django_components.testing import djc_test
 
+from django_components_bootstrap.components.bootstrap5.form import (
+    FALLBACK_RENDERER,
+    WIDGET_RENDERERS,
+    _form_plans,
+    clear_form_plans,
+    render_form,
+)
+
 from .utils import mock_component_id, normalize_html
 
 
@@ -486,3 +498,252 @@ class FormTestCase(SimpleTestCase):
         """
 
         self.assertHTMLEqual(rendered, expected)
+
+
+class ContactForm(forms.Form):
+    name = forms.CharField(max_length=20, help_text="Your <em>full</em> name")
+    topic = forms.ChoiceField(choices=[("", "---"), ("sales", "Sales"), ("support", "Support")])
+    message = forms.CharField(widget=forms.Textarea(attrs={"rows": 3}), required=False)
+    subscribe = forms.BooleanField(required=False, label="Subscribe to <news>")
+    token = forms.CharField(widget=forms.HiddenInput)
+
+
+class PreferencesForm(forms.Form):
+    contact = forms.ChoiceField(
+        widget=forms.RadioSelect, choices=[("mail", "Mail"), ("phone", "Phone")]
+    )
+    sent_at = forms.SplitDateTimeField(required=False)
+
+
+BOOTSTRAP_FORM = Template('{% load component_tags %}{% component "BootstrapForm" form=form / %}')
+
+
+class BootstrapFormTests(FormTestCase):
+    def test_unbound_form(self):
+        rendered = BOOTSTRAP_FORM.render(Context({"form": ContactForm(initial={"token": "t"})}))
+
+        expected = """
+            <input type="hidden" name="token" value="t" id="id_token">
+            <div class="mb-3">
+                <label class="form-label" for="id_name">Name</label>
+                <input type="text" name="name" maxlength="20" required
+                    aria-describedby="id_name_helptext" id="id_name" class="form-control">
+                <div class="form-text" id="id_name_helptext">Your <em>full</em> name</div>
+            </div>
+            <div class="mb-3">
+                <label class="form-label" for="id_topic">Topic</label>
+                <select name="topic" required id="id_topic" class="form-select">
+                    <option value="" selected>---</option>
+                    <option value="sales">Sales</option>
+                    <option value="support">Support</option>
+                </select>
+            </div>
+            <div class="mb-3">
+                <label class="form-label" for="id_message">Message</label>
+                <textarea name="message" cols="40" rows="3" id="id_message" class="form-control">
+                </textarea>
+            </div>
+            <div class="mb-3">
+                <div class="form-check">
+                    <input type="checkbox" name="subscribe" id="id_subscribe" class="form-check-input">
+                    <label class="form-check-label" for="id_subscribe">Subscribe to &lt;news&gt;</label>
+                </div>
+            </div>
+        """
+
+        self.assertHTMLEqual(rendered, expected)
+
+    def test_bound_form_with_errors(self):
+        form = ContactForm({"name": "x" * 21, "topic": "support", "message": "<hi>"})
+
+        rendered = BOOTSTRAP_FORM.render(Context({"form": form}))
+
+        expected = """
+            <div class="alert alert-danger" role="alert">
+                (Hidden field token) This field is required.
+            </div>
+            <input type="hidden" name="token" id="id_token">
+            <div class="mb-3">
+                <label class="form-label" for="id_name">Name</label>
+                <input type="text" name="name" value="xxxxxxxxxxxxxxxxxxxxx" maxlength="20" required
+                    aria-invalid="true" aria-describedby="id_name_helptext id_name_error"
+                    id="id_name" class="form-control is-invalid">
+                <div class="invalid-feedback" id="id_name_error">
+                    Ensure this value has at most 20 characters (it has 21).
+                </div>
+                <div class="form-text" id="id_name_helptext">Your <em>full</em> name</div>
+            </div>
+            <div class="mb-3">
+                <label class="form-label" for="id_topic">Topic</label>
+                <select name="topic" required id="id_topic" class="form-select">
+                    <option value="">---</option>
+                    <option value="sales">Sales</option>
+                    <option value="support" selected>Support</option>
+                </select>
+            </div>
+            <div class="mb-3">
+                <label class="form-label" for="id_message">Message</label>
+                <textarea name="message" cols="40" rows="3" id="id_message" class="form-control">
+                &lt;hi&gt;</textarea>
+            </div>
+            <div class="mb-3">
+                <div class="form-check">
+                    <input type="checkbox" name="subscribe" id="id_subscribe" class="form-check-input">
+                    <label class="form-check-label" for="id_subscribe">Subscribe to &lt;news&gt;</label>
+                </div>
+            </div>
+        """
+
+        self.assertHTMLEqual(rendered, expected)
+
+    def test_fieldsets(self):
+        rendered = BOOTSTRAP_FORM.render(Context({"form": PreferencesForm({"contact": "fax"})}))
+
+        expected = """
+            <fieldset class="mb-3">
+                <legend class="form-label">Contact</legend>
+                <div class="form-check">
+                    <input type="radio" name="contact" value="mail" required aria-invalid="true"
+                        id="id_contact_0" class="form-check-input is-invalid">
+                    <label class="form-check-label" for="id_contact_0">Mail</label>
+                </div>
+                <div class="form-check">
+                    <input type="radio" name="contact" value="phone" required aria-invalid="true"
+                        id="id_contact_1" class="form-check-input is-invalid">
+                    <label class="form-check-label" for="id_contact_1">Phone</label>
+                </div>
+                <div class="invalid-feedback d-block" id="id_contact_error">
+                    Select a valid choice. fax is not one of the available choices.
+                </div>
+            </fieldset>
+            <fieldset class="mb-3">
+                <legend class="form-label">Sent at</legend>
+                <input type="text" name="sent_at_0" class="form-control" id="id_sent_at_0">
+                <input type="text" name="sent_at_1" class="form-control" id="id_sent_at_1">
+            </fieldset>
+        """
+
+        self.assertHTMLEqual(rendered, expected)
+
+    def test_fields(self):
+        template = Template(
+            '{% load component_tags %}{% component "BootstrapForm" form=form fields=fields / %}'
+        )
+        rendered = template.render(
+            Context({"form": ContactForm(), "fields": ["subscribe", "token"]})
+        )
+
+        self.assertIn('name="token"', rendered)
+        self.assertIn('name="subscribe"', rendered)
+        self.assertNotIn('name="name"', rendered)
+
+    def test_bootstrap_field(self):
+        template = Template(
+            '{% load component_tags %}{% component "BootstrapField" field=form.name '
+            'show_label=False attrs:class="col-6" attrs:data-field="name" / %}'
+        )
+        rendered = template.render(Context({"form": ContactForm(auto_id=False)}))
+
+        expected = """
+            <div class="col-6" data-field="name">
+                <input type="text" name="name" maxlength="20" required class="form-control">
+                <div class="form-text">Your <em>full</em> name</div>
+            </div>
+        """
+
+        self.assertHTMLEqual(rendered, expected)
+
+    def test_widget_renderers_match_django(self):
+        class WidgetsForm(forms.Form):
+            text = forms.CharField(initial="<text>")
+            email = forms.EmailField(required=False, disabled=True)
+            number = forms.IntegerField(initial=3, localize=True)
+            password = forms.CharField(widget=forms.PasswordInput(render_value=True))
+            date = forms.DateField(widget=forms.DateInput(attrs={"type": "date"}))
+            textarea = forms.CharField(widget=forms.Textarea, initial="a<b")
+            select = forms.ChoiceField(
+                choices=[("a", "A"), ("Group", [("b", "B"), ("c", "C<")])], initial="b"
+            )
+            select_multiple = forms.MultipleChoiceField(
+                choices=[("a", "A"), ("b", "B")], initial=["a", "b"]
+            )
+            checkbox = forms.BooleanField(required=False, initial=True)
+            hidden = forms.CharField(widget=forms.HiddenInput, initial="h")
+            file = forms.FileField(widget=forms.FileInput)
+
+        for form in [WidgetsForm(), WidgetsForm({"text": "<changed>", "number": "x"})]:
+            for field in form:
+                with self.subTest(field=field.name, bound=form.is_bound):
+                    renderer = WIDGET_RENDERERS.get(
+                        field.field.widget.template_name, FALLBACK_RENDERER
+                    )
+                    self.assertIsNot(renderer, FALLBACK_RENDERER)
+                    self.assertEqual(
+                        parse_html(renderer.render(field, {"class": "x"})),
+                        parse_html(field.as_widget(attrs={"class": "x"})),
+                    )
+
+
+class FormPlanTests(SimpleTestCase):
+    def setUp(self):
+        clear_form_plans()
+
+    def test_plans_are_reused_per_form_class(self):
+        first = render_form(ContactForm())
+        plans = dict(_form_plans[ContactForm])
+
+        second = render_form(ContactForm({"name": "Jane"}))
+
+        self.assertEqual(
+            sorted(name for _language, name, _has_id in plans), sorted(ContactForm.base_fields)
+        )
+        for key, plan in _form_plans[ContactForm].items():
+            self.assertIs(plan, plans[key])
+        self.assertIn('value="Jane"', second)
+        self.assertNotIn("is-invalid", first)
+        self.assertIn('class="form-select is-invalid"', second)
+
+    def test_plan_follows_changed_fields(self):
+        render_form(ContactForm())
+        form = ContactForm(prefix="other")
+        form.fields["name"].label = "Nickname"
+        form.fields["message"].widget = forms.TextInput()
+
+        rendered = render_form(form)
+
+        self.assertIn('<label class="form-label" for="id_other-name">Nickname</label>', rendered)
+        self.assertIn('<input type="text" name="other-message"', rendered)
+        self.assertIn("Name</label>", render_form(ContactForm()))
+
+    def test_plans_are_shared_by_prefixes(self):
+        rendered = [render_form(ContactForm(prefix=f"form-{i}")) for i in range(3)]
+        without_ids = render_form(ContactForm(prefix="form-3", auto_id=False))
+
+        self.assertEqual(len(_form_plans[ContactForm]), 2 * len(ContactForm.base_fields))
+        self.assertIn('<label class="form-label" for="id_form-2-name">Name</label>', rendered[2])
+        self.assertIn('<div class="form-text" id="id_form-2-name_helptext">', rendered[2])
+        self.assertIn('<label class="form-label">Name</label>', without_ids)
+        self.assertNotIn("id_", without_ids)
+
+    def test_show_hidden_initial(self):
+        class ChangeForm(forms.Form):
+            name = forms.CharField(initial="Jane", show_hidden_initial=True)
+
+        rendered = render_form(ChangeForm())
+
+        self.assertIn(
+            '<input type="hidden" name="initial-name" value="Jane" id="initial-id_name">',
+            rendered,
+        )
+
+    def test_plans_per_language(self):
+        class PasswordForm(forms.Form):
+            password = forms.CharField(label=gettext_lazy("Password"))
+
+        with translation.override("en"):
+            english = render_form(PasswordForm())
+        with translation.override("nl"):
+            dutch = render_form(PasswordForm())
+
+        self.assertIn(">Password</label>", english)
+        self.assertIn(">Wachtwoord</label>", dutch)
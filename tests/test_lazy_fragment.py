@@ -0,0 +1,118 @@
+import json
+import re
+import time
+from base64 import b64decode
+from unittest import mock
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from django_components_bootstrap.components.bootstrap5.lazy_fragment import (
+    decode_fragment,
+    encode_fragment,
+)
+
+from .utils import normalize_html
+
+
+def render(template_code, context=None):
+    template = Template("{% load component_tags %}" + template_code)
+    return normalize_html(template.render(Context(context or {})))
+
+
+def fragment_url(html):
+    return re.search(r'data-bs-lazy-fragment="([^"]+)"', html)[1]
+
+
+class LazyFragmentTests(SimpleTestCase):
+    def test_renders_skeleton_and_url(self):
+        html = render(
+            '{% component "LazyFragment" component="Badge" kwargs=kwargs lines=2 %}'
+            "{% endcomponent %}",
+            {"kwargs": {"bg": "info"}},
+        )
+        url = fragment_url(html)
+
+        self.assertTrue(url.startswith("/bootstrap/fragments/"))
+        self.assertHTMLEqual(
+            html.replace(url, "URL"),
+            '<div data-bs-lazy-fragment="URL" aria-busy="true">'
+            '<div class="placeholder-glow" aria-hidden="true">'
+            '<span class="placeholder col-7"></span><span class="placeholder col-4"></span>'
+            "</div></div>",
+        )
+
+    def test_custom_skeleton(self):
+        html = render(
+            '{% component "LazyFragment" component="Card" attrs:class="mb-3" %}'
+            '{% component "Spinner" / %}{% endcomponent %}'
+        )
+
+        self.assertIn('class="mb-3"', html)
+        self.assertIn('class="spinner-border"', html)
+        self.assertNotIn("placeholder", html)
+
+    def test_view_renders_component(self):
+        html = render(
+            '{% component "LazyFragment" component="Spinner" kwargs=kwargs / %}',
+            {"kwargs": {"size": "sm", "label": "Loading"}},
+        )
+
+        response = self.client.get(fragment_url(html))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertHTMLEqual(
+            normalize_html(
+                re.sub(r"<script.*</script>", "", response.content.decode(), flags=re.S)
+            ),
+            '<div class="spinner-border spinner-border-sm" role="status">'
+            '<span class="visually-hidden">Loading</span></div>',
+        )
+
+    def test_view_loads_dependencies(self):
+        # A nested LazyFragment needs the JS of LazyFragment to load in turn
+        token = encode_fragment("LazyFragment", {"component": "Spinner"})
+
+        response = self.client.get(f"/bootstrap/fragments/{token}/")
+
+        dependencies = json.loads(
+            re.search(r"<script type=\"application/json\" data-djc>(.*?)</script>", response.text)[
+                1
+            ]
+        )
+        self.assertIn(
+            "/components/cache/LazyFragment_",
+            b64decode(dependencies["toLoadJsTags"][0]).decode(),
+        )
+
+    def test_invalid_token(self):
+        token = encode_fragment("Badge")
+        tampered = self.client.get(f"/bootstrap/fragments/{token[:-1]}x/")
+        unknown = self.client.get(f"/bootstrap/fragments/{encode_fragment('Unknown')}/")
+
+        self.assertEqual(tampered.status_code, 404)
+        self.assertEqual(unknown.status_code, 404)
+
+    def test_expired_token(self):
+        token = encode_fragment("Spinner")
+
+        with mock.patch("time.time", return_value=time.time() + 25 * 60 * 60):
+            expired = self.client.get(f"/bootstrap/fragments/{token}/")
+            with override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"LAZY_FRAGMENT_MAX_AGE": None}):
+                unlimited = self.client.get(f"/bootstrap/fragments/{token}/")
+
+        self.assertEqual(expired.status_code, 404)
+        self.assertEqual(unlimited.status_code, 200)
+
+    def test_get_only(self):
+        response = self.client.post(f"/bootstrap/fragments/{encode_fragment('Badge')}/")
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_decode_fragment(self):
+        component, kwargs = decode_fragment(encode_fragment("Badge", {"bg": "dark"}))
+
+        self.assertEqual(component.__name__, "Badge")
+        self.assertEqual(kwargs, {"bg": "dark"})
+        with self.assertRaisesMessage(ValueError, "Invalid fragment"):
+            decode_fragment("nope")
@@ -0,0 +1,159 @@
+import re
+from contextlib import contextmanager
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+from django_components import Component
+from django_components.extension import OnTemplateLoadedContext
+from django_components.testing import djc_test
+
+from django_components_bootstrap.components.bootstrap5 import (
+    Badge,
+    Card,
+    CardBody,
+    CardText,
+    CardTitle,
+    CloseButton,
+    DropdownDivider,
+    FormTextarea,
+    Placeholder,
+    PlaceholderButton,
+    Spinner,
+)
+from django_components_bootstrap.minify import MinifyExtension, minify_template
+
+from .test_rendering import FAST_RENDER_CASES
+from .utils import normalize_html
+
+CARD_TEMPLATE = Template(
+    '{% load component_tags %}{% component "Card" %}{% component "CardBody" %}'
+    '{% component "CardTitle" %}Title{% endcomponent %}'
+    "<pre>  line 1\n  line 2</pre>"
+    '{% component "FormTextarea" %}\n  text\n{% endcomponent %}'
+    "{% endcomponent %}{% endcomponent %}"
+)
+
+
+def without_ids(html):
+    return re.sub(r' data-djc-id-\w+=""', "", html)
+
+
+@contextmanager
+def recompiled(*components):
+    # Compiled templates are cached on the component class
+    for component in components:
+        component._component_media.reset()
+    try:
+        yield
+    finally:
+        for component in components:
+            component._component_media.reset()
+
+
+class MinifyTemplateTests(SimpleTestCase):
+    def test_removes_indentation(self):
+        source = """
+            {% load component_tags %}
+
+            <div {% html_attrs attrs %}>
+                {% if title %}
+                    <h5>{{ title }}</h5>
+                {% endif %}
+                <p>
+                    Some
+                    {{ text }}
+                </p>
+            </div>
+        """
+
+        self.assertEqual(
+            minify_template(source),
+            " {% load component_tags %}<div {% html_attrs attrs %}> {% if title %}"
+            " <h5>{{ title }}</h5> {% endif %} <p> Some {{ text }} </p></div> ",
+        )
+
+    def test_keeps_inline_whitespace(self):
+        self.assertEqual(
+            minify_template('<span class="a">{{ a }} {{ b }}</span>  <b>x</b>'),
+            '<span class="a">{{ a }} {{ b }}</span>  <b>x</b>',
+        )
+
+    def test_keeps_preformatted_content(self):
+        source = """
+            <pre>
+                line
+            </pre>
+            <TEXTAREA rows="3">
+                {{ value }}
+            </TEXTAREA>
+            <script>
+                // comment
+                run()
+            </script>
+        """
+
+        self.assertEqual(
+            minify_template(source),
+            ' <pre>\n                line\n            </pre><TEXTAREA rows="3">\n'
+            "                {{ value }}\n            </TEXTAREA><script>\n"
+            "                // comment\n                run()\n            </script> ",
+        )
+
+
+class MinifyExtensionTests(SimpleTestCase):
+    @djc_test
+    def test_only_bootstrap_components(self):
+        class Other(Component):
+            template = "<div>\n    x\n</div>"
+
+        extension = MinifyExtension()
+
+        self.assertEqual(
+            extension.on_template_loaded(
+                OnTemplateLoadedContext(Card, "<div>\n    x\n</div>", None, None)
+            ),
+            "<div> x </div>",
+        )
+        self.assertIsNone(
+            extension.on_template_loaded(OnTemplateLoadedContext(Other, Other.template, None, None))
+        )
+
+    def test_fast_render_matches_minified_template(self):
+        template = Template("{% load component_tags %}" + "".join(FAST_RENDER_CASES))
+        components = (
+            Badge,
+            CardText,
+            CloseButton,
+            DropdownDivider,
+            Placeholder,
+            PlaceholderButton,
+            Spinner,
+        )
+
+        @djc_test(components_settings={"extensions": [MinifyExtension]})
+        def render():
+            with recompiled(*components):
+                return template.render(Context({"value": "<escaped & value>"}))
+
+        minified = render()
+        with override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"FAST_RENDER": True}):
+            fast = template.render(Context({"value": "<escaped & value>"}))
+
+        self.assertEqual(without_ids(fast), without_ids(minified))
+
+    def test_rendered_output(self):
+        with recompiled(Card, CardBody, CardTitle, FormTextarea):
+            expected = CARD_TEMPLATE.render(Context())
+
+            @djc_test(components_settings={"extensions": [MinifyExtension]})
+            def render():
+                with recompiled(Card, CardBody, CardTitle, FormTextarea):
+                    return CARD_TEMPLATE.render(Context())
+
+            rendered = render()
+
+        self.assertLess(len(rendered), len(expected) * 0.7)
+        self.assertEqual(normalize_html(rendered), normalize_html(expected))
+        self.assertIn("<pre>  line 1\n  line 2</pre>", rendered)
+        self.assertIn('">\n  text\n</textarea>', rendered)
+        self.assertNotIn("\n ", rendered.replace("\n  line 2", "").replace("\n  text", ""))
@@ -1,5 +1,18 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.paginator import Paginator as DjangoPaginator
 from django.template import Context, Template
-from django.test import SimpleTestCase
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from django_components_bootstrap.components.bootstrap5 import CursorPagination, Paginator
+from django_components_bootstrap.components.bootstrap5.pagination import (
+    KeysetPage,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+    page_window,
+)
 
 from .utils import normalize_html
 
@@ -240,3 +253,245 @@ class PaginationTests(SimpleTestCase):
         """
 
         self.assertHTMLEqual(normalize_html(expected), rendered)
+
+
+class CountedList(list):
+    count_calls = 0
+
+    def count(self):
+        self.count_calls += 1
+        return len(self)
+
+
+class PaginatorTests(SimpleTestCase):
+    maxDiff = None
+
+    def test_paginator(self):
+        template = Template("""
+            {% load component_tags %}
+            {% component "Paginator" total=500 current=7 per_page=10 / %}
+        """)
+        rendered = normalize_html(template.render(Context({})))
+
+        expected = """
+            <nav aria-label="Page navigation">
+              <ul class="pagination">
+                <li class="page-item">
+                  <a class="page-link" href="?page=1">
+                    <span aria-hidden="true">«</span><span class="visually-hidden">First</span>
+                  </a>
+                </li>
+                <li class="page-item">
+                  <a class="page-link" href="?page=6">
+                    <span aria-hidden="true">‹</span><span class="visually-hidden">Previous</span>
+                  </a>
+                </li>
+                <li class="page-item"><a class="page-link" href="?page=1">1</a></li>
+                <li class="page-item">
+                  <span class="page-link">
+                    <span aria-hidden="true">…</span><span class="visually-hidden">More</span>
+                  </span>
+                </li>
+                <li class="page-item"><a class="page-link" href="?page=5">5</a></li>
+                <li class="page-item"><a class="page-link" href="?page=6">6</a></li>
+                <li class="page-item active">
+                  <a class="page-link" href="?page=7" aria-current="page">7</a>
+                </li>
+                <li class="page-item"><a class="page-link" href="?page=8">8</a></li>
+                <li class="page-item"><a class="page-link" href="?page=9">9</a></li>
+                <li class="page-item">
+                  <span class="page-link">
+                    <span aria-hidden="true">…</span><span class="visually-hidden">More</span>
+                  </span>
+                </li>
+                <li class="page-item"><a class="page-link" href="?page=50">50</a></li>
+                <li class="page-item">
+                  <a class="page-link" href="?page=8">
+                    <span aria-hidden="true">›</span><span class="visually-hidden">Next</span>
+                  </a>
+                </li>
+                <li class="page-item">
+                  <a class="page-link" href="?page=50">
+                    <span aria-hidden="true">»</span><span class="visually-hidden">Last</span>
+                  </a>
+                </li>
+              </ul>
+            </nav>
+        """
+
+        self.assertHTMLEqual(normalize_html(expected), rendered)
+
+    def test_matches_building_blocks(self):
+        rendered = Template(
+            '{% load component_tags %}{% component "Paginator" total=20 per_page=10 size="sm" / %}'
+        ).render(Context({}))
+        expected = Template("""
+            {% load component_tags %}
+            {% component "Pagination" size="sm" %}
+                {% component "PaginationFirst" disabled=True / %}
+                {% component "PaginationPrev" disabled=True / %}
+                {% component "PaginationItem" href="?page=1" active=True %}1{% endcomponent %}
+                {% component "PaginationItem" href="?page=2" %}2{% endcomponent %}
+                {% component "PaginationNext" href="?page=2" / %}
+                {% component "PaginationLast" href="?page=2" / %}
+            {% endcomponent %}
+        """).render(Context({}))
+
+        self.assertHTMLEqual(normalize_html(rendered), normalize_html(expected))
+
+    def test_page_window(self):
+        self.assertEqual(page_window(1, 1), [1])
+        self.assertEqual(page_window(1, 10), [1, 2, 3, None, 10])
+        self.assertEqual(page_window(4, 10), [1, 2, 3, 4, 5, 6, None, 10])
+        self.assertEqual(page_window(5, 10), [1, 2, 3, 4, 5, 6, 7, None, 10])
+        self.assertEqual(page_window(6, 10), [1, None, 4, 5, 6, 7, 8, 9, 10])
+        self.assertEqual(page_window(7, 10), [1, None, 5, 6, 7, 8, 9, 10])
+        self.assertEqual(page_window(10, 10, window=1), [1, None, 9, 10])
+        self.assertEqual(
+            page_window(500_000, 1_000_000, window=1)[1:-1], [None, 499_999, 500_000, 500_001, None]
+        )
+
+    def test_django_page_counts_once(self):
+        rows = CountedList(range(95))
+        page = DjangoPaginator(rows, 10).page(10)
+
+        rendered = Paginator.render(kwargs={"page": page, "first_last": False})
+
+        self.assertEqual(rows.count_calls, 1)
+        self.assertIn('href="?page=9">9</a>', rendered)
+        self.assertIn('aria-current="page">10</a>', rendered)
+        self.assertIn('aria-disabled="true"><span aria-hidden="true">›</span>', rendered)
+        self.assertNotIn("First", rendered)
+
+    def test_keeps_query_string(self):
+        request = RequestFactory().get("/orders/", {"q": "a&b", "p": "3", "sort": "-date"})
+
+        rendered = Paginator.render(
+            kwargs={"total": 100, "current": 3, "per_page": 10, "param": "p"}, request=request
+        )
+
+        self.assertIn('href="?q=a%26b&amp;sort=-date&amp;p=4"', rendered)
+        self.assertNotIn("p=3&amp;", rendered)
+
+    def test_requires_page_or_total(self):
+        with self.assertRaisesMessage(ValueError, "requires either 'page', or 'total' and"):
+            Paginator.render(kwargs={"total": 100})
+
+
+class CursorTests(SimpleTestCase):
+    def test_round_trip(self):
+        cursor = encode_cursor(["name 3", 3, date(2024, 1, 31)], before=True)
+
+        self.assertRegex(cursor, r"^[\w.:-]+$")
+        self.assertEqual(decode_cursor(cursor), (["name 3", 3, "2024-01-31"], True))
+        self.assertEqual(decode_cursor(encode_cursor([1])), ([1], False))
+
+    def test_invalid_cursor(self):
+        cursor = encode_cursor([1])
+
+        for invalid in ["", "abc", cursor[:-1] + ("A" if cursor[-1] != "A" else "B")]:
+            with self.subTest(invalid), self.assertRaisesMessage(ValueError, "Invalid cursor"):
+                decode_cursor(invalid)
+
+
+class KeysetPageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.bulk_create(
+            [User(username=f"user{i}", first_name=f"name {i % 3}") for i in range(10)]
+        )
+        cls.expected = list(User.objects.order_by("first_name", "pk"))
+
+    def test_forward_and_back(self):
+        queryset = User.objects.all()
+        ordering = ["first_name", "pk"]
+
+        first = keyset_page(queryset, ordering, per_page=4)
+        self.assertEqual(first.rows, self.expected[:4])
+        self.assertIsNone(first.prev_cursor)
+
+        second = keyset_page(queryset, ordering, first.next_cursor, per_page=4)
+        self.assertEqual(second.rows, self.expected[4:8])
+
+        last = keyset_page(queryset, ordering, second.next_cursor, per_page=4)
+        self.assertEqual(last.rows, self.expected[8:])
+        self.assertIsNone(last.next_cursor)
+
+        back = keyset_page(queryset, ordering, last.prev_cursor, per_page=4)
+        self.assertEqual(back.rows, self.expected[4:8])
+
+        start = keyset_page(queryset, ordering, back.prev_cursor, per_page=4)
+        self.assertEqual(start.rows, self.expected[:4])
+        self.assertIsNone(start.prev_cursor)
+        self.assertEqual(decode_cursor(start.next_cursor), decode_cursor(first.next_cursor))
+
+    def test_descending_values(self):
+        queryset = User.objects.values("pk", "first_name")
+        expected = list(queryset.order_by("-first_name", "-pk"))
+
+        page = keyset_page(queryset, ["-first_name", "-pk"], per_page=3)
+        page = keyset_page(queryset, ["-first_name", "-pk"], page.next_cursor, per_page=3)
+
+        self.assertEqual(page.rows, expected[3:6])
+
+    def test_cursor_for_other_ordering(self):
+        page = keyset_page(User.objects.all(), ["pk"], per_page=4)
+
+        with self.assertRaisesMessage(ValueError, "Invalid cursor for ordering"):
+            keyset_page(User.objects.all(), ["first_name", "pk"], page.next_cursor)
+
+
+class CursorPaginationTests(SimpleTestCase):
+    maxDiff = None
+
+    def test_cursor_pagination(self):
+        template = Template("""
+            {% load component_tags %}
+            {% component "CursorPagination" next_cursor="abc" / %}
+        """)
+        rendered = normalize_html(template.render(Context({})))
+
+        expected = """
+            <nav aria-label="Page navigation">
+              <ul class="pagination">
+                <li class="page-item disabled">
+                  <a class="page-link" href="#" tabindex="-1" aria-disabled="true">
+                    <span aria-hidden="true">‹</span><span class="visually-hidden">Previous</span>
+                  </a>
+                </li>
+                <li class="page-item">
+                  <a class="page-link" href="?cursor=abc">
+                    <span aria-hidden="true">›</span><span class="visually-hidden">Next</span>
+                  </a>
+                </li>
+              </ul>
+            </nav>
+        """
+
+        self.assertHTMLEqual(normalize_html(expected), rendered)
+
+    def test_matches_building_blocks(self):
+        rendered = Template(
+            '{% load component_tags %}{% component "CursorPagination" prev_cursor="a" / %}'
+        ).render(Context({}))
+        expected = Template("""
+            {% load component_tags %}
+            {% component "Pagination" %}
+                {% component "PaginationPrev" href="?cursor=a" / %}
+                {% component "PaginationNext" disabled=True / %}
+            {% endcomponent %}
+        """).render(Context({}))
+
+        self.assertHTMLEqual(normalize_html(rendered), normalize_html(expected))
+
+    def test_page_and_query_string(self):
+        page = KeysetPage([], encode_cursor([1], before=True), encode_cursor([2]))
+        request = RequestFactory().get("/", {"q": "x", "after": "old"})
+
+        rendered = CursorPagination.render(
+            kwargs={"page": page, "param": "after", "size": "lg"}, request=request
+        )
+
+        self.assertIn('class="pagination pagination-lg"', rendered)
+        self.assertIn(f'href="?q=x&amp;after={page.prev_cursor}"', rendered)
+        self.assertIn(f'href="?q=x&amp;after={page.next_cursor}"', rendered)
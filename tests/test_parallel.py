@@ -0,0 +1,221 @@
+import re
+import threading
+import time
+from contextvars import ContextVar
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone, translation
+from django.utils.safestring import mark_safe
+from django_components import registry
+
+from django_components_bootstrap.components.bootstrap5 import (
+    Badge,
+    Card,
+    Col,
+    ParallelGroup,
+)
+from django_components_bootstrap.components.bootstrap5.parallel import (
+    render_fragments,
+    timed_out_fragments,
+)
+from django_components_bootstrap.registry import is_loaded, register_lazy
+
+from .utils import normalize_html
+
+
+def col(text, delay=0.0):
+    def fragment():
+        time.sleep(delay)
+        return Col.render(slots={"default": text})
+
+    return fragment
+
+
+class ParallelGroupTests(SimpleTestCase):
+    maxDiff = None
+
+    def test_results_in_order(self):
+        html = ParallelGroup.render(
+            kwargs={
+                "fragments": [col("1", 0.03), col("2"), mark_safe('<div class="col">3</div>')],
+                "container_kwargs": {"cols": 3},
+            }
+        )
+
+        self.assertHTMLEqual(
+            normalize_html(html),
+            '<div class="row row-cols-3"><div class="col">1</div><div class="col">2</div>'
+            '<div class="col">3</div></div>',
+        )
+
+    def test_fragments_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fragment():
+            barrier.wait()
+            return threading.current_thread().name
+
+        html = ParallelGroup.render(kwargs={"fragments": [fragment] * 3, "max_workers": 3})
+
+        self.assertEqual(normalize_html(html).count("bootstrap-parallel"), 3)
+
+    def test_max_workers(self):
+        running = []
+        most = []
+        lock = threading.Lock()
+
+        def fragment():
+            with lock:
+                running.append(1)
+                most.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+            return "x"
+
+        ParallelGroup.render(kwargs={"fragments": [fragment] * 6, "max_workers": 2})
+
+        self.assertEqual(max(most), 2)
+
+    def test_timeout_falls_back_to_placeholder(self):
+        html = ParallelGroup.render(
+            kwargs={"fragments": [col("fast"), col("slow", 1)], "timeout": 0.2, "as_": "CardGroup"}
+        )
+
+        self.assertHTMLEqual(
+            normalize_html(html),
+            '<div class="card-group"><div class="col">fast</div>'
+            '<div aria-hidden="true" class="placeholder placeholder-glow col-12"></div></div>',
+        )
+
+    def test_custom_fallback(self):
+        html = ParallelGroup.render(
+            kwargs={
+                "fragments": [col("slow", 1)],
+                "timeout": 0.05,
+                "fallback": lambda: mark_safe('<div class="col">Unavailable</div>'),
+            }
+        )
+
+        self.assertHTMLEqual(
+            normalize_html(html), '<div class="row"><div class="col">Unavailable</div></div>'
+        )
+
+    def test_errors_are_raised(self):
+        def fragment():
+            raise ValueError("source failed")
+
+        with self.assertRaisesMessage(ValueError, "source failed"):
+            ParallelGroup.render(kwargs={"fragments": [col("1"), fragment]})
+
+    def test_escapes_plain_strings(self):
+        html = ParallelGroup.render(kwargs={"fragments": [lambda: "<b>", "&"]})
+
+        self.assertHTMLEqual(normalize_html(html), '<div class="row">&lt;b&gt;&amp;</div>')
+
+    def test_in_template(self):
+        cards = [
+            lambda: Card.render(slots={"default": "Orders"}),
+            lambda: Card.render(slots={"default": "Revenue"}),
+        ]
+        template = Template(
+            '{% load component_tags %}{% component "ParallelGroup" fragments=cards as_="CardGroup" '
+            'attrs:class="mb-3" / %}'
+        )
+
+        html = template.render(Context({"cards": cards}))
+
+        self.assertHTMLEqual(
+            normalize_html(html),
+            '<div class="card-group mb-3"><div class="card">Orders</div>'
+            '<div class="card">Revenue</div></div>',
+        )
+
+    def test_same_component_in_many_threads(self):
+        template = Template(
+            '{% load component_tags %}{% component "Accordion" attrs:id=accordion_id %}'
+            '{% component "AccordionItem" %}'
+            '{% component "AccordionHeader" %}{{ n }}{% endcomponent %}'
+            '{% component "AccordionBody" %}Body {{ n }}{% endcomponent %}'
+            "{% endcomponent %}{% endcomponent %}"
+        )
+        barrier = threading.Barrier(12, timeout=5)
+
+        def accordion(n):
+            def fragment():
+                barrier.wait()
+                return template.render(Context({"n": n, "accordion_id": f"accordion-{n}"}))
+
+            return fragment
+
+        def group(offset, results):
+            results[offset] = ParallelGroup.render(
+                kwargs={"fragments": [accordion(offset + i) for i in range(4)], "max_workers": 4}
+            )
+
+        results = {}
+        callers = [threading.Thread(target=group, args=(offset, results)) for offset in (0, 4, 8)]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+
+        def without_ids(html):
+            return re.sub(r"accordion-item-\w+-", "accordion-item-", normalize_html(html))
+
+        html = without_ids("".join(results.values()))
+        for n in range(12):
+            serial = template.render(Context({"n": n, "accordion_id": f"accordion-{n}"}))
+            self.assertIn(without_ids(serial), html)
+
+    def test_timed_out_fragments_are_bounded(self):
+        release = threading.Event()
+        calls = []
+
+        def blocked():
+            release.wait(5)
+            return "late"
+
+        def fast():
+            calls.append(1)
+            return "fast"
+
+        with override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"PARALLEL_MAX_TIMED_OUT": 1}):
+            try:
+                self.assertEqual(render_fragments([blocked], timeout=0.05, fallback="-"), ["-"])
+                self.assertEqual(timed_out_fragments(), 1)
+                self.assertEqual(render_fragments([fast, "x"], timeout=1, fallback="-"), ["-", "x"])
+                self.assertEqual(render_fragments([fast]), ["fast"])
+            finally:
+                release.set()
+
+            deadline = time.monotonic() + 5
+            while timed_out_fragments() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(render_fragments([fast], timeout=1, fallback="-"), ["fast"])
+
+        self.assertEqual(len(calls), 2)
+
+    def test_fragments_see_the_callers_context(self):
+        request_id = ContextVar("request_id")
+        request_id.set("abc")
+
+        def fragment():
+            return f"{translation.get_language()} {timezone.get_current_timezone_name()}"
+
+        with translation.override("nl"), timezone.override("Europe/Amsterdam"):
+            results = render_fragments([fragment, fragment, request_id.get])
+
+        self.assertEqual(results, ["nl Europe/Amsterdam", "nl Europe/Amsterdam", "abc"])
+
+    def test_lazy_components_stay_unloaded(self):
+        registry.unregister("Badge")
+        try:
+            register_lazy(registry, "Badge")
+            render_fragments([lambda: "x"])
+
+            self.assertFalse(is_loaded(registry, "Badge"))
+        finally:
+            registry.unregister("Badge")
+            registry.register("Badge", Badge)
@@ -0,0 +1,104 @@
+from importlib.util import find_spec
+from types import SimpleNamespace
+from unittest import skipUnless
+
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase
+
+from django_components_bootstrap.components.bootstrap5 import Button, ParallelGroup
+from django_components_bootstrap.profiling import profile_components
+
+NESTED = Template("""
+    {% load component_tags %}
+    {% component "Row" %}
+        {% component "Col" %}
+            {% component "Button" %}One{% endcomponent %}
+            {% component "Button" %}Two{% endcomponent %}
+        {% endcomponent %}
+    {% endcomponent %}
+""")
+
+
+class ProfilingTests(SimpleTestCase):
+    def test_collects_stats_per_component_class(self):
+        with profile_components() as profile:
+            rendered = NESTED.render(Context({}))
+            NESTED.render(Context({}))
+
+        stats = {row["name"]: row for row in profile.rows()}
+        self.assertEqual(sorted(stats), ["Button", "Col", "Row"])
+        self.assertEqual(stats["Row"]["calls"], 2)
+        self.assertEqual(stats["Col"]["calls"], 2)
+        self.assertEqual(stats["Button"]["calls"], 4)
+
+        for row in stats.values():
+            self.assertGreater(row["data_ms"], 0)
+            self.assertGreater(row["render_ms"], 0)
+            self.assertAlmostEqual(row["total_ms"], row["data_ms"] + row["render_ms"])
+            self.assertGreater(row["self_ms"], 0)
+            self.assertLessEqual(row["self_ms"], row["total_ms"])
+
+        self.assertGreater(stats["Row"]["total_ms"], stats["Col"]["total_ms"])
+        self.assertAlmostEqual(
+            stats["Row"]["total_ms"],
+            stats["Row"]["self_ms"] + stats["Col"]["self_ms"] + stats["Button"]["self_ms"],
+        )
+        self.assertGreaterEqual(stats["Row"]["output_size"], 2 * len(rendered.strip()))
+
+    def test_rows_sorted_by_self_time(self):
+        with profile_components() as profile:
+            NESTED.render(Context({}))
+
+        self_times = [row["self_ms"] for row in profile.rows()]
+        self.assertEqual(self_times, sorted(self_times, reverse=True))
+
+    def test_parallel_fragments(self):
+        fragments = [lambda: Button.render(slots={"default": "One"})] * 4
+        with profile_components() as profile:
+            ParallelGroup.render(kwargs={"fragments": fragments, "max_workers": 4})
+
+        stats = {row["name"]: row for row in profile.rows()}
+        self.assertEqual(stats["Button"]["calls"], 4)
+        self.assertEqual(stats["ParallelGroup"]["calls"], 1)
+
+    def test_inactive_outside_context_manager(self):
+        with profile_components() as profile:
+            pass
+        NESTED.render(Context({}))
+
+        self.assertEqual(profile.rows(), [])
+
+    def test_nested_profiles(self):
+        with profile_components() as outer:
+            NESTED.render(Context({}))
+            with profile_components() as inner:
+                Template(
+                    '{% load component_tags %}{% component "Badge" %}1{% endcomponent %}'
+                ).render(Context({}))
+
+        self.assertEqual([row["name"] for row in inner.rows()], ["Badge"])
+        self.assertNotIn("Badge", [row["name"] for row in outer.rows()])
+
+
+@skipUnless(find_spec("debug_toolbar"), "django-debug-toolbar is not installed")
+class ComponentProfilingPanelTests(SimpleTestCase):
+    def test_records_stats_for_request(self):
+        from django_components_bootstrap.panels import ComponentProfilingPanel
+
+        def view(request):
+            return HttpResponse(NESTED.render(Context({})))
+
+        toolbar = SimpleNamespace(
+            stats={}, request_id="1", store=SimpleNamespace(save_panel=lambda *args: None)
+        )
+        panel = ComponentProfilingPanel(toolbar, view)
+        request = RequestFactory().get("/")
+
+        response = panel.process_request(request)
+        panel.generate_stats(request, response)
+
+        stats = panel.get_stats()
+        self.assertEqual([row["name"] for row in stats["rows"]].count("Button"), 1)
+        self.assertEqual(stats["calls"], 4)
+        self.assertRegex(panel.nav_subtitle, r"^4 renders in \d+\.\d\dms$")
@@ -0,0 +1,155 @@
+import re
+import subprocess
+import sys
+from unittest import mock
+
+from django.template import Context, Library, Template
+from django.test import SimpleTestCase
+from django_components import ComponentRegistry, registry
+
+from django_components_bootstrap import registry as bootstrap_registry
+from django_components_bootstrap.components import bootstrap5
+from django_components_bootstrap.registry import (
+    DEPENDENCIES,
+    get_component_names,
+    is_loaded,
+    register_lazy,
+    supports_lazy_registration,
+)
+
+from .utils import normalize_html
+
+
+class ComponentNamesTests(SimpleTestCase):
+    def test_all_components_by_default(self):
+        self.assertEqual(sorted(get_component_names()), bootstrap5.__all__)
+
+    def test_include_adds_dependencies(self):
+        self.assertEqual(
+            sorted(get_component_names(include=["Alert", "SplitButton"])),
+            [
+                "Alert",
+                "Button",
+                "ButtonGroup",
+                "CloseButton",
+                "Dropdown",
+                "DropdownMenu",
+                "DropdownToggle",
+                "SplitButton",
+            ],
+        )
+
+    def test_exclude(self):
+        names = get_component_names(exclude=["Carousel", "Tooltip"])
+
+        self.assertNotIn("Carousel", names)
+        self.assertNotIn("Tooltip", names)
+        self.assertIn("CarouselItem", names)
+
+    def test_unknown_name(self):
+        with self.assertRaisesMessage(ValueError, "Unknown bootstrap components: Buton"):
+            get_component_names(include=["Buton"])
+
+    def test_dependencies_cover_nested_components(self):
+        for name in bootstrap5.__all__:
+            used = set(
+                re.findall(r'{% component "(\w+)"', getattr(bootstrap5, name).template or "")
+            )
+            with self.subTest(name):
+                self.assertLessEqual(used, set(get_component_names(include=[name])))
+
+        for name, dependencies in DEPENDENCIES.items():
+            self.assertLessEqual({name, *dependencies}, set(bootstrap5.__all__))
+
+
+class LazyRegistryTests(SimpleTestCase):
+    def setUp(self):
+        self.registry = ComponentRegistry(library=Library())
+
+    def tearDown(self):
+        self.registry.clear()
+
+    def test_import_deferred_until_resolved(self):
+        with mock.patch.object(
+            bootstrap_registry, "import_module", wraps=bootstrap_registry.import_module
+        ) as import_module:
+            register_lazy(self.registry, "Badge")
+            register_lazy(self.registry, "Modal")
+
+            self.assertTrue(self.registry.has("Badge"))
+            self.assertFalse(is_loaded(self.registry, "Badge"))
+            import_module.assert_not_called()
+
+            self.assertIs(self.registry.get("Badge"), bootstrap5.Badge)
+            self.assertIs(self.registry.get("Badge"), bootstrap5.Badge)
+
+        import_module.assert_called_once_with(
+            "django_components_bootstrap.components.bootstrap5.badge"
+        )
+        self.assertTrue(is_loaded(self.registry, "Badge"))
+        self.assertFalse(is_loaded(self.registry, "Modal"))
+
+    def test_all_resolves_lazy_entries(self):
+        register_lazy(self.registry, "Badge")
+        register_lazy(self.registry, "Spinner")
+
+        self.assertEqual(
+            self.registry.all(), {"Badge": bootstrap5.Badge, "Spinner": bootstrap5.Spinner}
+        )
+        self.assertTrue(is_loaded(self.registry, "Spinner"))
+
+    def test_renders_through_lazy_entry(self):
+        registry.unregister("Badge")
+        try:
+            register_lazy(registry, "Badge")
+            rendered = Template(
+                '{% load component_tags %}{% component "Badge" bg="info" %}1{% endcomponent %}'
+            ).render(Context({}))
+        finally:
+            registry.unregister("Badge")
+            registry.register("Badge", bootstrap5.Badge)
+
+        self.assertHTMLEqual(normalize_html(rendered), '<span class="badge text-bg-info">1</span>')
+
+    def test_registry_internals(self):
+        # `register_lazy()` writes to these private `ComponentRegistry` attributes
+        entry = self.registry._register_to_library("Internals", None)
+
+        self.assertEqual(entry.tag, "component")
+        self.assertIsInstance(self.registry._registry, dict)
+        self.assertIsInstance(self.registry._tags, dict)
+        self.registry.register("Badge", bootstrap5.Badge)
+        self.assertEqual(self.registry._tags, {"component": {"Badge"}})
+        self.assertEqual(self.registry._registry["Badge"].cls, bootstrap5.Badge)
+
+    def test_falls_back_to_eager_registration(self):
+        self.assertTrue(supports_lazy_registration(self.registry))
+
+        with mock.patch.object(self.registry, "_tags", None):
+            self.assertFalse(supports_lazy_registration(self.registry))
+
+        with mock.patch.object(
+            bootstrap_registry, "supports_lazy_registration", return_value=False
+        ):
+            register_lazy(self.registry, "Badge")
+
+        self.assertTrue(is_loaded(self.registry, "Badge"))
+        self.assertIs(self.registry.get("Badge"), bootstrap5.Badge)
+
+    def test_unregister(self):
+        register_lazy(self.registry, "Badge")
+        self.registry.unregister("Badge")
+
+        self.assertFalse(self.registry.has("Badge"))
+
+    def test_package_import_does_not_import_components(self):
+        code = (
+            "import sys\n"
+            "import django_components_bootstrap.components.bootstrap5 as b\n"
+            "print(sorted(m for m in sys.modules if m.startswith(b.__name__ + '.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        self.assertEqual(result.stdout.strip(), "[]")
@@ -0,0 +1,268 @@
+import gc
+import re
+
+from django.contrib.auth.models import Group
+from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+from django_components.component import component_context_cache
+from django_components.provide import component_provides, provide_cache
+
+from django_components_bootstrap.components.bootstrap5.rendering import (
+    DYNAMIC,
+    AttrsRenderer,
+    _encode_kwargs,
+)
+
+from .utils import mock_component_id, normalize_html
+
+FAST_RENDER_CASES = [
+    '{% component "Badge" bg="secondary" %}New{% endcomponent %}',
+    '{% component "Badge" bg="light" text="dark" pill=True as_="a" attrs:href="/x?a=1&b=2" %}9{% endcomponent %}',
+    '{% component "Badge" %}{% component "Spinner" size="sm" / %} <b>Loading</b>{% endcomponent %}',
+    '{% component "Spinner" / %}',
+    '{% component "Spinner" animation="grow" variant="danger" label="<Wait>" attrs:class="ms-2" / %}',
+    '{% component "CloseButton" / %}',
+    '{% component "CloseButton" variant="white" disabled=True attrs:aria-label="Dismiss" / %}',
+    '{% component "Placeholder" / %}',
+    '{% component "Placeholder" as_="div" size="lg" bg="primary" animation="glow" xs=6 / %}',
+    '{% component "PlaceholderButton" variant="secondary" xs=4 attrs:data-id="1" / %}',
+    '{% component "CardText" %}Some quick example text.{% endcomponent %}',
+    '{% component "CardText" attrs:class="small" attrs:style="color: red" %}{{ value }}{% endcomponent %}',
+    '{% component "DropdownDivider" / %}',
+    '{% component "DropdownDivider" attrs:class="my-1" / %}',
+]
+
+ID_TEMPLATE = Template("""
+    {% load component_tags %}
+    {% component "Accordion" %}
+        {% component "AccordionItem" %}
+            {% component "AccordionHeader" %}Question{% endcomponent %}
+            {% component "AccordionBody" %}Answer{% endcomponent %}
+        {% endcomponent %}
+    {% endcomponent %}
+    {% component "Collapse" %}One{% endcomponent %}
+    {% component "Collapse" %}Two{% endcomponent %}
+    {% component "Modal" attrs:id="confirm" %}Sure?{% endcomponent %}
+""")
+
+
+def html_ids(html):
+    return re.findall(r' id="([^"]+)"', html)
+
+
+class FastRenderTests(SimpleTestCase):
+    maxDiff = None
+
+    def render(self, template_code, fast):
+        gc.collect()
+        component_context_cache.clear()
+        component_provides.clear()
+        provide_cache.clear()
+
+        template = Template("{% load component_tags %}" + template_code)
+        with (
+            override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"FAST_RENDER": fast}),
+            mock_component_id(),
+        ):
+            return template.render(Context({"value": "<escaped & value>"}))
+
+    def test_output_matches_template(self):
+        for template_code in FAST_RENDER_CASES:
+            with self.subTest(template_code):
+                self.assertEqual(
+                    normalize_html(self.render(template_code, fast=True)),
+                    normalize_html(self.render(template_code, fast=False)),
+                )
+
+    def test_disabled_by_default(self):
+        from django_components_bootstrap.components.bootstrap5 import Badge
+
+        calls = []
+        original = Badge.render_fast
+        Badge.render_fast = lambda self, context: calls.append(self) or original(self, context)
+        try:
+            Template('{% load component_tags %}{% component "Badge" %}x{% endcomponent %}').render(
+                Context({})
+            )
+        finally:
+            Badge.render_fast = original
+
+        self.assertEqual(calls, [])
+
+
+class IdStrategyTests(SimpleTestCase):
+    def render(self, strategy):
+        with override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"ID_STRATEGY": strategy}):
+            return normalize_html(ID_TEMPLATE.render(Context({})))
+
+    def test_render_ids_differ_per_render(self):
+        self.assertNotEqual(self.render("render"), self.render("render"))
+
+    def test_counter(self):
+        html = self.render("counter")
+
+        self.assertEqual(html, self.render("counter"))
+        self.assertEqual(
+            html_ids(html),
+            [
+                "accordion-1",
+                "accordion-item-2-heading",
+                "accordion-item-2-collapse",
+                "collapse-3",
+                "collapse-4",
+                "confirm",
+            ],
+        )
+
+    def test_hash(self):
+        html = self.render("hash")
+
+        self.assertEqual(html, self.render("hash"))
+        ids = html_ids(html)
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertRegex(ids[3], r"^collapse-[0-9a-f]{7}$")
+        self.assertEqual(ids[4], f"{ids[3]}-2")
+
+    def test_hash_depends_on_kwargs(self):
+        template = Template(
+            '{% load component_tags %}{% component "Collapse" show=show %}x{% endcomponent %}'
+        )
+        with override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"ID_STRATEGY": "hash"}):
+            shown = template.render(Context({"show": True}))
+            hidden = template.render(Context({"show": False}))
+
+        self.assertNotEqual(html_ids(shown), html_ids(hidden))
+
+    def test_hash_of_unencodable_kwargs(self):
+        from django_components_bootstrap.components.bootstrap5 import Modal
+
+        def render():
+            html = Modal.render(
+                kwargs={"attrs": {"data-x": object()}},
+                slots={"default": "x"},
+                deps_strategy="ignore",
+            )
+            return html_ids(html)[0]
+
+        with override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"ID_STRATEGY": "hash"}):
+            self.assertEqual(render(), "modal-1")
+            self.assertEqual(render(), "modal-1")
+
+    def test_querysets_are_not_encoded(self):
+        # Encoding a queryset would run its query, which is not allowed in this test case
+        self.assertIsNone(_encode_kwargs("table", {"rows": Group.objects.all()}))
+        self.assertEqual(_encode_kwargs("table", {"rows": {2, 1}}), '["table",{"rows":[1,2]}]')
+
+    def test_id_scope_takes_precedence(self):
+        html = self.render("counter")
+        with override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"ID_STRATEGY": "counter"}):
+            cached = normalize_html(
+                Template(
+                    '{% load component_tags %}{% component "CachedFragment" key="ids" %}'
+                    '{% component "Collapse" %}One{% endcomponent %}{% endcomponent %}'
+                ).render(Context({}))
+            )
+
+        self.assertIn("collapse-3", html)
+        self.assertRegex(html_ids(cached)[0], r"^collapse-f[0-9a-f]{6}-1$")
+
+    def test_unknown_strategy(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "'uuid'"):
+            self.render("uuid")
+
+
+class ParentContextTests(SimpleTestCase):
+    def render(self, template_code):
+        template = Template("{% load component_tags %}" + template_code)
+        return normalize_html(template.render(Context({})))
+
+    def test_reaches_nested_components(self):
+        html = self.render(
+            '{% component "Modal" attrs:id="dialog" %}{% component "ModalHeader" %}'
+            '{% component "ModalTitle" %}Title{% endcomponent %}{% endcomponent %}{% endcomponent %}'
+        )
+
+        self.assertIn('<h5 id="dialog-label" class="modal-title"> Title </h5>', html)
+
+    def test_reaches_slot_fills_and_isolated_components(self):
+        # Relies on django-components copying the `{% provide %}` context prefix
+        html = self.render(
+            '{% component "Modal" attrs:id="dialog" %}{% component "Card" %}'
+            '{% component "ModalTitle" only %}Title{% endcomponent %}'
+            "{% endcomponent %}{% endcomponent %}"
+        )
+
+        self.assertIn('<h5 id="dialog-label" class="modal-title"> Title </h5>', html)
+
+    def test_closest_parent_wins(self):
+        html = self.render(
+            '{% component "FormGroup" control_id="outer" %}'
+            '{% component "FormLabel" %}Outer{% endcomponent %}'
+            '{% component "FloatingLabel" label="Inner" control_id="inner" %}'
+            '{% component "FormControl" / %}{% endcomponent %}'
+            '{% component "FormControl" / %}{% endcomponent %}'
+        )
+
+        self.assertEqual(html_ids(html), ["inner", "outer"])
+        self.assertIn('for="outer"', html)
+
+    def test_not_shared_with_siblings(self):
+        html = self.render(
+            '{% component "FormGroup" control_id="email" %}Email{% endcomponent %}'
+            '{% component "FormControl" / %}'
+        )
+
+        self.assertEqual(html_ids(html), [])
+
+    def test_missing_parent_raises(self):
+        with self.assertRaisesMessage(
+            KeyError, "Component 'ModalTitle' tried to inject a variable 'modal' before it was"
+        ):
+            self.render('{% component "ModalTitle" %}Title{% endcomponent %}')
+
+
+class AttrsRendererTests(SimpleTestCase):
+    tag = Template(
+        "{% load component_tags %}{% html_attrs attrs href=href class=classes disabled=disabled"
+        ' defaults:type="button" defaults:aria-current=current %}'
+    )
+    renderer = AttrsRenderer(
+        {"href": DYNAMIC, "class": DYNAMIC, "disabled": DYNAMIC},
+        defaults={"type": "button", "aria-current": DYNAMIC},
+    )
+
+    def test_matches_html_attrs_tag(self):
+        for attrs, values in [
+            (None, {"href": "/", "class": "nav-link", "disabled": None, "current": None}),
+            ({}, {"href": "/?a=1&b=<2>", "class": "a  b a", "disabled": True, "current": "page"}),
+            ({"class": "extra", "href": "/x"}, {"href": "/", "class": "a", "disabled": False}),
+            ({"type": "submit", "data-id": 1}, {"href": None, "class": ["a", {"b": True}]}),
+        ]:
+            values = {"disabled": None, "current": None, **values}
+            with self.subTest(attrs=attrs, values=values):
+                self.assertEqual(
+                    self.renderer(
+                        attrs,
+                        {
+                            "href": values["href"],
+                            "class": values["class"],
+                            "disabled": values["disabled"],
+                            "aria-current": values["current"],
+                        },
+                    ),
+                    self.tag.render(
+                        Context({"attrs": attrs, "classes": values["class"], **values})
+                    ),
+                )
+
+    def test_static_attributes_are_rendered_once(self):
+        renderer = AttrsRenderer({"class": "card-header"}, defaults={"role": "note"})
+
+        self.assertEqual(renderer(), 'role="note" class="card-header"')
+        self.assertIs(renderer(None), renderer({}))
+        self.assertEqual(renderer({"class": "mt-2", "role": None}), 'class="mt-2 card-header"')
+
+    def test_overlapping_attributes(self):
+        with self.assertRaisesMessage(ValueError, "['class']"):
+            AttrsRenderer({"class": "a"}, defaults={"class": "b"})
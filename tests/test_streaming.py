@@ -0,0 +1,184 @@
+import re
+
+from django.http import StreamingHttpResponse
+from django.template import Context, Template
+from django.test import SimpleTestCase
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from django_components_bootstrap.components.bootstrap5 import (
+    Accordion,
+    DataTable,
+    ListGroup,
+    Row,
+    Table,
+)
+
+from .utils import normalize_html
+
+
+def render(template_code, context=None):
+    template = Template("{% load component_tags %}" + template_code)
+    return normalize_html(template.render(Context(context or {})))
+
+
+def strip_item_ids(html):
+    return re.sub(r"accordion-item-\w+-", "accordion-item-", html)
+
+
+class StreamingTests(SimpleTestCase):
+    maxDiff = None
+
+    def test_list_group(self):
+        chunks = list(
+            ListGroup.stream(
+                [format_html('<li class="list-group-item">{}</li>', i) for i in range(5)],
+                kwargs={"flush": True},
+                chunk_size=2,
+            )
+        )
+
+        self.assertEqual(len(chunks), 5)
+        self.assertHTMLEqual(
+            normalize_html("".join(chunks)),
+            render(
+                '{% component "ListGroup" flush=True %}'
+                '{% for i in items %}<li class="list-group-item">{{ i }}</li>{% endfor %}'
+                "{% endcomponent %}",
+                {"items": range(5)},
+            ),
+        )
+
+    def test_item_template(self):
+        item_template = (
+            '{% component "ListGroupItem" variant=variant %}{{ item }}{% endcomponent %}'
+        )
+        streamed = ListGroup.stream(["a", "<b>"], item_template, context={"variant": "info"})
+
+        self.assertHTMLEqual(
+            normalize_html("".join(streamed)),
+            render(
+                '{% component "ListGroup" %}{% for item in items %}'
+                + item_template
+                + "{% endfor %}{% endcomponent %}",
+                {"items": ["a", "<b>"], "variant": "info"},
+            ),
+        )
+
+    def test_unsafe_items_are_escaped(self):
+        streamed = ListGroup.stream(["<li>1</li>", mark_safe("<li>2</li>")])
+
+        self.assertIn("&lt;li&gt;1&lt;/li&gt;<li>2</li></ul>", normalize_html("".join(streamed)))
+
+    def test_compiled_item_template(self):
+        item_template = Template(
+            '{% load component_tags %}{% component "ListGroupItem" %}{{ item }}{% endcomponent %}'
+        )
+
+        # Rendered as compiled, not recompiled from its source
+        item_template.source = ""
+        streamed = "".join(ListGroup.stream(["a", "<b>"], item_template))
+
+        self.assertHTMLEqual(
+            normalize_html(streamed),
+            '<ul class="list-group"><li class="list-group-item">a</li>'
+            '<li class="list-group-item">&lt;b&gt;</li></ul>',
+        )
+
+    def test_row(self):
+        streamed = Row.stream(
+            [mark_safe('<div class="col">1</div>'), mark_safe('<div class="col">2</div>')],
+            kwargs={"cols": 2},
+        )
+
+        self.assertHTMLEqual(
+            normalize_html("".join(streamed)),
+            '<div class="row row-cols-2"><div class="col">1</div><div class="col">2</div></div>',
+        )
+
+    def test_table(self):
+        rows = map(
+            mark_safe, ["<tbody>", *(f"<tr><td>{i}</td></tr>" for i in range(3)), "</tbody>"]
+        )
+        streamed = Table.stream(rows, kwargs={"striped": True, "responsive": True})
+
+        self.assertHTMLEqual(
+            normalize_html("".join(streamed)),
+            '<div class="table-responsive"><table class="table table-striped"><tbody>'
+            "<tr><td>0</td></tr><tr><td>1</td></tr><tr><td>2</td></tr></tbody></table></div>",
+        )
+
+    def test_accordion_items_inject_parent(self):
+        item_template = (
+            '{% component "AccordionItem" %}'
+            '{% component "AccordionHeader" %}{{ item }}{% endcomponent %}'
+            '{% component "AccordionBody" %}Body {{ item }}{% endcomponent %}'
+            "{% endcomponent %}"
+        )
+        streamed = "".join(
+            Accordion.stream(["One", "Two"], item_template, kwargs={"attrs": {"id": "results"}})
+        )
+        expected = render(
+            '{% component "Accordion" attrs:id="results" %}{% for item in items %}'
+            + item_template
+            + "{% endfor %}{% endcomponent %}",
+            {"items": ["One", "Two"]},
+        )
+
+        self.assertEqual(streamed.count('data-bs-parent="#results"'), 2)
+        self.assertHTMLEqual(strip_item_ids(normalize_html(streamed)), strip_item_ids(expected))
+
+    def test_data_table(self):
+        rows = [{"n": i} for i in range(5)]
+
+        chunks = list(
+            DataTable.stream(rows, kwargs={"columns": ["n"], "hover": True}, chunk_size=3)
+        )
+
+        self.assertEqual(len(chunks), 4)
+        self.assertHTMLEqual(
+            normalize_html("".join(chunks)),
+            render(
+                '{% component "DataTable" columns=columns rows=rows hover=True / %}',
+                {"columns": ["n"], "rows": rows},
+            ),
+        )
+
+    def test_data_table_item_template(self):
+        streamed = DataTable.stream(
+            ["a", "<b>"],
+            "<tr><td>{{ item }}</td></tr>",
+            kwargs={"columns": ["letter"], "attrs": {"data-empty": "<tbody></tbody>"}},
+        )
+
+        self.assertHTMLEqual(
+            normalize_html("".join(streamed)),
+            '<table data-empty="&lt;tbody&gt;&lt;/tbody&gt;" class="table">'
+            '<thead><tr><th scope="col">letter</th></tr></thead>'
+            "<tbody><tr><td>a</td></tr><tr><td>&lt;b&gt;</td></tr></tbody></table>",
+        )
+
+    def test_items_are_consumed_lazily(self):
+        consumed = []
+
+        def items():
+            for i in range(3):
+                consumed.append(i)
+                yield format_html("<li>{}</li>", i)
+
+        stream = ListGroup.stream(items(), chunk_size=1)
+
+        self.assertIn("<ul", next(stream))
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(stream), "<li>0</li>")
+        self.assertEqual(consumed, [0])
+
+    def test_streaming_http_response(self):
+        response = StreamingHttpResponse(
+            ListGroup.stream([mark_safe("<li>1</li>"), mark_safe("<li>2</li>")])
+        )
+
+        content = b"".join(response.streaming_content).decode()
+        self.assertHTMLEqual(
+            normalize_html(content), '<ul class="list-group"><li>1</li><li>2</li></ul>'
+        )
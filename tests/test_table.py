@@ -1,5 +1,8 @@
+from types import SimpleNamespace
+
+from django.contrib.auth.models import Group
 from django.template import Context, Template
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
 
 from .utils import normalize_html
 
@@ -1682,3 +1685,128 @@ class TableTests(SimpleTestCase):
         """
 
         self.assertHTMLEqual(normalize_html(expected), rendered)
+
+
+DATA_TABLE = Template(
+    '{% load component_tags %}{% component "DataTable" columns=columns rows=rows %}'
+    "{% endcomponent %}"
+)
+
+
+class DataTableTests(SimpleTestCase):
+    maxDiff = None
+
+    def render(self, columns, rows):
+        return normalize_html(DATA_TABLE.render(Context({"columns": columns, "rows": rows})))
+
+    def test_dict_rows(self):
+        rendered = self.render(
+            ["first", ("last", "Last name")],
+            [{"first": "Mark", "last": "Otto"}, {"first": "Jacob", "last": None}],
+        )
+
+        expected = """
+            <table class="table">
+              <thead><tr><th scope="col">first</th><th scope="col">Last name</th></tr></thead>
+              <tbody>
+                <tr><td>Mark</td><td>Otto</td></tr>
+                <tr><td>Jacob</td><td></td></tr>
+              </tbody>
+            </table>
+        """
+        self.assertHTMLEqual(normalize_html(expected), rendered)
+
+    def test_tuple_and_object_rows(self):
+        expected = """
+            <table class="table">
+              <thead><tr><th scope="col">#</th><th scope="col">Name</th></tr></thead>
+              <tbody><tr><td>1</td><td>Mark</td></tr><tr><td>2</td><td>Jacob</td></tr></tbody>
+            </table>
+        """
+        columns = [("id", "#"), ("name", "Name")]
+
+        tuples = self.render(columns, [(1, "Mark"), [2, "Jacob"]])
+        objects = self.render(
+            columns, [SimpleNamespace(id=1, name="Mark"), SimpleNamespace(id=2, name="Jacob")]
+        )
+
+        self.assertHTMLEqual(normalize_html(expected), tuples)
+        self.assertHTMLEqual(normalize_html(expected), objects)
+
+    def test_single_column_from_generator(self):
+        rendered = self.render(["n"], ({"n": i} for i in range(3)))
+
+        self.assertIn(
+            "<tbody><tr><td>0</td></tr><tr><td>1</td></tr><tr><td>2</td></tr></tbody>", rendered
+        )
+
+    def test_values_are_escaped(self):
+        rendered = self.render([("name", "<b>Name</b>")], [{"name": "<script>"}])
+
+        self.assertIn('<th scope="col">&lt;b&gt;Name&lt;/b&gt;</th>', rendered)
+        self.assertIn("<td>&lt;script&gt;</td>", rendered)
+
+    def test_empty_rows(self):
+        rendered = self.render(["name"], [])
+
+        self.assertIn("<tbody></tbody>", rendered)
+
+    def test_table_options_and_caption(self):
+        template = Template(
+            '{% load component_tags %}{% component "DataTable" columns=columns rows=rows '
+            'striped=True small=True responsive="md" attrs:id="users" %}'
+            "<caption>Users</caption>{% endcomponent %}"
+        )
+        rendered = normalize_html(template.render(Context({"columns": ["a"], "rows": [["x"]]})))
+
+        expected = """
+            <div class="table-responsive-md">
+              <table id="users" class="table table-striped table-sm">
+                <caption>Users</caption>
+                <thead><tr><th scope="col">a</th></tr></thead>
+                <tbody><tr><td>x</td></tr></tbody>
+              </table>
+            </div>
+        """
+        self.assertHTMLEqual(normalize_html(expected), rendered)
+
+
+class DataTableQuerySetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Group.objects.bulk_create([Group(name=f"group {i}") for i in range(5)])
+
+    def test_model_rows_use_iterator(self):
+        queryset = Group.objects.order_by("name")
+
+        with self.assertNumQueries(1):
+            rendered = normalize_html(
+                DATA_TABLE.render(Context({"columns": ["name"], "rows": queryset}))
+            )
+
+        self.assertEqual(rendered.count("<tr><td>group"), 5)
+        # The rows were not cached on the queryset
+        with self.assertNumQueries(1):
+            list(queryset)
+
+    def test_values_list_rows(self):
+        queryset = Group.objects.order_by("-name").values_list("id", "name")
+
+        rendered = normalize_html(
+            DATA_TABLE.render(Context({"columns": ["id", "name"], "rows": queryset}))
+        )
+
+        self.assertIn("<td>group 4</td></tr><tr><td>", rendered)
+
+    def test_evaluated_queryset_without_chunk_size(self):
+        queryset = Group.objects.order_by("name")
+        list(queryset)
+        template = Template(
+            "{% load component_tags %}"
+            '{% component "DataTable" columns=columns rows=rows chunk_size=0 / %}'
+        )
+
+        with self.assertNumQueries(0):
+            rendered = template.render(Context({"columns": ["name"], "rows": queryset}))
+
+        self.assertEqual(rendered.count("<tr><td>group"), 5)
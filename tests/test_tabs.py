@@ -1,7 +1,13 @@
+import re
+
 from django.template import Context, Template
 from django.test import SimpleTestCase
+from django.utils.safestring import mark_safe
 from django_components.testing import djc_test
 
+from django_components_bootstrap.components.bootstrap5 import Tabs
+from django_components_bootstrap.components.bootstrap5.tabs import TabData
+
 from .utils import mock_component_id, normalize_html
 
 
@@ -316,3 +322,116 @@ class TestTabs(SimpleTestCase):
         """
 
         self.assertHTMLEqual(normalize_html(rendered), normalize_html(expected))
+
+    @djc_test
+    def test_title_and_attrs_are_escaped(self):
+        with mock_component_id():
+            rendered = Template(
+                '{% load component_tags %}{% component "Tabs" attrs:data-x="a&b" %}'
+                '{% component "Tab" title=title tab_id="home" %}<i>x</i>{% endcomponent %}'
+                "{% endcomponent %}"
+            ).render(Context({"title": "<b>Home</b>"}))
+
+        expected = """
+            <div data-x="a&amp;b">
+              <ul class="nav nav-tabs" id="tabs-ctest01" role="tablist">
+                <li class="nav-item" role="presentation">
+                  <button class="nav-link active" id="tabs-ctest01-tab-home" data-bs-toggle="tab" data-bs-target="#tabs-ctest01-pane-home" type="button" role="tab" aria-controls="tabs-ctest01-pane-home" aria-selected="true">&lt;b&gt;Home&lt;/b&gt;</button>
+                </li>
+              </ul>
+              <div class="tab-content">
+                <div class="tab-pane fade show active" id="tabs-ctest01-pane-home" role="tabpanel" aria-labelledby="tabs-ctest01-tab-home" tabindex="0"><i>x</i></div>
+              </div>
+            </div>
+        """
+
+        self.assertHTMLEqual(normalize_html(rendered), normalize_html(expected))
+
+    @djc_test
+    def test_matches_nav_components(self):
+        with mock_component_id():
+            rendered = Template(
+                '{% load component_tags %}{% component "Tabs" %}'
+                '{% component "Tab" title="Home" %}Home content{% endcomponent %}'
+                '{% component "Tab" title="Profile" disabled=True %}Profile content{% endcomponent %}'
+                "{% endcomponent %}"
+            ).render(Context())
+
+        tab_data = [
+            TabData.create("tabs-ctest01", "Home", "Home content", active=True),
+            TabData.create("tabs-ctest01", "Profile", "Profile content", disabled=True),
+        ]
+        # The markup of the nav and tab components that `Tabs` renders in a single pass
+        generated = Template("""
+            {% load component_tags %}
+            <div>
+                {% component "Nav" variant="tabs" as_="ul" attrs:id="tabs-ctest01" attrs:role="tablist" %}
+                    {% for tab in tab_data %}
+                        {% component "NavItem" as_="li" attrs:role="presentation" %}
+                            {% component "NavLink" as_="button" active=tab.is_active disabled=tab.disabled attrs:id=tab.nav_tab_id attrs:data-bs-toggle="tab" attrs:data-bs-target="#{{ tab.pane_id }}" attrs:role="tab" attrs:aria-controls=tab.pane_id attrs:aria-selected=tab.aria_selected %}
+                                {{ tab.title }}
+                            {% endcomponent %}
+                        {% endcomponent %}
+                    {% endfor %}
+                {% endcomponent %}
+                {% component "TabContent" %}
+                    {% for tab in tab_data %}
+                        {% component "TabPane" active=tab.is_active attrs:id=tab.pane_id attrs:aria-labelledby=tab.nav_tab_id %}
+                            {{ tab.content }}
+                        {% endcomponent %}
+                    {% endfor %}
+                {% endcomponent %}
+            </div>
+        """).render(Context({"tab_data": tab_data}))
+
+        self.assertEqual(tab_data[1].pane_id, "tabs-ctest01-pane-profile")
+        self.assertEqual([tab.aria_selected for tab in tab_data], ["true", "false"])
+        self.assertHTMLEqual(normalize_html(generated), normalize_html(rendered))
+
+    @djc_test
+    def test_items_match_tab_children(self):
+        template = Template(
+            '{% load component_tags %}{% component "Tabs" variant="pills" %}'
+            '{% component "Tab" title="Home" %}<p>Home</p>{% endcomponent %}'
+            '{% component "Tab" title=title tab_id="me" active=True %}'
+            "Me &amp; you{% endcomponent %}"
+            '{% component "Tab" title="Contact" disabled=True %}Contact{% endcomponent %}'
+            "{% endcomponent %}"
+        )
+        items = [
+            {"title": "Home", "content": mark_safe("<p>Home</p>")},
+            {"title": "<Profile>", "content": "Me & you", "tab_id": "me", "active": True},
+            {"title": "Contact", "content": "Contact", "disabled": True},
+        ]
+
+        with mock_component_id():
+            rendered = template.render(Context({"title": "<Profile>"}))
+        with mock_component_id():
+            generated = Tabs.render(kwargs={"variant": "pills", "items": items})
+
+        self.assertHTMLEqual(normalize_html(generated), normalize_html(rendered))
+
+    @djc_test
+    def test_items_before_tab_children(self):
+        with mock_component_id():
+            rendered = Template(
+                '{% load component_tags %}{% component "Tabs" items=items %}'
+                '{% component "Tab" title="Second" %}2{% endcomponent %}{% endcomponent %}'
+            ).render(Context({"items": [{"title": "First", "content": "1"}]}))
+
+        self.assertEqual(
+            re.findall(r'aria-controls="([^"]+)"', rendered),
+            ["tabs-ctest01-pane-first", "tabs-ctest01-pane-second"],
+        )
+        self.assertIn('aria-controls="tabs-ctest01-pane-first" aria-selected="true"', rendered)
+
+    @djc_test
+    def test_child_errors_are_raised(self):
+        template = Template(
+            '{% load component_tags %}{% component "Tabs" %}{% component "Tab" title="Home" %}'
+            '{% component "Badge" unknown=True %}x{% endcomponent %}'
+            "{% endcomponent %}{% endcomponent %}"
+        )
+
+        with self.assertRaisesMessage(TypeError, "unexpected keyword argument 'unknown'"):
+            template.render(Context())
@@ -0,0 +1,75 @@
+from io import StringIO
+from unittest import mock
+
+from django.apps import apps
+from django.core.management import CommandError, call_command
+from django.template import Library
+from django.test import SimpleTestCase, override_settings
+from django_components import ComponentRegistry
+
+from django_components_bootstrap.components import bootstrap5
+from django_components_bootstrap.registry import is_loaded, register_lazy
+from django_components_bootstrap.warmup import warmup_components
+
+
+class WarmupTests(SimpleTestCase):
+    def test_compiles_registered_components(self):
+        registry = ComponentRegistry(library=Library())
+        register_lazy(registry, "Alert")
+        register_lazy(registry, "CloseButton")
+        try:
+            timings = warmup_components(["Alert", "CloseButton", "Badge"], registry=registry)
+        finally:
+            registry.clear()
+
+        self.assertEqual([t.name for t in timings], ["Alert", "CloseButton"])
+        self.assertTrue(all(t.load_ms >= 0 and t.compile_ms >= 0 for t in timings))
+        self.assertIsNotNone(bootstrap5.Alert._component_media._template)
+
+    def test_resolves_lazy_entries(self):
+        registry = ComponentRegistry(library=Library())
+        register_lazy(registry, "Spinner")
+        try:
+            warmup_components(["Spinner"], registry=registry)
+            self.assertTrue(is_loaded(registry, "Spinner"))
+        finally:
+            registry.clear()
+
+    def test_freeze(self):
+        with mock.patch("gc.freeze") as freeze:
+            warmup_components(["Badge"], freeze=True)
+        freeze.assert_called_once_with()
+
+    @override_settings(
+        DJANGO_COMPONENTS_BOOTSTRAP={"AUTO_REGISTER": False, "WARMUP_ON_READY": "preload"}
+    )
+    def test_warmup_on_ready(self):
+        config = apps.get_app_config("django_components_bootstrap")
+        with mock.patch("django_components_bootstrap.warmup.warmup_components") as warmup:
+            config.ready()
+        warmup.assert_called_once_with(freeze=True)
+
+    def test_not_warmed_up_on_ready_by_default(self):
+        config = apps.get_app_config("django_components_bootstrap")
+        with (
+            override_settings(DJANGO_COMPONENTS_BOOTSTRAP={"AUTO_REGISTER": False}),
+            mock.patch("django_components_bootstrap.warmup.warmup_components") as warmup,
+        ):
+            config.ready()
+        warmup.assert_not_called()
+
+
+class WarmupCommandTests(SimpleTestCase):
+    def test_reports_timings(self):
+        out = StringIO()
+        call_command("bootstrap_components_warmup", "Alert", "--sort", "name", stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertRegex(lines[0], r"^Component\s+load ms\s+compile ms$")
+        self.assertRegex(lines[1], r"^Alert\s+\d+\.\d\d\s+\d+\.\d\d$")
+        self.assertRegex(lines[2], r"^CloseButton\s+\d+\.\d\d\s+\d+\.\d\d$")
+        self.assertRegex(lines[3], r"^Warmed up 2 components in \d+\.\d\dms\.$")
+
+    def test_unknown_component(self):
+        with self.assertRaisesMessage(CommandError, "Unknown bootstrap components: Foo"):
+            call_command("bootstrap_components_warmup", "Foo", stdout=StringIO())
@@ -1,3 +1,8 @@
 """URL configuration for tests."""
 
-urlpatterns = []
+from django.urls import include, path
+
+urlpatterns = [
+    path("", include("django_components.urls")),
+    path("bootstrap/", include("django_components_bootstrap.urls")),
+]